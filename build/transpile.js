@@ -35,6 +35,7 @@ class Transpiler {
         return [
 
             [ /\.deepExtend\s/g, '.deep_extend'],
+            [ /\.deepExtendShared\s/g, '.deep_extend_shared'],
             [ /\.safeFloat2\s/g, '.safe_float_2'],
             [ /\.safeInteger2\s/g, '.safe_integer_2'],
             [ /\.safeIntegerProduct2\s/g, '.safe_integer_product_2'],
@@ -172,6 +173,8 @@ class Transpiler {
             [ /\.fetchStatus\s/g, '.fetch_status'],
             [ /\.numberToString\s/g, '.number_to_string' ],
             [ /\.decimalToPrecision\s/g, '.decimal_to_precision'],
+            [ /\.decimalToMarketPrecision\s/g, '.decimal_to_market_precision'],
+            [ /\.compilePrecisionFormatters\s/g, '.compile_precision_formatters'],
             [ /\.priceToPrecision\s/g, '.price_to_precision'],
             [ /\.amountToPrecision\s/g, '.amount_to_precision'],
             [ /\.amountToLots\s/g, '.amount_to_lots'],
@@ -216,10 +219,21 @@ class Transpiler {
             [ /\.safeCurrency\s/g, '.safe_currency'],
             [ /\.safeSymbol\s/g, '.safe_symbol'],
             [ /\.safeMarket\s/g, '.safe_market'],
+            [ /\.hasHigherCurrencyPrecision\s/g, '.has_higher_currency_precision'],
+            [ /\.previousMarketValues\s/g, '.previous_market_values'],
+            [ /\.unchangedMarket\s/g, '.unchanged_market'],
+            [ /\.setMarketsChanges\s/g, '.set_markets_changes'],
             [ /\.safeOrder\s/g, '.safe_order'],
             [ /\.safeTicker\s/g, '.safe_ticker'],
             [ /\.roundTimeframe\s/g, '.round_timeframe'],
             [ /\.calculateRateLimiterCost\s/g, '.calculate_rate_limiter_cost' ],
+            [ /\.calculateRateLimiterPriority\s/g, '.calculate_rate_limiter_priority' ],
+            [ /\.throttleApi\s/g, '.throttle_api' ],
+            [ /\.isPublicRequest\s/g, '.is_public_request' ],
+            [ /\.coalesceRequest\s/g, '.coalesce_request' ],
+            [ /\.sendRequest\s/g, '.send_request' ],
+            [ /\.fetchRequest\s/g, '.fetch_request' ],
+            [ /\.parseStreamed\s/g, '.parse_streamed' ],
             [ /\.findBroadlyMatchedKey\s/g, '.find_broadly_matched_key' ],
             [ /\.throwBroadlyMatchedException\s/g, '.throw_broadly_matched_exception' ],
             [ /\.throwExactlyMatchedException\s/g, '.throw_exactly_matched_exception' ],
@@ -296,6 +310,9 @@ class Transpiler {
             [ /assert\s*\((.+)\);/g, 'assert $1'],
             [ /Promise\.all\s*\(([^\)]+)\)/g, 'asyncio.gather(*$1)' ],
             [ /Precise\.stringAdd\s/g, 'Precise.string_add' ],
+            [ /Precise\.stringMulAdd\s/g, 'Precise.string_mul_add' ],
+            [ /Precise\.stringMulMul\s/g, 'Precise.string_mul_mul' ],
+            [ /Precise\.stringMulDiv\s/g, 'Precise.string_mul_div' ],
             [ /Precise\.stringMul\s/g, 'Precise.string_mul' ],
             [ /Precise\.stringDiv\s/g, 'Precise.string_div' ],
             [ /Precise\.stringSub\s/g, 'Precise.string_sub' ],
@@ -414,8 +431,34 @@ class Transpiler {
         ])
     }
 
+    submitPythonCalls (items) {
+        // splits a python list literal at the top-level commas and wraps the method calls into self.submit()
+        const elements = []
+        let depth = 0
+        let start = 0
+        for (let i = 0; i < items.length; i++) {
+            const character = items[i]
+            if ('([{'.includes (character)) {
+                depth++
+            } else if (')]}'.includes (character)) {
+                depth--
+            } else if ((character === ',') && (depth === 0)) {
+                elements.push (items.slice (start, i))
+                start = i + 1
+            }
+        }
+        elements.push (items.slice (start))
+        return elements.map (element => element.replace (/^(\s*)(self\.\w+|getattr\(self, \w+\))\(([\s\S]*)\)(\s*)$/, (match, before, method, args, after) => {
+            return before + 'self.submit(' + method + (args.length ? ', ' + args : '') + ')' + after
+        })).join (',')
+    }
+
     getPython2Regexes () {
         return [
+            // the calls gathered in async run concurrently in the thread pool of the sync exchange
+            [ /promises\.append\((self\.\w+|getattr\(self, \w+\))\(([\s\S]*?)\)\)\n/g, 'promises.append(self.submit($1, $2))\n' ],
+            [ /promises = \[([\s\S]*?)\]\n/g, (list, items) => 'promises = [' + this.submitPythonCalls (items) + ']\n' ],
+            [ /(\w+) = await asyncio\.gather\(\*(\w+)\)/g, '$1 = self.gather($2)' ],
             [ /.+asyncio\.gather.+\n/g, '' ], // remove line entirely
             [ /(\s)await(\s)/g, '$1' ]
         ]
@@ -513,6 +556,9 @@ class Transpiler {
             [ /Number\.MAX_SAFE_INTEGER/g, 'PHP_INT_MAX' ],
             [ /Precise\.stringAdd\s/g, 'Precise::string_add' ],
             [ /Precise\.stringDiv\s/g, 'Precise::string_div' ],
+            [ /Precise\.stringMulAdd\s/g, 'Precise::string_mul_add' ],
+            [ /Precise\.stringMulMul\s/g, 'Precise::string_mul_mul' ],
+            [ /Precise\.stringMulDiv\s/g, 'Precise::string_mul_div' ],
             [ /Precise\.stringMul\s/g, 'Precise::string_mul' ],
             [ /Precise\.stringSub\s/g, 'Precise::string_sub' ],
             [ /Precise\.stringAbs\s/g, 'Precise::string_abs' ],
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+# 200 async exchange instances in one event loop, each sending 10 requests to a local https server:
+#   - a session and connector per instance, the former behaviour
+#   - aiohttp_shared_session, the instances share one pool of aiohttp_limit connections
+# it counts the tls handshakes (the connections accepted by the server), the sockets left open
+# once the requests are done, and the latency percentiles of the requests
+
+import asyncio
+import datetime
+import os
+import ssl
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt.async_support as ccxt  # noqa: E402
+from cryptography import x509  # noqa: E402
+from cryptography.hazmat.primitives import hashes, serialization  # noqa: E402
+from cryptography.hazmat.primitives.asymmetric import ec  # noqa: E402
+from cryptography.x509.oid import NameOID  # noqa: E402
+
+instances = 200
+requests_per_instance = 10
+
+
+def self_signed_certificate(directory):
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, 'localhost')])
+    now = datetime.datetime.utcnow()
+    certificate = x509.CertificateBuilder().subject_name(name).issuer_name(name).public_key(key.public_key()).serial_number(1) \
+        .not_valid_before(now).not_valid_after(now + datetime.timedelta(days=1)) \
+        .add_extension(x509.SubjectAlternativeName([x509.DNSName('localhost')]), critical=False).sign(key, hashes.SHA256())
+    certificate_file = os.path.join(directory, 'certificate.pem')
+    key_file = os.path.join(directory, 'key.pem')
+    with open(certificate_file, 'wb') as f:
+        f.write(certificate.public_bytes(serialization.Encoding.PEM))
+    with open(key_file, 'wb') as f:
+        f.write(key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()))
+    return certificate_file, key_file
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        body = b'{"result":"ok"}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+    connections = 0
+
+    def get_request(self):
+        connection, address = super(Server, self).get_request()
+        Server.connections += 1
+        return connection, address
+
+
+directory = tempfile.mkdtemp()
+certificate_file, key_file = self_signed_certificate(directory)
+context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+context.load_cert_chain(certificate_file, key_file)
+server = Server(('127.0.0.1', 0), Handler)
+# the handshakes are made by the threads of the connections instead of the accepting one
+server.socket = context.wrap_socket(server.socket, server_side=True, do_handshake_on_connect=False)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+url = 'https://localhost:' + str(server.server_address[1]) + '/'
+
+
+def open_sockets(exchanges):
+    connectors = {id(exchange.session.connector): exchange.session.connector for exchange in exchanges}
+    return sum(len(connections) for connector in connectors.values() for connections in connector._conns.values())
+
+
+async def run(shared):
+    Server.connections = 0
+    ccxt.Exchange.ssl_contexts.clear()  # measure the loading of the certificates too
+    start = time.perf_counter()
+    exchanges = [ccxt.Exchange({'cafile': certificate_file, 'enableRateLimit': False, 'aiohttp_shared_session': shared}) for i in range(instances)]
+    latencies = []
+
+    async def worker(exchange):
+        for i in range(requests_per_instance):
+            started = time.perf_counter()
+            await exchange.fetch(url)
+            latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*[worker(exchange) for exchange in exchanges])
+    wall = time.perf_counter() - start
+    sockets = open_sockets(exchanges)
+    await asyncio.gather(*[exchange.close() for exchange in exchanges])
+    latencies.sort()
+    p50 = statistics.median(latencies)
+    p99 = latencies[int(len(latencies) * 0.99)]
+    return wall, Server.connections, sockets, p50, p99
+
+
+print('{} instances, {} requests each'.format(instances, requests_per_instance))
+for name, shared in [('a session per instance', False), ('aiohttp_shared_session', True)]:
+    wall, handshakes, sockets, p50, p99 = asyncio.run(run(shared))
+    print('    {:<24} wall {:>7.1f} ms   {:>4} handshakes   {:>4} open sockets   p50 {:>6.2f} ms   p99 {:>7.2f} ms'.format(
+        name, wall * 1000, handshakes, sockets, p50 * 1000, p99 * 1000))
+server.shutdown()
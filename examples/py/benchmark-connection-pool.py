@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+
+# measures the latency of the synchronous exchanges against a local https server
+# and counts the tls handshakes, that is the new connections accepted by the server:
+#   - a single thread
+#   - 16 threads sharing one instance, with the former pool of 10 connections and with the default pool
+#   - 8 short-lived instances, each with its own session or with requests_shared_session
+
+import datetime
+import logging
+import os
+import ssl
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt  # noqa: E402
+import urllib3  # noqa: E402
+from cryptography import x509  # noqa: E402
+from cryptography.hazmat.primitives import hashes, serialization  # noqa: E402
+from cryptography.hazmat.primitives.asymmetric import ec  # noqa: E402
+from cryptography.x509.oid import NameOID  # noqa: E402
+
+urllib3.disable_warnings()
+
+
+class DiscardedConnections(logging.Handler):
+    # counts "Connection pool is full, discarding connection" instead of printing it
+    count = 0
+
+    def emit(self, record):
+        DiscardedConnections.count += 1
+
+
+logging.getLogger('urllib3').addHandler(DiscardedConnections())
+logging.getLogger('urllib3').propagate = False
+
+requests_per_thread = 50
+
+
+def self_signed_certificate(directory):
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, '127.0.0.1')])
+    now = datetime.datetime.utcnow()
+    certificate = x509.CertificateBuilder().subject_name(name).issuer_name(name).public_key(key.public_key()).serial_number(1) \
+        .not_valid_before(now).not_valid_after(now + datetime.timedelta(days=1)).sign(key, hashes.SHA256())
+    certificate_file = os.path.join(directory, 'certificate.pem')
+    key_file = os.path.join(directory, 'key.pem')
+    with open(certificate_file, 'wb') as f:
+        f.write(certificate.public_bytes(serialization.Encoding.PEM))
+    with open(key_file, 'wb') as f:
+        f.write(key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()))
+    return certificate_file, key_file
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        body = b'{"result":"ok"}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class Server(ThreadingHTTPServer):
+    daemon_threads = True
+    connections = 0
+
+    def get_request(self):
+        connection, address = super(Server, self).get_request()
+        Server.connections += 1
+        return connection, address
+
+
+directory = tempfile.mkdtemp()
+context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+context.load_cert_chain(*self_signed_certificate(directory))
+server = Server(('127.0.0.1', 0), Handler)
+# the handshakes are made by the threads of the connections instead of the accepting one
+server.socket = context.wrap_socket(server.socket, server_side=True, do_handshake_on_connect=False)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+url = 'https://127.0.0.1:' + str(server.server_address[1]) + '/'
+
+
+def run(exchanges, threads):
+    latencies = []
+
+    def worker(exchange):
+        for i in range(requests_per_thread):
+            start = time.perf_counter()
+            exchange.fetch(url)
+            latencies.append(time.perf_counter() - start)
+
+    Server.connections = 0
+    DiscardedConnections.count = 0
+    workers = [threading.Thread(target=worker, args=(exchanges[i % len(exchanges)],)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return statistics.median(latencies) * 1000, max(latencies) * 1000, Server.connections, DiscardedConnections.count
+
+
+def report(name, result):
+    median, maximum, handshakes, discarded = result
+    print('    {:<40} median {:>6.2f} ms   max {:>7.2f} ms   {:>5} handshakes {:>5} discarded'.format(name, median, maximum, handshakes, discarded))
+
+
+config = {'verify': False, 'enableRateLimit': False}
+print('1 thread, {} requests'.format(requests_per_thread))
+report('new connection per request', run([ccxt.Exchange(dict(config, headers={'Connection': 'close'}))], 1))
+report('pooled', run([ccxt.Exchange(config)], 1))
+print('16 threads on one instance, {} requests'.format(16 * requests_per_thread))
+report('requests_pool_maxsize=10 (former)', run([ccxt.Exchange(dict(config, requests_pool_maxsize=10))], 16))
+report('default pool (thread_pool_size=16)', run([ccxt.Exchange(dict(config, thread_pool_size=16))], 16))
+
+
+def short_lived(shared):
+    Server.connections = 0
+    DiscardedConnections.count = 0
+    latencies = []
+    for i in range(8):
+        exchange = ccxt.Exchange(dict(config, requests_shared_session=shared))
+        for j in range(5):
+            start = time.perf_counter()
+            exchange.fetch(url)
+            latencies.append(time.perf_counter() - start)
+        del exchange
+    return statistics.median(latencies) * 1000, max(latencies) * 1000, Server.connections, DiscardedConnections.count
+
+
+print('8 instances, 5 requests each')
+report('a session per instance', short_lived(False))
+report('requests_shared_session', short_lived(True))
+server.shutdown()
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+
+# measures the time it takes to instantiate exchanges
+# describe() and the implicit api methods are computed once per exchange class,
+# so the first instance pays for them and the following instances are cheaper
+
+import os
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt  # noqa: E402
+
+instances = 100
+exchange_ids = ['binance', 'okx', 'bybit']
+
+for exchange_id in exchange_ids:
+    exchange_class = getattr(ccxt, exchange_id)
+    config = {
+        'apiKey': 'key',
+        'secret': 'secret',
+    }
+    start = time.perf_counter()
+    exchange_class(config)
+    first = time.perf_counter() - start
+    start = time.perf_counter()
+    for i in range(0, instances):
+        exchange_class(config)
+    average = (time.perf_counter() - start) / instances
+    print('{:<10} first instance {:>8.2f} ms, next {} instances {:>8.2f} ms each'.format(exchange_id, first * 1000, instances, average * 1000))
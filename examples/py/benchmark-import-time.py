@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+# measures the cold start time of `import ccxt`, `import ccxt.async_support` and `import ccxt.pro`
+# exchange classes are loaded lazily, so this compares:
+#   - import only
+#   - import and access a single exchange class
+#   - import and access every exchange class (equivalent to the former eager imports)
+
+import os
+import subprocess
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+python = root + '/python'
+
+runs = 5
+
+snippet = '''
+import sys
+import time
+sys.path.insert(0, {path!r})
+start = time.perf_counter()
+import {package} as package
+{access}
+print(time.perf_counter() - start, len(sys.modules))
+'''
+
+scenarios = [
+    ('import only', ''),
+    ('import + binance', 'package.binance'),
+    ('import + all exchanges', '[getattr(package, id) for id in package.exchanges]'),
+]
+
+
+def measure(package, access):
+    timings = []
+    modules = 0
+    for i in range(0, runs):
+        code = snippet.format(path=python, package=package, access=access)
+        # every run is a fresh interpreter, otherwise the modules are already cached
+        output = subprocess.check_output([sys.executable, '-c', code], env=dict(os.environ, PYTHONDONTWRITEBYTECODE='1'))
+        seconds, modules = output.decode().split()
+        timings.append(float(seconds))
+    return min(timings), int(modules)
+
+
+for package in ['ccxt', 'ccxt.async_support', 'ccxt.pro']:
+    print(package)
+    for name, access in scenarios:
+        seconds, modules = measure(package, access)
+        print('    {:<24} {:>8.1f} ms {:>6} modules'.format(name, seconds * 1000, modules))
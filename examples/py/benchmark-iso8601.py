@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+# measures iso8601() and parse8601() on a million timestamps against the former implementations, kept below:
+#   - the timestamps of a stream of messages, a few milliseconds apart, as the websocket exchanges format them
+#   - random timestamps over the years, that miss the cache of the seconds
+#   - the strings of the stream in the shapes that the exchanges send, with and without the milliseconds, and with an offset
+# the count of timestamps is the first argument, a million by default
+
+import calendar
+import datetime
+import gc
+import os
+import random
+import re
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt  # noqa: E402
+
+
+def former_iso8601(timestamp=None):
+    if timestamp is None:
+        return timestamp
+    if not isinstance(timestamp, int):
+        return None
+    if int(timestamp) < 0:
+        return None
+    try:
+        utc = datetime.datetime.utcfromtimestamp(timestamp // 1000)
+        return utc.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-6] + "{:03d}".format(int(timestamp) % 1000) + 'Z'
+    except (TypeError, OverflowError, OSError):
+        return None
+
+
+def former_parse8601(timestamp=None):
+    if timestamp is None:
+        return timestamp
+    yyyy = '([0-9]{4})-?'
+    mm = '([0-9]{2})-?'
+    dd = '([0-9]{2})(?:T|[\\s])?'
+    h = '([0-9]{2}):?'
+    m = '([0-9]{2}):?'
+    s = '([0-9]{2})'
+    ms = '(\\.[0-9]{1,3})?'
+    tz = '(?:(\\+|\\-)([0-9]{2})\\:?([0-9]{2})|Z)?'
+    regex = r'' + yyyy + mm + dd + h + m + s + ms + tz
+    try:
+        match = re.search(regex, timestamp, re.IGNORECASE)
+        if match is None:
+            return None
+        yyyy, mm, dd, h, m, s, ms, sign, hours, minutes = match.groups()
+        ms = ms or '.000'
+        ms = (ms + '00')[0:4]
+        msint = int(ms[1:])
+        sign = sign or ''
+        sign = int(sign + '1') * -1
+        hours = int(hours or 0) * sign
+        minutes = int(minutes or 0) * sign
+        offset = datetime.timedelta(hours=hours, minutes=minutes)
+        string = yyyy + mm + dd + h + m + s + ms + 'Z'
+        dt = datetime.datetime.strptime(string, "%Y%m%d%H%M%S.%fZ")
+        dt = dt + offset
+        return calendar.timegm(dt.utctimetuple()) * 1000 + msint
+    except (TypeError, OverflowError, OSError, ValueError):
+        return None
+
+
+def measure(former, current, values):
+    # the best of 2 rounds of each, in seconds, the rounds alternate and run without the garbage collector
+    results = [None, None]
+    gc.collect()
+    gc.disable()
+    try:
+        for j in range(2):
+            for i, function in enumerate([former, current]):
+                start = time.perf_counter()
+                for value in values:
+                    function(value)
+                elapsed = time.perf_counter() - start
+                results[i] = elapsed if results[i] is None else min(results[i], elapsed)
+    finally:
+        gc.enable()
+    return results
+
+
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+random.seed(1)
+stream = []
+timestamp = 1670000000000
+for i in range(count):
+    timestamp += random.randint(0, 5)
+    stream.append(timestamp)
+years = [random.randint(0, 4102444800000) for i in range(count)]
+strings = [former_iso8601(timestamp) for timestamp in stream]
+
+cases = [
+    ('iso8601(), a stream', former_iso8601, ccxt.Exchange.iso8601, stream),
+    ('iso8601(), random', former_iso8601, ccxt.Exchange.iso8601, years),
+    ('parse8601(), YYYY-MM-DDTHH:MM:SS.sssZ', former_parse8601, ccxt.Exchange.parse8601, strings),
+    ('parse8601(), YYYY-MM-DDTHH:MM:SSZ', former_parse8601, ccxt.Exchange.parse8601, [string[:19] + 'Z' for string in strings]),
+    ('parse8601(), YYYY-MM-DD HH:MM:SS', former_parse8601, ccxt.Exchange.parse8601, [string[:10] + ' ' + string[11:19] for string in strings]),
+    ('parse8601(), YYYY-MM-DDTHH:MM:SS.sss+00:00', former_parse8601, ccxt.Exchange.parse8601, [string[:23] + '+00:00' for string in strings]),
+]
+
+print('{:,} timestamps'.format(count))
+for name, former, current, values in cases:
+    sample = values[::max(1, count // 10000)]
+    assert [former(value) for value in sample] == [current(value) for value in sample]
+    before, after = measure(former, current, values)
+    print('    {:<44} former {:>6.2f} s {:>6.3f} us   current {:>6.2f} s {:>6.3f} us   {:>5.2f}x'.format(
+        name, before, before / count * 1e6, after, after / count * 1e6, before / after))
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+# measures the decoding of large json payloads, generated in the shape of the responses and messages of binance and bitmex:
+#   - rest responses with quoteJsonNumbers, the numbers are kept as strings by the standard library in both cases
+#   - rest responses without quoteJsonNumbers, json.loads against decode_json() with orjson when it is installed
+#   - websocket messages received as bytes, decoded to a str and then parsed, against decode_json() from the bytes
+
+import json
+import os
+import random
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt  # noqa: E402
+from ccxt.base import exchange as base  # noqa: E402
+
+random.seed(1)
+repeat = 10
+
+
+def price():
+    return '{:.8f}'.format(random.uniform(0.0001, 50000))
+
+
+tickers = json.dumps([{
+    'symbol': 'COIN' + str(i) + 'USDT', 'priceChange': price(), 'priceChangePercent': '{:.3f}'.format(random.uniform(-10, 10)),
+    'weightedAvgPrice': price(), 'prevClosePrice': price(), 'lastPrice': price(), 'lastQty': price(), 'bidPrice': price(),
+    'bidQty': price(), 'askPrice': price(), 'askQty': price(), 'openPrice': price(), 'highPrice': price(), 'lowPrice': price(),
+    'volume': price(), 'quoteVolume': price(), 'openTime': 1670000000000 + i, 'closeTime': 1670086400000 + i,
+    'firstId': 1000000 + i, 'lastId': 2000000 + i, 'count': random.randint(1, 1000000),
+} for i in range(2000)], separators=(',', ':'))
+
+order_book = json.dumps({
+    'lastUpdateId': 1027024,
+    'bids': [['{:.2f}'.format(20000 - i * 0.01), '{:.8f}'.format(random.random())] for i in range(5000)],
+    'asks': [['{:.2f}'.format(20000 + i * 0.01), '{:.8f}'.format(random.random())] for i in range(5000)],
+}, separators=(',', ':'))
+
+exchange_info = json.dumps({'timezone': 'UTC', 'serverTime': 1670000000000, 'symbols': [{
+    'symbol': 'COIN' + str(i) + 'USDT', 'status': 'TRADING', 'baseAsset': 'COIN' + str(i), 'baseAssetPrecision': 8,
+    'quoteAsset': 'USDT', 'quotePrecision': 8, 'orderTypes': ['LIMIT', 'LIMIT_MAKER', 'MARKET', 'STOP_LOSS_LIMIT', 'TAKE_PROFIT_LIMIT'],
+    'icebergAllowed': True, 'isSpotTradingAllowed': True, 'permissions': ['SPOT', 'MARGIN'],
+    'filters': [
+        {'filterType': 'PRICE_FILTER', 'minPrice': '0.00000100', 'maxPrice': '100000.00000000', 'tickSize': '0.00000100'},
+        {'filterType': 'LOT_SIZE', 'minQty': '0.00100000', 'maxQty': '100000.00000000', 'stepSize': '0.00100000'},
+        {'filterType': 'MIN_NOTIONAL', 'minNotional': '10.00000000', 'applyToMarket': True, 'avgPriceMins': 5},
+    ],
+} for i in range(2000)]}, separators=(',', ':'))
+
+# bitmex sends its numbers unquoted
+depth_message = json.dumps({'table': 'orderBookL2', 'action': 'partial', 'data': [{
+    'symbol': 'XBTUSD', 'id': 8799000000 + i, 'side': 'Sell' if i % 2 else 'Buy', 'size': random.randint(1, 100000),
+    'price': round(20000 + random.uniform(-500, 500), 1), 'timestamp': '2022-12-01T00:00:00.000Z',
+} for i in range(5000)]}, separators=(',', ':')).encode()
+
+payloads = [('fetch_tickers, 2000 symbols', tickers), ('order book, 5000 levels', order_book), ('exchangeInfo, 2000 symbols', exchange_info)]
+
+
+def measure(function, payload):
+    # the best of 5 rounds, to leave out the collections of the garbage collector
+    result = None
+    for j in range(5):
+        start = time.perf_counter()
+        for i in range(repeat):
+            function(payload)
+        elapsed = (time.perf_counter() - start) / repeat * 1000
+        result = elapsed if result is None else min(result, elapsed)
+    return result
+
+
+def report(name, former, current):
+    print('    {:<32} former {:>7.2f} ms   decode_json {:>7.2f} ms   {:>5.2f}x'.format(name, former, current, former / current))
+
+
+print('orjson', 'installed' if base.orjson is not None else 'not installed, decode_json() uses the standard library')
+exchange = ccxt.Exchange()
+
+print('rest responses, quoteJsonNumbers')
+for name, payload in payloads:
+    assert exchange.on_json_response(payload) == json.loads(payload, parse_float=str, parse_int=str)
+    report(name, measure(lambda body: json.loads(body, parse_float=str, parse_int=str), payload), measure(exchange.on_json_response, payload))
+
+print('rest responses, numbers not quoted')
+exchange.quoteJsonNumbers = False
+for name, payload in payloads:
+    assert exchange.on_json_response(payload) == json.loads(payload)
+    report(name, measure(json.loads, payload), measure(exchange.on_json_response, payload))
+
+print('websocket messages')
+assert exchange.decode_json(depth_message) == json.loads(depth_message.decode())
+report('orderBookL2 partial, 5000 levels', measure(lambda data: json.loads(data.decode()), depth_message), measure(exchange.decode_json, depth_message))
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+# measures the memory of large responses from a local http server, traced with tracemalloc:
+#   - peak, the highest memory allocated while a request is made, with the previous response still retained or not
+#   - retained, the memory that is still allocated once the result of the request is released
+# for the synchronous and the asynchronous exchanges, by default and with lean_responses
+
+import asyncio
+import gc
+import json
+import os
+import random
+import sys
+import threading
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+
+random.seed(1)
+requests = 3
+body = json.dumps([{
+    'symbol': 'COIN' + str(i) + 'USDT', 'lastPrice': '{:.8f}'.format(random.uniform(0.0001, 50000)),
+    'volume': '{:.8f}'.format(random.uniform(0, 1000000)), 'openTime': 1670000000000 + i, 'count': random.randint(1, 1000000),
+} for i in range(100000)], separators=(',', ':')).encode() + b'\n'
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+server.daemon_threads = True
+threading.Thread(target=server.serve_forever, daemon=True).start()
+url = 'http://127.0.0.1:' + str(server.server_address[1]) + '/'
+
+
+def traced(fetch):
+    # the first request opens the connection and warms up the caches
+    fetch()
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    for i in range(requests):
+        fetch()
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    return peak, retained
+
+
+def sync_fetch(lean):
+    exchange = ccxt.Exchange({'lean_responses': lean, 'enableRateLimit': False})
+    return traced(lambda: exchange.fetch(url))
+
+
+def async_fetch(lean):
+    loop = asyncio.new_event_loop()
+    exchange = ccxt.async_support.Exchange({'lean_responses': lean, 'enableRateLimit': False, 'asyncio_loop': loop})
+    try:
+        return traced(lambda: loop.run_until_complete(exchange.fetch(url)))
+    finally:
+        loop.run_until_complete(exchange.close())
+        loop.close()
+
+
+print('{} requests of a {:.1f} MB json response'.format(requests, len(body) / 1e6))
+for name, fetch in [('sync', sync_fetch), ('async', async_fetch)]:
+    for lean in [False, True]:
+        peak, retained = fetch(lean)
+        print('    {:<6} {:<20} peak {:>7.1f} MB   retained {:>7.1f} MB'.format(name, 'lean_responses' if lean else 'default', peak / 1e6, retained / 1e6))
+server.shutdown()
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+
+# compares a cold start, that fetches and parses the markets from the exchange,
+# to a warm start, that reads the normalized markets from the markets cache
+# usage: python benchmark-markets-cache.py [exchange_id]
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt  # noqa: E402
+
+exchange_id = sys.argv[1] if len(sys.argv) > 1 else 'binance'
+runs = 5
+directory = tempfile.mkdtemp()
+
+
+def measure(exchange_class, config):
+    timings = []
+    for i in range(0, runs):
+        exchange = exchange_class(config)
+        start = time.perf_counter()
+        exchange.load_markets()
+        timings.append(time.perf_counter() - start)
+    return min(timings), exchange
+
+
+try:
+    exchange_class = getattr(ccxt, exchange_id)
+    cold, exchange = measure(exchange_class, {})
+    exchange_class({'markets_cache_path': directory}).load_markets()
+    warm, exchange = measure(exchange_class, {'markets_cache_path': directory})
+    size = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+    print(exchange_id, len(exchange.markets), 'markets,', len(exchange.currencies), 'currencies, cache file', size // 1024, 'KB')
+    print('    {:<12} {:>10.1f} ms'.format('cold start', cold * 1000))
+    print('    {:<12} {:>10.1f} ms'.format('warm start', warm * 1000))
+finally:
+    shutil.rmtree(directory)
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+# measures the parsing of unified structures with each number mode of the exchange, float, str and Decimal:
+#   - parse_trades() of 10000 trades, in the shape of binance.parse_trade()
+#   - parse_order_book() of 5000 bids and 5000 asks
+#   - safe_ticker() of 2000 tickers
+# for each of them with the former parse_number(), that converted every value with self.number(value) in a try block,
+# and with the current one
+
+import gc
+import os
+import random
+import sys
+import time
+from decimal import Decimal
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt  # noqa: E402
+
+random.seed(1)
+
+
+def price():
+    return '{:.2f}'.format(random.uniform(19000, 21000))
+
+
+def amount():
+    return '{:.8f}'.format(random.uniform(0, 2))
+
+
+trades = [{'a': 26129 + i, 'p': price(), 'q': amount(), 'T': 1670000000000 + i, 'm': bool(i % 2)} for i in range(10000)]
+orderbook = {'bids': [[price(), amount()] for i in range(5000)], 'asks': [[price(), amount()] for i in range(5000)]}
+tickers = [{
+    'symbol': 'BTC/USDT', 'high': price(), 'low': price(), 'bid': price(), 'bidVolume': amount(), 'ask': price(), 'askVolume': amount(),
+    'open': price(), 'last': price(), 'baseVolume': amount(), 'quoteVolume': price(), 'previousClose': random.choice([price(), '']),
+} for i in range(2000)]
+
+
+class Local(ccxt.Exchange):
+    def parse_trade(self, trade, market=None):
+        # the fields of binance.parse_trade() that the benchmark uses
+        timestamp = self.safe_integer(trade, 'T')
+        return self.safe_trade({
+            'id': self.safe_string(trade, 'a'),
+            'timestamp': timestamp,
+            'datetime': None,
+            'symbol': 'BTC/USDT',
+            'side': 'sell' if trade['m'] else 'buy',
+            'price': self.safe_string(trade, 'p'),
+            'amount': self.safe_string(trade, 'q'),
+            'fee': None,
+        }, market)
+
+
+def former_parse_number(self, value, default=None):
+    if value is None:
+        return default
+    else:
+        try:
+            return self.number(value)
+        except Exception:
+            return default
+
+
+def measure(former, current):
+    # the best of 7 rounds of each, in seconds, the rounds alternate and run without the garbage collector
+    results = [None, None]
+    gc.collect()
+    gc.disable()
+    try:
+        for j in range(7):
+            for i, function in enumerate([former, current]):
+                start = time.perf_counter()
+                function()
+                elapsed = time.perf_counter() - start
+                results[i] = elapsed if results[i] is None else min(results[i], elapsed)
+    finally:
+        gc.enable()
+    return results
+
+
+market = {'symbol': 'BTC/USDT', 'contractSize': None, 'inverse': False}
+structures = [
+    ('parse_trades(), 10000 trades', len(trades), lambda exchange: exchange.parse_trades(trades, market)),
+    ('parse_order_book(), 10000 levels', 10000, lambda exchange: exchange.parse_order_book(orderbook, 'BTC/USDT')),
+    ('safe_ticker(), 2000 tickers', len(tickers), lambda exchange: [exchange.safe_ticker(ticker, market) for ticker in tickers]),
+]
+
+for name, count, parse in structures:
+    print(name)
+    for number in [float, str, Decimal]:
+        exchange = Local({'id': 'benchmark', 'number': number})
+        former_exchange = Local({'id': 'benchmark', 'number': number})
+        former_exchange.parse_number = former_parse_number.__get__(former_exchange)
+        assert parse(former_exchange) == parse(exchange)
+        former, current = measure(lambda: parse(former_exchange), lambda: parse(exchange))
+        print('    {:<8} former {:>9,.0f}/s   current {:>9,.0f}/s   {:>5.2f}x'.format(number.__name__, count / former, count / current, former / current))
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+# measures the wall time of fetch_markets of a synchronous exchange that
+# fetches several market types, with and without the thread pool of submit()
+# the exchange is pointed at a local http server that answers every request
+# after an artificial delay, so that the network latency is the same for each run
+
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt  # noqa: E402
+
+delay = 0.2  # seconds
+runs = 3
+
+
+class Handler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        time.sleep(delay)
+        if self.path.startswith('/api/v5/public/underlying'):
+            body = b'{"code":"0","data":[["BTC-USD"]]}'
+        else:
+            body = b'{"code":"0","data":[]}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+url = 'http://127.0.0.1:' + str(server.server_address[1])
+
+
+def measure(thread_pool_size):
+    exchange = ccxt.okx({
+        'thread_pool_size': thread_pool_size,
+        'enableRateLimit': False,
+        'urls': {'api': {'rest': url}},
+    })
+    timings = []
+    for i in range(0, runs):
+        start = time.perf_counter()
+        exchange.fetch_markets()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+print('okx fetch_markets, {:.0f} ms per request'.format(delay * 1000))
+for size in [1, 4]:
+    print('    thread_pool_size={:<4} {:>8.1f} ms'.format(size, measure(size) * 1000))
+
+server.shutdown()
@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+
+# measures the Precise string arithmetic against the former implementation of Precise, kept below as FormerPrecise:
+#   - the string operations one by one, on prices, amounts and fee rates in the shapes that the exchanges send
+#   - the fused operations against the chains of operations that they replace
+#   - safe_order() of 1000 orders with 3 trades each, and safe_trade() of 10000 trades, with each implementation
+# the peak memory is traced with tracemalloc, for the current implementation it includes the cache of up to 8192 parsed strings
+
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt  # noqa: E402
+from ccxt.base import exchange as base  # noqa: E402
+from ccxt.base.precise import Precise  # noqa: E402
+
+
+class FormerPrecise:
+    # the parsing and the formatting of the former implementation, every operation goes through the objects
+
+    def __init__(self, number, decimals=None):
+        if decimals is None:
+            modifier = 0
+            number = number.lower()
+            if 'e' in number:
+                number, modifier = number.split('e')
+                modifier = int(modifier)
+            decimal_index = number.find('.')
+            if decimal_index > -1:
+                self.decimals = len(number) - decimal_index - 1
+                self.integer = int(number.replace('.', ''))
+            else:
+                self.decimals = 0
+                self.integer = int(number)
+            self.decimals = self.decimals - modifier
+        else:
+            self.integer = number
+            self.decimals = decimals
+        self.base = 10
+
+    def mul(self, other):
+        return FormerPrecise(self.integer * other.integer, self.decimals + other.decimals)
+
+    def div(self, other, precision=18):
+        distance = precision - self.decimals + other.decimals
+        if distance == 0:
+            numerator = self.integer
+        elif distance < 0:
+            numerator = self.integer // self.base ** -distance
+        else:
+            numerator = self.integer * self.base ** distance
+        result, mod = divmod(numerator, other.integer)
+        result = result + 1 if result < 0 and mod else result
+        return FormerPrecise(result, precision)
+
+    def add(self, other):
+        if self.decimals == other.decimals:
+            return FormerPrecise(self.integer + other.integer, self.decimals)
+        smaller, bigger = [other, self] if self.decimals > other.decimals else [self, other]
+        normalised = smaller.integer * (self.base ** (bigger.decimals - smaller.decimals))
+        return FormerPrecise(normalised + bigger.integer, bigger.decimals)
+
+    def sub(self, other):
+        return self.add(FormerPrecise(-other.integer, other.decimals))
+
+    def gt(self, other):
+        return self.sub(other).integer > 0
+
+    def ge(self, other):
+        return self.sub(other).integer >= 0
+
+    def reduce(self):
+        string = str(self.integer)
+        start = len(string) - 1
+        if start == 0:
+            if string == "0":
+                self.decimals = 0
+            return self
+        for i in range(start, -1, -1):
+            if string[i] != '0':
+                break
+        difference = start - i
+        if difference == 0:
+            return self
+        self.decimals -= difference
+        self.integer = int(string[:i + 1])
+
+    def equals(self, other):
+        self.reduce()
+        other.reduce()
+        return self.decimals == other.decimals and self.integer == other.integer
+
+    def __str__(self):
+        self.reduce()
+        sign = '-' if self.integer < 0 else ''
+        integer_array = list(str(abs(self.integer)).rjust(self.decimals, '0'))
+        index = len(integer_array) - self.decimals
+        if index == 0:
+            item = '0.'
+        elif self.decimals < 0:
+            item = '0' * (-self.decimals)
+        elif self.decimals == 0:
+            item = ''
+        else:
+            item = '.'
+        integer_array.insert(index, item)
+        return sign + ''.join(integer_array)
+
+    @staticmethod
+    def string_mul(string1, string2):
+        if string1 is None or string2 is None:
+            return None
+        return str(FormerPrecise(string1).mul(FormerPrecise(string2)))
+
+    @staticmethod
+    def string_div(string1, string2, precision=18):
+        if string1 is None or string2 is None:
+            return None
+        string2_precise = FormerPrecise(string2)
+        if string2_precise.integer == 0:
+            return None
+        return str(FormerPrecise(string1).div(string2_precise, precision))
+
+    @staticmethod
+    def string_add(string1, string2):
+        if string1 is None and string2 is None:
+            return None
+        if string1 is None:
+            return string2
+        elif string2 is None:
+            return string1
+        return str(FormerPrecise(string1).add(FormerPrecise(string2)))
+
+    @staticmethod
+    def string_sub(string1, string2):
+        if string1 is None or string2 is None:
+            return None
+        return str(FormerPrecise(string1).sub(FormerPrecise(string2)))
+
+    @staticmethod
+    def string_equals(string1, string2):
+        if string1 is None or string2 is None:
+            return None
+        return FormerPrecise(string1).equals(FormerPrecise(string2))
+
+    @staticmethod
+    def string_eq(string1, string2):
+        if string1 is None or string2 is None:
+            return None
+        return FormerPrecise(string1).equals(FormerPrecise(string2))
+
+    @staticmethod
+    def string_gt(string1, string2):
+        if string1 is None or string2 is None:
+            return None
+        return FormerPrecise(string1).gt(FormerPrecise(string2))
+
+    @staticmethod
+    def string_ge(string1, string2):
+        if string1 is None or string2 is None:
+            return None
+        return FormerPrecise(string1).ge(FormerPrecise(string2))
+
+    # the chains of operations that the fused operations replace
+
+    @staticmethod
+    def string_mul_mul(string1, string2, string3):
+        return FormerPrecise.string_mul(FormerPrecise.string_mul(string1, string2), string3)
+
+    @staticmethod
+    def string_mul_div(string1, string2, string3, precision=18):
+        return FormerPrecise.string_div(FormerPrecise.string_mul(string1, string2), string3, precision)
+
+    @staticmethod
+    def string_mul_add(string1, string2, string3):
+        return FormerPrecise.string_add(FormerPrecise.string_mul(string1, string2), string3)
+
+
+random.seed(1)
+count = 10000
+prices = ['{:.2f}'.format(random.uniform(10000, 30000)) for i in range(count)]
+amounts = ['{:.8f}'.format(random.uniform(0, 2)) for i in range(count)]
+rates = [random.choice(['0.001', '0.00075', '0.0002', '0.0004']) for i in range(count)]
+
+operations = [
+    ('string_mul(price, amount)', lambda P, i: P.string_mul(prices[i], amounts[i])),
+    ('string_add(amount, amount)', lambda P, i: P.string_add(amounts[i], amounts[i - 1])),
+    ('string_sub(price, price)', lambda P, i: P.string_sub(prices[i], prices[i - 1])),
+    ('string_div(price, amount)', lambda P, i: P.string_div(prices[i], amounts[i])),
+    ('string_gt(amount, amount)', lambda P, i: P.string_gt(amounts[i], amounts[i - 1])),
+    ('string_mul_mul(price, amount, rate)', lambda P, i: P.string_mul_mul(prices[i], amounts[i], rates[i])),
+    ('string_mul_div(amount, 1, price)', lambda P, i: P.string_mul_div(amounts[i], '1', prices[i])),
+    ('string_mul_add(price, amount, fee)', lambda P, i: P.string_mul_add(prices[i], amounts[i], rates[i])),
+]
+
+
+def measure(function):
+    # the best of 5 rounds, in seconds
+    result = None
+    for j in range(5):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        result = elapsed if result is None else min(result, elapsed)
+    return result
+
+
+def traced(function):
+    gc.collect()
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+print('string operations, {} calls each'.format(count))
+for name, operation in operations:
+    for i in range(count):
+        assert operation(FormerPrecise, i) == operation(Precise, i)
+    former = measure(lambda: [operation(FormerPrecise, i) for i in range(count)])
+    current = measure(lambda: [operation(Precise, i) for i in range(count)])
+    print('    {:<38} former {:>6.3f} us   current {:>6.3f} us   {:>5.2f}x'.format(name, former / count * 1e6, current / count * 1e6, former / current))
+
+
+class Local(ccxt.Exchange):
+    def parse_trade(self, trade, market=None):
+        return self.safe_trade(trade, market)
+
+
+exchange = Local({'id': 'benchmark'})
+market = {'symbol': 'BTC/USDT', 'contractSize': None, 'inverse': False}
+
+
+def order(i):
+    trades = [{
+        'id': str(i * 3 + j), 'order': str(i), 'amount': amounts[(i * 3 + j) % count], 'price': prices[(i * 3 + j) % count], 'cost': None, 'side': 'buy', 'symbol': 'BTC/USDT',
+        'timestamp': 1670000000000 + j, 'fee': {'currency': 'USDT', 'cost': rates[(i * 3 + j) % count], 'rate': rates[(i * 3 + j) % count]},
+    } for j in range(3)]
+    return {
+        'id': str(i), 'symbol': 'BTC/USDT', 'type': 'limit', 'side': 'buy', 'status': 'closed', 'price': prices[i],
+        'amount': None, 'filled': None, 'remaining': '0', 'cost': None, 'average': None,
+        'trades': trades,
+    }
+
+
+def parse_orders():
+    return [exchange.safe_order(order(i), market) for i in range(1000)]
+
+
+def parse_trades():
+    return [exchange.safe_trade({'id': str(i), 'amount': amounts[i], 'price': prices[i], 'fee': {'currency': 'USDT', 'cost': rates[i]}}, market) for i in range(count)]
+
+
+print('safe_order() of 1000 orders with 3 trades, safe_trade() of {} trades'.format(count))
+for name, function in [('safe_order()', parse_orders), ('safe_trade()', parse_trades)]:
+    results = {}
+    for implementation in [FormerPrecise, Precise]:
+        base.Precise = implementation
+        results[implementation] = (function(), measure(function), traced(function))
+    base.Precise = Precise
+    former, current = results[FormerPrecise], results[Precise]
+    assert former[0] == current[0]
+    print('    {:<14} former {:>7.1f} ms {:>6.1f} MB   current {:>7.1f} ms {:>6.1f} MB   {:>5.2f}x'.format(
+        name, former[1] * 1000, former[2] / 1e6, current[1] * 1000, current[2] / 1e6, former[1] / current[1]))
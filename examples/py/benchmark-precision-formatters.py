@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+# measures price_to_precision(), amount_to_precision() and cost_to_precision() on 2000 markets, for each precisionMode and paddingMode:
+#   - former, the market lookup and decimal_to_precision() with the precision of the market, as the methods did before
+#   - compiled, the methods with the formatters that set_markets() compiles for each market
+# and checks that both give the same strings
+
+import os
+import random
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt  # noqa: E402
+from ccxt.base.decimal_to_precision import DECIMAL_PLACES, SIGNIFICANT_DIGITS, TICK_SIZE, NO_PADDING, PAD_WITH_ZERO, ROUND, TRUNCATE  # noqa: E402
+
+random.seed(1)
+count = 20000
+modes = [('DECIMAL_PLACES', DECIMAL_PLACES), ('SIGNIFICANT_DIGITS', SIGNIFICANT_DIGITS), ('TICK_SIZE', TICK_SIZE)]
+paddings = [('NO_PADDING', NO_PADDING), ('PAD_WITH_ZERO', PAD_WITH_ZERO)]
+
+
+def markets(precision_mode):
+    result = []
+    for i in range(2000):
+        decimals = random.randint(0, 8)
+        if precision_mode == TICK_SIZE:
+            precision = {'price': random.choice([1, 2.5, 5]) * 10 ** -decimals, 'amount': 10 ** -random.randint(0, 8)}
+        elif precision_mode == SIGNIFICANT_DIGITS:
+            precision = {'price': random.randint(4, 8), 'amount': random.randint(4, 8)}
+        else:
+            precision = {'price': decimals, 'amount': random.randint(0, 8)}
+        result.append({'id': 'COIN' + str(i) + 'USDT', 'symbol': 'COIN' + str(i) + '/USDT', 'base': 'COIN' + str(i), 'quote': 'USDT', 'spot': True, 'precision': precision})
+    return result
+
+
+def former(exchange, method):
+    rounding_mode, key = {'price': (ROUND, 'price'), 'amount': (TRUNCATE, 'amount'), 'cost': (TRUNCATE, 'price')}[method]
+
+    def format(symbol, number):
+        market = exchange.market(symbol)
+        return exchange.decimal_to_precision(number, rounding_mode, market['precision'][key], exchange.precisionMode, exchange.paddingMode)
+    return format
+
+
+def measure(format, calls):
+    # the best of 3 rounds, in calls per second
+    result = None
+    for j in range(3):
+        start = time.perf_counter()
+        for symbol, number in calls:
+            format(symbol, number)
+        elapsed = time.perf_counter() - start
+        result = elapsed if result is None else min(result, elapsed)
+    return len(calls) / result
+
+
+for mode_name, precision_mode in modes:
+    exchange = ccxt.Exchange({'id': 'benchmark', 'precisionMode': precision_mode})
+    values = markets(precision_mode)
+    start = time.perf_counter()
+    exchange.set_markets(values)
+    print('{}, set_markets() of {} markets with the formatters in {:.1f} ms'.format(mode_name, len(values), (time.perf_counter() - start) * 1000))
+    calls = [(random.choice(exchange.symbols), random.uniform(1, 100000) * 10 ** random.randint(-6, 0)) for i in range(count)]
+    for padding_name, padding_mode in paddings:
+        exchange.paddingMode = padding_mode
+        for method in ['price', 'amount', 'cost']:
+            compiled = getattr(exchange, method + '_to_precision')
+            reference = former(exchange, method)
+            # the minimum precision errors of price_to_precision() and amount_to_precision() are left out
+            checked = []
+            for symbol, number in calls:
+                try:
+                    assert compiled(symbol, number) == reference(symbol, number)
+                    checked.append((symbol, number))
+                except ccxt.ArgumentsRequired:
+                    pass
+            before = measure(reference, checked)
+            after = measure(compiled, checked)
+            print('    {:<14} {:<18} former {:>9,.0f}/s   compiled {:>9,.0f}/s   {:>5.2f}x'.format(
+                padding_name, method + '_to_precision', before, after, after / before))
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+# measures the memory of the trades parsed by parse_trades() from payloads in the shape of binance, as dicts and as records:
+#   - dicts, the unified structures as the exchanges return them by default
+#   - records, records = True, with the info of the trades
+#   - records without info, records = True and records_info = False, the payloads are released
+# the memory is traced with tracemalloc, for the trades that are kept and the payloads that they reference,
+# the time of parse_trades() is measured without tracemalloc, the count of trades is the first argument, a million by default
+
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt  # noqa: E402
+
+
+class Local(ccxt.Exchange):
+    def parse_trade(self, trade, market=None):
+        # the fields of binance.parse_trade() that the benchmark uses
+        timestamp = self.safe_integer(trade, 'T')
+        return self.safe_trade({
+            'id': self.safe_string(trade, 'a'),
+            'order': None,
+            'info': trade,
+            'timestamp': timestamp,
+            'datetime': self.iso8601(timestamp),
+            'symbol': 'BTC/USDT',
+            'type': None,
+            'side': 'sell' if trade['m'] else 'buy',
+            'takerOrMaker': None,
+            'price': self.safe_string(trade, 'p'),
+            'amount': self.safe_string(trade, 'q'),
+            'cost': None,
+            'fee': None,
+        }, market)
+
+
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+market = {'symbol': 'BTC/USDT', 'contractSize': None, 'inverse': False}
+modes = [
+    ('dicts', {}),
+    ('records', {'records': True}),
+    ('records without info', {'records': True, 'records_info': False}),
+]
+
+
+def payloads():
+    # the decoded json of the responses, with the numbers as strings
+    random.seed(1)
+    return [{
+        'a': 26129 + i, 'p': '{:.2f}'.format(random.uniform(19000, 21000)), 'q': '{:.8f}'.format(random.uniform(0, 2)),
+        'f': 27781 + i, 'l': 27781 + i, 'T': 1670000000000 + i * 3, 'm': bool(i % 2), 'M': True,
+    } for i in range(count)]
+
+
+print('parse_trades() of {:,} trades'.format(count))
+for name, config in modes:
+    exchange = Local(dict(config, id='benchmark'))
+    # the time, with the payloads allocated beforehand
+    response = payloads()
+    gc.collect()
+    start = time.perf_counter()
+    trades = exchange.parse_trades(response, market)
+    elapsed = time.perf_counter() - start
+    del trades, response
+    # the memory that stays allocated once the response is released, the payloads that are kept as info are included
+    gc.collect()
+    tracemalloc.start()
+    trades = exchange.parse_trades(payloads(), market)
+    gc.collect()
+    kept = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert len(trades) == count and trades[-1]['datetime'] == ccxt.Exchange.iso8601(trades[-1]['timestamp'])
+    print('    {:<22} {:>7.1f} MB {:>6.0f} bytes per trade   {:>6.2f} s'.format(name, kept / 1e6, kept / count, elapsed))
+    del trades
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+# measures set_markets() on synthetic inputs of 10000 markets:
+#   - the initial load
+#   - a reload with the same markets
+#   - a reload where 1% of the markets changed
+
+import copy
+import os
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt  # noqa: E402
+
+count = 10000
+runs = 5
+
+
+def generate_markets(count):
+    markets = []
+    for i in range(0, count):
+        base = 'COIN' + str(i // 4)
+        quote = ['USDT', 'BTC', 'ETH', 'USDC'][i % 4]
+        spot = i % 3 != 0
+        markets.append({
+            'id': base + quote if spot else base + quote + '_PERP',
+            'symbol': base + '/' + quote if spot else base + '/' + quote + ':' + quote,
+            'base': base,
+            'quote': quote,
+            'settle': None if spot else quote,
+            'baseId': base.lower(),
+            'quoteId': quote.lower(),
+            'type': 'spot' if spot else 'swap',
+            'spot': spot,
+            'swap': not spot,
+            'active': True,
+            'contract': not spot,
+            'precision': {
+                'amount': 0.001 * (1 + i % 5),
+                'price': 0.01 * (1 + i % 7),
+            },
+            'limits': {
+                'amount': {'min': 0.001, 'max': 10000},
+                'cost': {'min': 5, 'max': None},
+            },
+            'info': {
+                'symbol': base + quote,
+                'status': 'TRADING',
+                'filters': [{'filterType': 'PRICE_FILTER', 'tickSize': '0.01'}, {'filterType': 'LOT_SIZE', 'stepSize': '0.001'}],
+            },
+        })
+    return markets
+
+
+def measure(loaded, markets):
+    timings = []
+    for i in range(0, runs):
+        exchange = ccxt.binance()
+        if loaded is not None:
+            exchange.set_markets(copy.deepcopy(loaded))
+        inputs = copy.deepcopy(markets)  # fresh objects, like a fetch_markets() response
+        start = time.perf_counter()
+        exchange.set_markets(inputs)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+markets = generate_markets(count)
+changed = copy.deepcopy(markets)
+for i in range(0, count, 100):
+    changed[i]['precision']['price'] = 0.5
+
+scenarios = [
+    ('initial load', None, markets),
+    ('reload, no changes', markets, markets),
+    ('reload, 1% changed', markets, changed),
+]
+
+for name, loaded, inputs in scenarios:
+    seconds = measure(loaded, inputs)
+    print('{:<20} {} markets {:>10.1f} ms'.format(name, count, seconds * 1000))
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+
+# measures the memory held by the markets of several instances of the same exchange
+# (one per api key for example), with and without shared_markets
+# usage: python benchmark-shared-markets.py [exchange_id]
+
+import os
+import sys
+import tracemalloc
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt  # noqa: E402
+
+exchange_id = sys.argv[1] if len(sys.argv) > 1 else 'binance'
+instances = 10
+
+
+def measure(config):
+    exchange_class = getattr(ccxt, exchange_id)
+    exchange_class(config).load_markets()  # the first instance fetches the markets
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    exchanges = []
+    for i in range(0, instances):
+        exchange = exchange_class(config)
+        exchange.load_markets()
+        exchanges.append(exchange)
+    size = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    return size / instances, len(exchanges[0].markets)
+
+
+for name, config in [('private copies', {}), ('shared_markets', {'shared_markets': True})]:
+    size, markets = measure(config)
+    print('{:<16} {} markets, {:>10.1f} KB per additional instance'.format(name, markets, size / 1024))
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+
+# fetches 100k trades from a local http server with fetch_trades() and with fetch_trades(params={'stream': True}),
+# then sums their amounts one trade at a time, and measures:
+#   - the time to the first parsed trade
+#   - the total time
+#   - the peak of the memory traced by tracemalloc
+
+import asyncio
+import gc
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+
+count = 100000
+body = json.dumps([{
+    'a': 26129 + i, 'p': '{:.8f}'.format(20000 + i / 1000), 'q': '{:.8f}'.format(i / 100000), 'f': 27781 + i, 'l': 27781 + i,
+    'T': 1670000000000 + i, 'm': bool(i % 2), 'M': True,
+} for i in range(count)], separators=(',', ':')).encode()
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+server.daemon_threads = True
+threading.Thread(target=server.serve_forever, daemon=True).start()
+
+
+def describe(self):
+    return self.deep_extend(super(type(self), self).describe(), {
+        'id': 'local',
+        'urls': {'api': 'http://127.0.0.1:' + str(server.server_address[1])},
+        'api': {'public': {'get': ['aggTrades']}},
+    })
+
+
+def sign(self, path, api='public', method='GET', params={}, headers=None, body=None):
+    return {'url': self.urls['api'] + '/' + path, 'method': method, 'body': body, 'headers': headers}
+
+
+def parse_trade(self, trade, market=None):
+    # the fields of binance.parse_trade() that the benchmark uses
+    timestamp = self.safe_integer(trade, 'T')
+    return self.safe_trade({
+        'id': self.safe_string(trade, 'a'),
+        'timestamp': timestamp,
+        'datetime': self.iso8601(timestamp),
+        'symbol': 'BTC/USDT',
+        'side': 'sell' if trade['m'] else 'buy',
+        'price': self.safe_string(trade, 'p'),
+        'amount': self.safe_string(trade, 'q'),
+        'fee': None,
+    }, market)
+
+
+class Local(ccxt.Exchange):
+    describe = describe
+    sign = sign
+    parse_trade = parse_trade
+
+    def fetch_trades(self, symbol=None, since=None, limit=None, params={}):
+        return self.parse_trades(self.publicGetAggTrades(params), None, since, limit)
+
+
+class AsyncLocal(ccxt.async_support.Exchange):
+    describe = describe
+    sign = sign
+    parse_trade = parse_trade
+
+    async def fetch_trades(self, symbol=None, since=None, limit=None, params={}):
+        return self.parse_trades(await self.publicGetAggTrades(params), None, since, limit)
+
+
+def measure(consume):
+    # the times are measured without tracemalloc, that slows down the allocations
+    gc.collect()
+    start = time.perf_counter()
+    first, total = consume(start)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    tracemalloc.start()
+    consume(time.perf_counter())
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return first * 1000, elapsed * 1000, peak / 1e6
+
+
+def sync_consume(params):
+    exchange = Local({'enableRateLimit': False})
+
+    def consume(start):
+        first = None
+        total = 0
+        for trade in exchange.fetch_trades(params=params):
+            if first is None:
+                first = time.perf_counter() - start
+            total += trade['amount']
+        return first, total
+
+    exchange.fetch_trades()  # opens the connection
+    return measure(consume)
+
+
+def async_consume(params):
+    loop = asyncio.new_event_loop()
+    exchange = AsyncLocal({'enableRateLimit': False, 'asyncio_loop': loop})
+
+    async def iterate(start):
+        first = None
+        total = 0
+        trades = await exchange.fetch_trades(params=params)
+        if params:
+            async for trade in trades:
+                if first is None:
+                    first = time.perf_counter() - start
+                total += trade['amount']
+        else:
+            for trade in trades:
+                if first is None:
+                    first = time.perf_counter() - start
+                total += trade['amount']
+        return first, total
+
+    try:
+        loop.run_until_complete(exchange.fetch_trades())
+        return measure(lambda start: loop.run_until_complete(iterate(start)))
+    finally:
+        loop.run_until_complete(exchange.close())
+        loop.close()
+
+
+print('{} trades, a {:.1f} MB response'.format(count, len(body) / 1e6))
+for name, consume in [('sync', sync_consume), ('async', async_consume)]:
+    for params in [{}, {'stream': True}]:
+        first, elapsed, peak = consume(params)
+        print('    {:<6} {:<16} first trade {:>8.2f} ms   all trades {:>8.1f} ms   peak {:>7.1f} MB'.format(
+            name, 'streamed' if params else 'whole response', first, elapsed, peak))
+server.shutdown()
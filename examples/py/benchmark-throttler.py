@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+# measures the async rate limiter with 1000 queued requests:
+#   - event loop wakeups per second, counted as the calls to the selector
+#   - cpu time spent by the process
+#   - scheduling accuracy, the difference between the time a request is released and its ideal time
+# the former looper that polls every `delay` seconds is kept below for comparison
+
+import asyncio
+import collections
+import gc
+import os
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+from ccxt.async_support.base.throttler import Throttler  # noqa: E402
+
+requests = 1000
+scenarios = [
+    # throttlers, refillRate
+    (1, 1 / 2),  # one exchange, one token every 2 ms, 1000 requests take 2 seconds
+    (50, 1 / 50),  # 50 exchanges with 20 requests each, one token every 50 ms, 1 second
+]
+
+
+class PollingThrottler:
+
+    def __init__(self, config):
+        self.config = {
+            'refillRate': 1.0,
+            'delay': 0.001,
+            'cost': 1.0,
+            'tokens': 0,
+            'capacity': 1.0,
+        }
+        self.config.update(config)
+        self.queue = collections.deque()
+        self.running = False
+
+    def __call__(self, cost=None):
+        future = asyncio.Future()
+        self.queue.append((future, cost))
+        if not self.running:
+            self.running = True
+            asyncio.ensure_future(self.looper())
+        return future
+
+    async def looper(self):
+        last_timestamp = time.time() * 1000
+        while self.running:
+            future, cost = self.queue[0]
+            cost = self.config['cost'] if cost is None else cost
+            if self.config['tokens'] >= 0:
+                self.config['tokens'] -= cost
+                if not future.done():
+                    future.set_result(None)
+                self.queue.popleft()
+                # context switch
+                await asyncio.sleep(0)
+                if len(self.queue) == 0:
+                    self.running = False
+            else:
+                await asyncio.sleep(self.config['delay'])
+                now = time.time() * 1000
+                elapsed = now - last_timestamp
+                last_timestamp = now
+                self.config['tokens'] = min(self.config['tokens'] + elapsed * self.config['refillRate'], self.config['capacity'])
+
+
+async def measure(cls, throttlers, refill_rate):
+    loop = asyncio.get_running_loop()
+    selector = loop._selector
+    select = selector.select
+    wakeups = [0]
+
+    def counting_select(timeout=None):
+        wakeups[0] += 1
+        return select(timeout)
+
+    selector.select = counting_select
+    throttles = [cls({'tokens': 0, 'refillRate': refill_rate}) for i in range(throttlers)]
+    per_throttle = requests // throttlers
+    released = [[] for i in range(throttlers)]
+    start = time.perf_counter()
+    cpu = time.process_time()
+
+    async def request(j):
+        await throttles[j](1)
+        released[j].append(time.perf_counter())
+
+    await asyncio.gather(*[request(j) for j in range(throttlers) for i in range(per_throttle)])
+    wall = time.perf_counter() - start
+    cpu = time.process_time() - cpu
+    selector.select = select
+    # the first request is released once the looper starts, the others should follow every 1 / refill_rate ms
+    errors = [abs((times[i] - times[0]) * 1000 - i / refill_rate) for times in released for i in range(per_throttle)]
+    return wall, cpu, wakeups[0], sum(errors) / requests, max(errors)
+
+
+for throttlers, refill_rate in scenarios:
+    print('{} queued requests, {} throttlers, one token every {:.0f} ms'.format(requests, throttlers, 1 / refill_rate))
+    for cls in [PollingThrottler, Throttler]:
+        gc.collect()
+        wall, cpu, wakeups, mean_error, max_error = asyncio.run(measure(cls, throttlers, refill_rate))
+        print('    {:<16} wall {:>7.1f} ms   cpu {:>7.1f} ms   {:>7.0f} wakeups/s   error mean {:>5.2f} ms max {:>5.2f} ms'.format(
+            cls.__name__, wall * 1000, cpu * 1000, wakeups / wall, mean_error, max_error))
@@ -740,6 +740,68 @@ module.exports = class Exchange {
         }
     }
 
+    throttleApi (api, cost = undefined, priority = undefined) {
+        // the python version throttles each api group with the buckets of its rateLimitBuckets, in the lanes of their priorities
+        return this.throttle (cost)
+    }
+
+    calculateRateLimiterPriority (api, method, path, params, config = {}, context = {}) {
+        // the lane of the request in the python throttler, see rateLimitPriorities
+        return undefined
+    }
+
+    isPublicRequest (api, method, params) {
+        // the python version coalesces the identical public requests with coalesceRequests
+        return false
+    }
+
+    coalesceRequest (path, api = 'public', method = 'GET', params = {}, headers = undefined, body = undefined, config = {}, context = {}) {
+        return this.sendRequest (path, api, method, params, headers, body, config, context)
+    }
+
+    fetchRequest (api, request, stream = undefined) {
+        // the python version adapts the rate limiter of the api group to the headers of the response, and streams the responses
+        return this.fetch (request['url'], request['method'], request['headers'], request['body'])
+    }
+
+    parseStreamed (name, array, argument = undefined, since = undefined, limit = undefined, params = {}) {
+        // the python version parses the elements of a streamed response as they are decoded, see the stream param of fetch2
+        return undefined
+    }
+
+    deepExtendShared (defaults, value) {
+        // the python version shares the nested objects of the defaults instead of copying them
+        return this.deepExtend (defaults, value)
+    }
+
+    compilePrecisionFormatters (markets) {
+        // the python version compiles the formatters of the precisions of the markets, see decimalToMarketPrecision ()
+        return undefined
+    }
+
+    decimalToMarketPrecision (x, roundingMode, market, key) {
+        return this.decimalToPrecision (x, roundingMode, market['precision'][key], this.precisionMode, this.paddingMode)
+    }
+
+    previousMarketValues (defaults) {
+        // the python version keeps the markets that did not change on reload, see unchangedMarket ()
+        return undefined
+    }
+
+    unchangedMarket (previousMarkets, previousValues, value) {
+        return undefined
+    }
+
+    setMarketsChanges (previousMarkets) {
+        // the python version reports the symbols that were added, removed and changed by a reload
+        return undefined
+    }
+
+    record (name, structure) {
+        // the python version returns the unified structure as a record with slots when its records option is enabled
+        return structure
+    }
+
     checkOrderArguments (market, type, side, amount, price, params) {
         if (price === undefined) {
             if (type === 'limit') {
@@ -840,7 +902,7 @@ module.exports = class Exchange {
             fee['cost'] = this.safeNumber (fee, 'cost');
         }
         const timestamp = this.safeInteger (entry, 'timestamp');
-        return {
+        return this.record ('ledger', {
             'id': this.safeString (entry, 'id'),
             'timestamp': timestamp,
             'datetime': this.iso8601 (timestamp),
@@ -856,26 +918,46 @@ module.exports = class Exchange {
             'status': this.safeString (entry, 'status'),
             'fee': fee,
             'info': entry,
-        };
+        });
     }
 
     setMarkets (markets, currencies = undefined) {
         const values = [];
+        // the common fields are merged once, not once for every entry
+        const defaults = this.deepExtend (this.safeMarket (), {
+            'precision': this.precision,
+            'limits': this.limits,
+        }, this.fees['trading']);
+        // on reload the entries that did not change are kept as they are
+        const previousMarkets = (this.markets_by_id !== undefined) ? this.markets : undefined;
+        const previousValues = this.previousMarketValues (defaults);
         this.markets_by_id = {};
         // handle marketId conflicts
         // we insert spot markets first
-        const marketValues = this.sortBy (this.toArray (markets), 'spot', true);
+        const spotValues = [];
+        const otherValues = [];
+        const allValues = this.toArray (markets);
+        for (let i = 0; i < allValues.length; i++) {
+            const value = allValues[i];
+            if (value['spot']) {
+                spotValues.push (value);
+            } else {
+                otherValues.push (value);
+            }
+        }
+        const marketValues = this.arrayConcat (spotValues, otherValues);
         for (let i = 0; i < marketValues.length; i++) {
             const value = marketValues[i];
-            if (value['id'] in this.markets_by_id) {
-                this.markets_by_id[value['id']].push (value);
+            const id = value['id'];
+            if (id in this.markets_by_id) {
+                this.markets_by_id[id].push (value);
             } else {
-                this.markets_by_id[value['id']] = [ value ];
+                this.markets_by_id[id] = [ value ];
+            }
+            let market = this.unchangedMarket (previousMarkets, previousValues, value);
+            if (market === undefined) {
+                market = this.deepExtendShared (defaults, value);
             }
-            const market = this.deepExtend (this.safeMarket (), {
-                'precision': this.precision,
-                'limits': this.limits,
-            }, this.fees['trading'], value);
             values.push (market);
         }
         this.markets = this.indexBy (values, 'symbol');
@@ -884,13 +966,16 @@ module.exports = class Exchange {
         this.symbols = Object.keys (marketsSortedBySymbol);
         this.ids = Object.keys (marketsSortedById);
         if (currencies !== undefined) {
-            this.currencies = this.deepExtend (this.currencies, currencies);
+            this.currencies = this.deepExtendShared (this.currencies, currencies);
         } else {
-            let baseCurrencies = [];
-            let quoteCurrencies = [];
+            const defaultCurrencyPrecision = (this.precisionMode === DECIMAL_PLACES) ? 8 : this.parseNumber ('1e-8');
+            const baseCurrencies = {};
+            const quoteCurrencies = {};
+            // the most precise entry of every base and of every quote, a quote entry replaces a base entry only if it is more precise
+            const highestPrecisionBaseCurrencies = {};
+            const highestPrecisionQuoteCurrencies = {};
             for (let i = 0; i < values.length; i++) {
                 const market = values[i];
-                const defaultCurrencyPrecision = (this.precisionMode === DECIMAL_PLACES) ? 8 : this.parseNumber ('1e-8');
                 const marketPrecision = this.safeValue (market, 'precision', {});
                 if ('base' in market) {
                     const currencyPrecision = this.safeValue2 (marketPrecision, 'base', 'amount', defaultCurrencyPrecision);
@@ -900,7 +985,13 @@ module.exports = class Exchange {
                         'code': this.safeString (market, 'base'),
                         'precision': currencyPrecision,
                     };
-                    baseCurrencies.push (currency);
+                    const code = currency['code'];
+                    if (code !== undefined) {
+                        baseCurrencies[code] = currency;
+                        if (!(code in highestPrecisionBaseCurrencies) || this.hasHigherCurrencyPrecision (currency, highestPrecisionBaseCurrencies[code])) {
+                            highestPrecisionBaseCurrencies[code] = currency;
+                        }
+                    }
                 }
                 if ('quote' in market) {
                     const currencyPrecision = this.safeValue2 (marketPrecision, 'quote', 'price', defaultCurrencyPrecision);
@@ -910,40 +1001,43 @@ module.exports = class Exchange {
                         'code': this.safeString (market, 'quote'),
                         'precision': currencyPrecision,
                     };
-                    quoteCurrencies.push (currency);
+                    const code = currency['code'];
+                    if (code !== undefined) {
+                        quoteCurrencies[code] = currency;
+                        if (!(code in highestPrecisionQuoteCurrencies) || this.hasHigherCurrencyPrecision (currency, highestPrecisionQuoteCurrencies[code])) {
+                            highestPrecisionQuoteCurrencies[code] = currency;
+                        }
+                    }
                 }
             }
-            baseCurrencies = this.sortBy (baseCurrencies, 'code');
-            quoteCurrencies = this.sortBy (quoteCurrencies, 'code');
-            this.baseCurrencies = this.indexBy (baseCurrencies, 'code');
-            this.quoteCurrencies = this.indexBy (quoteCurrencies, 'code');
-            const allCurrencies = this.arrayConcat (baseCurrencies, quoteCurrencies);
-            const groupedCurrencies = this.groupBy (allCurrencies, 'code');
-            const codes = Object.keys (groupedCurrencies);
-            const resultingCurrencies = [];
-            for (let i = 0; i < codes.length; i++) {
-                const code = codes[i];
-                const groupedCurrenciesCode = this.safeValue (groupedCurrencies, code, []);
-                let highestPrecisionCurrency = this.safeValue (groupedCurrenciesCode, 0);
-                for (let j = 1; j < groupedCurrenciesCode.length; j++) {
-                    const currentCurrency = groupedCurrenciesCode[j];
-                    if (this.precisionMode === TICK_SIZE) {
-                        highestPrecisionCurrency = (currentCurrency['precision'] < highestPrecisionCurrency['precision']) ? currentCurrency : highestPrecisionCurrency;
-                    } else {
-                        highestPrecisionCurrency = (currentCurrency['precision'] > highestPrecisionCurrency['precision']) ? currentCurrency : highestPrecisionCurrency;
-                    }
+            this.baseCurrencies = this.keysort (baseCurrencies);
+            this.quoteCurrencies = this.keysort (quoteCurrencies);
+            const resultingCurrencies = this.extend ({}, highestPrecisionBaseCurrencies);
+            const quoteCodes = Object.keys (highestPrecisionQuoteCurrencies);
+            for (let i = 0; i < quoteCodes.length; i++) {
+                const code = quoteCodes[i];
+                const quoteCurrency = highestPrecisionQuoteCurrencies[code];
+                if (!(code in resultingCurrencies) || this.hasHigherCurrencyPrecision (quoteCurrency, resultingCurrencies[code])) {
+                    resultingCurrencies[code] = quoteCurrency;
                 }
-                resultingCurrencies.push (highestPrecisionCurrency);
             }
-            const sortedCurrencies = this.sortBy (resultingCurrencies, 'code');
-            this.currencies = this.deepExtend (this.currencies, this.indexBy (sortedCurrencies, 'code'));
+            this.currencies = this.deepExtendShared (this.currencies, this.keysort (resultingCurrencies));
         }
         this.currencies_by_id = this.indexBy (this.currencies, 'id');
         const currenciesSortedByCode = this.keysort (this.currencies);
         this.codes = Object.keys (currenciesSortedByCode);
+        this.compilePrecisionFormatters (values);
+        this.setMarketsChanges (previousMarkets);
         return this.markets;
     }
 
+    hasHigherCurrencyPrecision (currency, other) {
+        if (this.precisionMode === TICK_SIZE) {
+            return currency['precision'] < other['precision'];
+        }
+        return currency['precision'] > other['precision'];
+    }
+
     safeBalance (balance) {
         const balances = this.omit (balance, [ 'info', 'timestamp', 'datetime', 'free', 'used', 'total' ]);
         const codes = Object.keys (balances);
@@ -1153,11 +1247,10 @@ module.exports = class Exchange {
                 multiplyPrice = average;
             }
             // contract trading
-            const filledTimesContractSize = Precise.stringMul (filled, contractSize);
             if (inverse) {
-                cost = Precise.stringDiv (filledTimesContractSize, multiplyPrice);
+                cost = Precise.stringMulDiv (filled, contractSize, multiplyPrice);
             } else {
-                cost = Precise.stringMul (filledTimesContractSize, multiplyPrice);
+                cost = Precise.stringMulMul (filled, contractSize, multiplyPrice);
             }
         }
         // support for market orders
@@ -1194,7 +1287,7 @@ module.exports = class Exchange {
             // timeInForce is not undefined here
             postOnly = timeInForce === 'PO';
         }
-        return this.extend (order, {
+        return this.record ('order', this.extend (order, {
             'symbol': symbol,
             'side': side,
             'lastTradeTimestamp': lastTradeTimeTimestamp,
@@ -1207,10 +1300,14 @@ module.exports = class Exchange {
             'timeInForce': timeInForce,
             'postOnly': postOnly,
             'trades': trades,
-        });
+        }));
     }
 
     parseOrders (orders, market = undefined, since = undefined, limit = undefined, params = {}) {
+        const streamed = this.parseStreamed ('orders', orders, market, since, limit, params);
+        if (streamed !== undefined) {
+            return streamed;
+        }
         //
         // the value of orders is either a dict or a list
         //
@@ -1312,15 +1409,13 @@ module.exports = class Exchange {
         if (cost === undefined) {
             // contract trading
             const contractSize = this.safeString (market, 'contractSize');
-            let multiplyPrice = price;
             if (contractSize !== undefined) {
                 const inverse = this.safeValue (market, 'inverse', false);
-                if (inverse) {
-                    multiplyPrice = Precise.stringDiv ('1', price);
-                }
-                multiplyPrice = Precise.stringMul (multiplyPrice, contractSize);
+                const multiplyPrice = inverse ? Precise.stringDiv ('1', price) : price;
+                cost = Precise.stringMulMul (multiplyPrice, contractSize, amount);
+            } else {
+                cost = Precise.stringMul (price, amount);
             }
-            cost = Precise.stringMul (multiplyPrice, amount);
         }
         const parseFee = this.safeValue (trade, 'fee') === undefined;
         const parseFees = this.safeValue (trade, 'fees') === undefined;
@@ -1361,7 +1456,7 @@ module.exports = class Exchange {
         trade['amount'] = this.parseNumber (amount);
         trade['price'] = this.parseNumber (price);
         trade['cost'] = this.parseNumber (cost);
-        return trade;
+        return this.record ('trade', trade);
     }
 
     reduceFeesByCurrency (fees) {
@@ -1477,14 +1572,14 @@ module.exports = class Exchange {
             percentage = Precise.stringMul (Precise.stringDiv (change, open), '100');
         }
         if ((change === undefined) && (percentage !== undefined) && (open !== undefined)) {
-            change = Precise.stringDiv (Precise.stringMul (percentage, open), '100');
+            change = Precise.stringMulDiv (percentage, open, '100');
         }
         if ((open === undefined) && (last !== undefined) && (change !== undefined)) {
             open = Precise.stringSub (last, change);
         }
         // timestamp and symbol operations don't belong in safeTicker
         // they should be done in the derived classes
-        return this.extend (ticker, {
+        return this.record ('ticker', this.extend (ticker, {
             'bid': this.safeNumber (ticker, 'bid'),
             'bidVolume': this.safeNumber (ticker, 'bidVolume'),
             'ask': this.safeNumber (ticker, 'ask'),
@@ -1501,7 +1596,7 @@ module.exports = class Exchange {
             'baseVolume': this.parseNumber (baseVolume),
             'quoteVolume': this.parseNumber (quoteVolume),
             'previousClose': this.safeNumber (ticker, 'previousClose'),
-        });
+        }));
     }
 
     async fetchOHLCV (symbol, timeframe = '1m', since = undefined, limit = undefined, params = {}) {
@@ -1851,6 +1946,10 @@ module.exports = class Exchange {
     }
 
     parseOHLCVs (ohlcvs, market = undefined, timeframe = '1m', since = undefined, limit = undefined) {
+        const streamed = this.parseStreamed ('ohlcvs', ohlcvs, market, since, limit);
+        if (streamed !== undefined) {
+            return streamed;
+        }
         const results = [];
         for (let i = 0; i < ohlcvs.length; i++) {
             results.push (this.parseOHLCV (ohlcvs[i], market));
@@ -1913,6 +2012,10 @@ module.exports = class Exchange {
     }
 
     parseTrades (trades, market = undefined, since = undefined, limit = undefined, params = {}) {
+        const streamed = this.parseStreamed ('trades', trades, market, since, limit, params);
+        if (streamed !== undefined) {
+            return streamed;
+        }
         trades = this.toArray (trades);
         let result = [];
         for (let i = 0; i < trades.length; i++) {
@@ -1926,6 +2029,10 @@ module.exports = class Exchange {
     }
 
     parseTransactions (transactions, currency = undefined, since = undefined, limit = undefined, params = {}) {
+        const streamed = this.parseStreamed ('transactions', transactions, currency, since, limit, params);
+        if (streamed !== undefined) {
+            return streamed;
+        }
         transactions = this.toArray (transactions);
         let result = [];
         for (let i = 0; i < transactions.length; i++) {
@@ -1939,6 +2046,10 @@ module.exports = class Exchange {
     }
 
     parseTransfers (transfers, currency = undefined, since = undefined, limit = undefined, params = {}) {
+        const streamed = this.parseStreamed ('transfers', transfers, currency, since, limit, params);
+        if (streamed !== undefined) {
+            return streamed;
+        }
         transfers = this.toArray (transfers);
         let result = [];
         for (let i = 0; i < transfers.length; i++) {
@@ -2014,13 +2125,27 @@ module.exports = class Exchange {
     }
 
     async fetch2 (path, api = 'public', method = 'GET', params = {}, headers = undefined, body = undefined, config = {}, context = {}) {
+        if (this.coalesceRequests && this.isPublicRequest (api, method, params)) {
+            return await this.coalesceRequest (path, api, method, params, headers, body, config, context);
+        }
+        return await this.sendRequest (path, api, method, params, headers, body, config, context);
+    }
+
+    async sendRequest (path, api = 'public', method = 'GET', params = {}, headers = undefined, body = undefined, config = {}, context = {}, request = undefined) {
         if (this.enableRateLimit) {
             const cost = this.calculateRateLimiterCost (api, method, path, params, config, context);
-            await this.throttle (cost);
+            const priority = this.calculateRateLimiterPriority (api, method, path, params, config, context);
+            await this.throttleApi (api, cost, priority);
+        }
+        const stream = this.safeValue (params, 'stream');
+        if (('rateLimitPriority' in params) || ('stream' in params)) {
+            params = this.omit (params, [ 'rateLimitPriority', 'stream' ]);
         }
         this.lastRestRequestTimestamp = this.milliseconds ();
-        const request = this.sign (path, api, method, params, headers, body);
-        return await this.fetch (request['url'], request['method'], request['headers'], request['body']);
+        if (request === undefined) {
+            request = this.sign (path, api, method, params, headers, body);
+        }
+        return await this.fetchRequest (api, request, stream);
     }
 
     async request (path, api = 'public', method = 'GET', params = {}, headers = undefined, body = undefined, config = {}, context = {}) {
@@ -2601,12 +2726,12 @@ module.exports = class Exchange {
 
     costToPrecision (symbol, cost) {
         const market = this.market (symbol);
-        return this.decimalToPrecision (cost, TRUNCATE, market['precision']['price'], this.precisionMode, this.paddingMode);
+        return this.decimalToMarketPrecision (cost, TRUNCATE, market, 'price');
     }
 
     priceToPrecision (symbol, price) {
         const market = this.market (symbol);
-        const result = this.decimalToPrecision (price, ROUND, market['precision']['price'], this.precisionMode, this.paddingMode);
+        const result = this.decimalToMarketPrecision (price, ROUND, market, 'price');
         if (result === '0') {
             throw new ArgumentsRequired (this.id + ' price of ' + market['symbol'] + ' must be greater than minimum price precision of ' + this.numberToString (market['precision']['price']));
         }
@@ -2615,7 +2740,7 @@ module.exports = class Exchange {
 
     amountToPrecision (symbol, amount) {
         const market = this.market (symbol);
-        const result = this.decimalToPrecision (amount, TRUNCATE, market['precision']['amount'], this.precisionMode, this.paddingMode);
+        const result = this.decimalToMarketPrecision (amount, TRUNCATE, market, 'amount');
         if (result === '0') {
             throw new ArgumentsRequired (this.id + ' amount of ' + market['symbol'] + ' must be greater than minimum amount precision of ' + this.numberToString (market['precision']['amount']));
         }
@@ -2624,7 +2749,7 @@ module.exports = class Exchange {
 
     feeToPrecision (symbol, fee) {
         const market = this.market (symbol);
-        return this.decimalToPrecision (fee, ROUND, market['precision']['price'], this.precisionMode, this.paddingMode);
+        return this.decimalToMarketPrecision (fee, ROUND, market, 'price');
     }
 
     currencyToPrecision (code, fee, networkCode = undefined) {
@@ -2740,6 +2865,10 @@ module.exports = class Exchange {
     }
 
     parseTickers (tickers, symbols = undefined, params = {}) {
+        const streamed = this.parseStreamed ('tickers', tickers, symbols, undefined, undefined, params);
+        if (streamed !== undefined) {
+            return streamed;
+        }
         //
         // the value of tickers is either a dict or a list
         //
@@ -184,6 +184,41 @@ class Precise {
         return (new Precise (string1)).div (string2Precise, precision).toString ()
     }
 
+    static stringMulAdd (string1, string2, string3) {
+        // stringAdd (stringMul (string1, string2), string3)
+        if ((string1 === undefined) || (string2 === undefined)) {
+            return string3
+        }
+        const product = (new Precise (string1)).mul (new Precise (string2))
+        if (string3 === undefined) {
+            return product.toString ()
+        }
+        return product.add (new Precise (string3)).toString ()
+    }
+
+    static stringMulMul (string1, string2, string3) {
+        // stringMul (stringMul (string1, string2), string3)
+        if ((string1 === undefined) || (string2 === undefined) || (string3 === undefined)) {
+            return undefined
+        }
+        return (new Precise (string1)).mul (new Precise (string2)).mul (new Precise (string3)).toString ()
+    }
+
+    static stringMulDiv (string1, string2, string3, precision = 18) {
+        // stringDiv (stringMul (string1, string2), string3, precision)
+        if ((string1 === undefined) || (string2 === undefined) || (string3 === undefined)) {
+            return undefined
+        }
+        const string3Precise = new Precise (string3)
+        if (string3Precise.integer === zero) {
+            return undefined
+        }
+        const product = (new Precise (string1)).mul (new Precise (string2))
+        // the division truncates the digits of the product as they would be parsed from its string
+        product.reduce ()
+        return product.div (string3Precise, precision).toString ()
+    }
+
     static stringAdd (string1, string2) {
         if ((string1 === undefined) && (string2 === undefined)) {
             return undefined
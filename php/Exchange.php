@@ -278,11 +278,24 @@ class Exchange {
         'signMessage' => 'sign_message',
         'signMessageString' => 'sign_message_string',
         'parseNumber' => 'parse_number',
+        'throttleApi' => 'throttle_api',
+        'calculateRateLimiterPriority' => 'calculate_rate_limiter_priority',
+        'isPublicRequest' => 'is_public_request',
+        'coalesceRequest' => 'coalesce_request',
+        'fetchRequest' => 'fetch_request',
+        'parseStreamed' => 'parse_streamed',
+        'deepExtendShared' => 'deep_extend_shared',
+        'compilePrecisionFormatters' => 'compile_precision_formatters',
+        'decimalToMarketPrecision' => 'decimal_to_market_precision',
+        'previousMarketValues' => 'previous_market_values',
+        'unchangedMarket' => 'unchanged_market',
+        'setMarketsChanges' => 'set_markets_changes',
         'checkOrderArguments' => 'check_order_arguments',
         'handleHttpStatusCode' => 'handle_http_status_code',
         'getDefaultOptions' => 'get_default_options',
         'safeLedgerEntry' => 'safe_ledger_entry',
         'setMarkets' => 'set_markets',
+        'hasHigherCurrencyPrecision' => 'has_higher_currency_precision',
         'safeBalance' => 'safe_balance',
         'safeOrder' => 'safe_order',
         'parseOrders' => 'parse_orders',
@@ -324,6 +337,7 @@ class Exchange {
         'marketId' => 'market_id',
         'resolvePath' => 'resolve_path',
         'filterByArray' => 'filter_by_array',
+        'sendRequest' => 'send_request',
         'loadAccounts' => 'load_accounts',
         'fetchTrades' => 'fetch_trades',
         'fetchOHLCVC' => 'fetch_ohlcvc',
@@ -1392,6 +1406,7 @@ class Exchange {
         $this->restRequestQueue = null;
         $this->restPollerLoopIsRunning = false;
         $this->enableRateLimit = true;
+        $this->coalesceRequests = false;
         $this->enableLastJsonResponse = true;
         $this->enableLastHttpResponse = true;
         $this->enableLastResponseHeaders = true;
@@ -2404,6 +2419,68 @@ class Exchange {
         sleep($milliseconds / 1000);
     }
 
+    public function throttle_api($api, $cost = null, $priority = null) {
+        // the python version throttles each api group with the buckets of its rateLimitBuckets, in the lanes of their priorities
+        return $this->throttle($cost);
+    }
+
+    public function calculate_rate_limiter_priority($api, $method, $path, $params, $config = array(), $context = array()) {
+        // the lane of the request in the python throttler, see rateLimitPriorities
+        return null;
+    }
+
+    public function is_public_request($api, $method, $params) {
+        // the python version coalesces the identical public requests with coalesceRequests
+        return false;
+    }
+
+    public function coalesce_request($path, $api = 'public', $method = 'GET', $params = array(), $headers = null, $body = null, $config = array(), $context = array()) {
+        return $this->send_request($path, $api, $method, $params, $headers, $body, $config, $context);
+    }
+
+    public function fetch_request($api, $request, $stream = null) {
+        // the python version adapts the rate limiter of the api group to the headers of the response, and streams the responses
+        return $this->fetch($request['url'], $request['method'], $request['headers'], $request['body']);
+    }
+
+    public function parse_streamed($name, $array, $argument = null, $since = null, $limit = null, $params = array()) {
+        // the python version parses the elements of a streamed response as they are decoded, see the stream param of fetch2
+        return null;
+    }
+
+    public function deep_extend_shared($defaults, $value) {
+        // the arrays are copied on write in php, the python version shares the nested dicts of the defaults
+        return static::deep_extend($defaults, $value);
+    }
+
+    public function compile_precision_formatters($markets) {
+        // the python version compiles the formatters of the precisions of the markets, see decimal_to_market_precision()
+        return null;
+    }
+
+    public function decimal_to_market_precision($x, $rounding_mode, $market, $key) {
+        return $this->decimal_to_precision($x, $rounding_mode, $market['precision'][$key], $this->precisionMode, $this->paddingMode);
+    }
+
+    public function previous_market_values($defaults) {
+        // the python version keeps the markets that did not change on reload, see unchanged_market()
+        return null;
+    }
+
+    public function unchanged_market($previous_markets, $previous_values, $value) {
+        return null;
+    }
+
+    public function set_markets_changes($previous_markets) {
+        // the python version reports the symbols that were added, removed and changed by a reload
+        return null;
+    }
+
+    public function record($name, $structure) {
+        // the python version returns the unified structure as a record with slots when its records option is enabled
+        return $structure;
+    }
+
     public function check_order_arguments ($market, $type, $side, $amount, $price, $params) {
         if ($price === null) {
             if ($type === 'limit') {
@@ -2512,7 +2589,7 @@ class Exchange {
             $fee['cost'] = $this->safe_number($fee, 'cost');
         }
         $timestamp = $this->safe_integer($entry, 'timestamp');
-        return array(
+        return $this->record ('ledger', array(
             'id' => $this->safe_string($entry, 'id'),
             'timestamp' => $timestamp,
             'datetime' => $this->iso8601 ($timestamp),
@@ -2528,26 +2605,46 @@ class Exchange {
             'status' => $this->safe_string($entry, 'status'),
             'fee' => $fee,
             'info' => $entry,
-        );
+        ));
     }
 
     public function set_markets($markets, $currencies = null) {
         $values = array();
+        // the common fields are merged once, not once for every entry
+        $defaults = $this->deep_extend($this->safe_market(), array(
+            'precision' => $this->precision,
+            'limits' => $this->limits,
+        ), $this->fees['trading']);
+        // on reload the entries that did not change are kept as they are
+        $previousMarkets = ($this->markets_by_id !== null) ? $this->markets : null;
+        $previousValues = $this->previous_market_values($defaults);
         $this->markets_by_id = array();
         // handle marketId conflicts
         // we insert spot $markets first
-        $marketValues = $this->sort_by($this->to_array($markets), 'spot', true);
+        $spotValues = array();
+        $otherValues = array();
+        $allValues = $this->to_array($markets);
+        for ($i = 0; $i < count($allValues); $i++) {
+            $value = $allValues[$i];
+            if ($value['spot']) {
+                $spotValues[] = $value;
+            } else {
+                $otherValues[] = $value;
+            }
+        }
+        $marketValues = $this->array_concat($spotValues, $otherValues);
         for ($i = 0; $i < count($marketValues); $i++) {
             $value = $marketValues[$i];
-            if (is_array($this->markets_by_id) && array_key_exists($value['id'], $this->markets_by_id)) {
-                $this->markets_by_id[$value['id']][] = $value;
+            $id = $value['id'];
+            if (is_array($this->markets_by_id) && array_key_exists($id, $this->markets_by_id)) {
+                $this->markets_by_id[$id][] = $value;
             } else {
-                $this->markets_by_id[$value['id']] = array( $value );
+                $this->markets_by_id[$id] = array( $value );
+            }
+            $market = $this->unchanged_market($previousMarkets, $previousValues, $value);
+            if ($market === null) {
+                $market = $this->deep_extend_shared($defaults, $value);
             }
-            $market = $this->deep_extend($this->safe_market(), array(
-                'precision' => $this->precision,
-                'limits' => $this->limits,
-            ), $this->fees['trading'], $value);
             $values[] = $market;
         }
         $this->markets = $this->index_by($values, 'symbol');
@@ -2556,13 +2653,16 @@ class Exchange {
         $this->symbols = is_array($marketsSortedBySymbol) ? array_keys($marketsSortedBySymbol) : array();
         $this->ids = is_array($marketsSortedById) ? array_keys($marketsSortedById) : array();
         if ($currencies !== null) {
-            $this->currencies = $this->deep_extend($this->currencies, $currencies);
+            $this->currencies = $this->deep_extend_shared($this->currencies, $currencies);
         } else {
+            $defaultCurrencyPrecision = ($this->precisionMode === DECIMAL_PLACES) ? 8 : $this->parse_number('1e-8');
             $baseCurrencies = array();
             $quoteCurrencies = array();
+            // the most precise entry of every base and of every quote, a quote entry replaces a base entry only if it is more precise
+            $highestPrecisionBaseCurrencies = array();
+            $highestPrecisionQuoteCurrencies = array();
             for ($i = 0; $i < count($values); $i++) {
                 $market = $values[$i];
-                $defaultCurrencyPrecision = ($this->precisionMode === DECIMAL_PLACES) ? 8 : $this->parse_number('1e-8');
                 $marketPrecision = $this->safe_value($market, 'precision', array());
                 if (is_array($market) && array_key_exists('base', $market)) {
                     $currencyPrecision = $this->safe_value_2($marketPrecision, 'base', 'amount', $defaultCurrencyPrecision);
@@ -2572,7 +2672,13 @@ class Exchange {
                         'code' => $this->safe_string($market, 'base'),
                         'precision' => $currencyPrecision,
                     );
-                    $baseCurrencies[] = $currency;
+                    $code = $currency['code'];
+                    if ($code !== null) {
+                        $baseCurrencies[$code] = $currency;
+                        if (!(is_array($highestPrecisionBaseCurrencies) && array_key_exists($code, $highestPrecisionBaseCurrencies)) || $this->has_higher_currency_precision($currency, $highestPrecisionBaseCurrencies[$code])) {
+                            $highestPrecisionBaseCurrencies[$code] = $currency;
+                        }
+                    }
                 }
                 if (is_array($market) && array_key_exists('quote', $market)) {
                     $currencyPrecision = $this->safe_value_2($marketPrecision, 'quote', 'price', $defaultCurrencyPrecision);
@@ -2582,40 +2688,43 @@ class Exchange {
                         'code' => $this->safe_string($market, 'quote'),
                         'precision' => $currencyPrecision,
                     );
-                    $quoteCurrencies[] = $currency;
+                    $code = $currency['code'];
+                    if ($code !== null) {
+                        $quoteCurrencies[$code] = $currency;
+                        if (!(is_array($highestPrecisionQuoteCurrencies) && array_key_exists($code, $highestPrecisionQuoteCurrencies)) || $this->has_higher_currency_precision($currency, $highestPrecisionQuoteCurrencies[$code])) {
+                            $highestPrecisionQuoteCurrencies[$code] = $currency;
+                        }
+                    }
                 }
             }
-            $baseCurrencies = $this->sort_by($baseCurrencies, 'code');
-            $quoteCurrencies = $this->sort_by($quoteCurrencies, 'code');
-            $this->baseCurrencies = $this->index_by($baseCurrencies, 'code');
-            $this->quoteCurrencies = $this->index_by($quoteCurrencies, 'code');
-            $allCurrencies = $this->array_concat($baseCurrencies, $quoteCurrencies);
-            $groupedCurrencies = $this->group_by($allCurrencies, 'code');
-            $codes = is_array($groupedCurrencies) ? array_keys($groupedCurrencies) : array();
-            $resultingCurrencies = array();
-            for ($i = 0; $i < count($codes); $i++) {
-                $code = $codes[$i];
-                $groupedCurrenciesCode = $this->safe_value($groupedCurrencies, $code, array());
-                $highestPrecisionCurrency = $this->safe_value($groupedCurrenciesCode, 0);
-                for ($j = 1; $j < count($groupedCurrenciesCode); $j++) {
-                    $currentCurrency = $groupedCurrenciesCode[$j];
-                    if ($this->precisionMode === TICK_SIZE) {
-                        $highestPrecisionCurrency = ($currentCurrency['precision'] < $highestPrecisionCurrency['precision']) ? $currentCurrency : $highestPrecisionCurrency;
-                    } else {
-                        $highestPrecisionCurrency = ($currentCurrency['precision'] > $highestPrecisionCurrency['precision']) ? $currentCurrency : $highestPrecisionCurrency;
-                    }
+            $this->baseCurrencies = $this->keysort ($baseCurrencies);
+            $this->quoteCurrencies = $this->keysort ($quoteCurrencies);
+            $resultingCurrencies = array_merge(array(), $highestPrecisionBaseCurrencies);
+            $quoteCodes = is_array($highestPrecisionQuoteCurrencies) ? array_keys($highestPrecisionQuoteCurrencies) : array();
+            for ($i = 0; $i < count($quoteCodes); $i++) {
+                $code = $quoteCodes[$i];
+                $quoteCurrency = $highestPrecisionQuoteCurrencies[$code];
+                if (!(is_array($resultingCurrencies) && array_key_exists($code, $resultingCurrencies)) || $this->has_higher_currency_precision($quoteCurrency, $resultingCurrencies[$code])) {
+                    $resultingCurrencies[$code] = $quoteCurrency;
                 }
-                $resultingCurrencies[] = $highestPrecisionCurrency;
             }
-            $sortedCurrencies = $this->sort_by($resultingCurrencies, 'code');
-            $this->currencies = $this->deep_extend($this->currencies, $this->index_by($sortedCurrencies, 'code'));
+            $this->currencies = $this->deep_extend_shared($this->currencies, $this->keysort ($resultingCurrencies));
         }
         $this->currencies_by_id = $this->index_by($this->currencies, 'id');
         $currenciesSortedByCode = $this->keysort ($this->currencies);
         $this->codes = is_array($currenciesSortedByCode) ? array_keys($currenciesSortedByCode) : array();
+        $this->compile_precision_formatters($values);
+        $this->set_markets_changes($previousMarkets);
         return $this->markets;
     }
 
+    public function has_higher_currency_precision($currency, $other) {
+        if ($this->precisionMode === TICK_SIZE) {
+            return $currency['precision'] < $other['precision'];
+        }
+        return $currency['precision'] > $other['precision'];
+    }
+
     public function safe_balance($balance) {
         $balances = $this->omit ($balance, array( 'info', 'timestamp', 'datetime', 'free', 'used', 'total' ));
         $codes = is_array($balances) ? array_keys($balances) : array();
@@ -2825,11 +2934,10 @@ class Exchange {
                 $multiplyPrice = $average;
             }
             // contract trading
-            $filledTimesContractSize = Precise::string_mul($filled, $contractSize);
             if ($inverse) {
-                $cost = Precise::string_div($filledTimesContractSize, $multiplyPrice);
+                $cost = Precise::string_mul_div($filled, $contractSize, $multiplyPrice);
             } else {
-                $cost = Precise::string_mul($filledTimesContractSize, $multiplyPrice);
+                $cost = Precise::string_mul_mul($filled, $contractSize, $multiplyPrice);
             }
         }
         // support for $market orders
@@ -2866,7 +2974,7 @@ class Exchange {
             // $timeInForce is not null here
             $postOnly = $timeInForce === 'PO';
         }
-        return array_merge($order, array(
+        return $this->record ('order', array_merge($order, array(
             'symbol' => $symbol,
             'side' => $side,
             'lastTradeTimestamp' => $lastTradeTimeTimestamp,
@@ -2879,10 +2987,14 @@ class Exchange {
             'timeInForce' => $timeInForce,
             'postOnly' => $postOnly,
             'trades' => $trades,
-        ));
+        )));
     }
 
     public function parse_orders($orders, $market = null, $since = null, $limit = null, $params = array ()) {
+        $streamed = $this->parse_streamed('orders', $orders, $market, $since, $limit, $params);
+        if ($streamed !== null) {
+            return $streamed;
+        }
         //
         // the value of $orders is either a dict or a list
         //
@@ -2984,15 +3096,13 @@ class Exchange {
         if ($cost === null) {
             // contract trading
             $contractSize = $this->safe_string($market, 'contractSize');
-            $multiplyPrice = $price;
             if ($contractSize !== null) {
                 $inverse = $this->safe_value($market, 'inverse', false);
-                if ($inverse) {
-                    $multiplyPrice = Precise::string_div('1', $price);
-                }
-                $multiplyPrice = Precise::string_mul($multiplyPrice, $contractSize);
+                $multiplyPrice = $inverse ? Precise::string_div('1', $price) : $price;
+                $cost = Precise::string_mul_mul($multiplyPrice, $contractSize, $amount);
+            } else {
+                $cost = Precise::string_mul($price, $amount);
             }
-            $cost = Precise::string_mul($multiplyPrice, $amount);
         }
         $parseFee = $this->safe_value($trade, 'fee') === null;
         $parseFees = $this->safe_value($trade, 'fees') === null;
@@ -3033,7 +3143,7 @@ class Exchange {
         $trade['amount'] = $this->parse_number($amount);
         $trade['price'] = $this->parse_number($price);
         $trade['cost'] = $this->parse_number($cost);
-        return $trade;
+        return $this->record ('trade', $trade);
     }
 
     public function reduce_fees_by_currency($fees) {
@@ -3149,14 +3259,14 @@ class Exchange {
             $percentage = Precise::string_mul(Precise::string_div($change, $open), '100');
         }
         if (($change === null) && ($percentage !== null) && ($open !== null)) {
-            $change = Precise::string_div(Precise::string_mul($percentage, $open), '100');
+            $change = Precise::string_mul_div($percentage, $open, '100');
         }
         if (($open === null) && ($last !== null) && ($change !== null)) {
             $open = Precise::string_sub($last, $change);
         }
         // timestamp and symbol operations don't belong in safeTicker
         // they should be done in the derived classes
-        return array_merge($ticker, array(
+        return $this->record ('ticker', array_merge($ticker, array(
             'bid' => $this->safe_number($ticker, 'bid'),
             'bidVolume' => $this->safe_number($ticker, 'bidVolume'),
             'ask' => $this->safe_number($ticker, 'ask'),
@@ -3173,7 +3283,7 @@ class Exchange {
             'baseVolume' => $this->parse_number($baseVolume),
             'quoteVolume' => $this->parse_number($quoteVolume),
             'previousClose' => $this->safe_number($ticker, 'previousClose'),
-        ));
+        )));
     }
 
     public function fetch_ohlcv($symbol, $timeframe = '1m', $since = null, $limit = null, $params = array ()) {
@@ -3517,6 +3627,10 @@ class Exchange {
     }
 
     public function parse_ohlcvs($ohlcvs, $market = null, $timeframe = '1m', $since = null, $limit = null) {
+        $streamed = $this->parse_streamed('ohlcvs', $ohlcvs, $market, $since, $limit);
+        if ($streamed !== null) {
+            return $streamed;
+        }
         $results = array();
         for ($i = 0; $i < count($ohlcvs); $i++) {
             $results[] = $this->parse_ohlcv($ohlcvs[$i], $market);
@@ -3579,6 +3693,10 @@ class Exchange {
     }
 
     public function parse_trades($trades, $market = null, $since = null, $limit = null, $params = array ()) {
+        $streamed = $this->parse_streamed('trades', $trades, $market, $since, $limit, $params);
+        if ($streamed !== null) {
+            return $streamed;
+        }
         $trades = $this->to_array($trades);
         $result = array();
         for ($i = 0; $i < count($trades); $i++) {
@@ -3592,6 +3710,10 @@ class Exchange {
     }
 
     public function parse_transactions($transactions, $currency = null, $since = null, $limit = null, $params = array ()) {
+        $streamed = $this->parse_streamed('transactions', $transactions, $currency, $since, $limit, $params);
+        if ($streamed !== null) {
+            return $streamed;
+        }
         $transactions = $this->to_array($transactions);
         $result = array();
         for ($i = 0; $i < count($transactions); $i++) {
@@ -3605,6 +3727,10 @@ class Exchange {
     }
 
     public function parse_transfers($transfers, $currency = null, $since = null, $limit = null, $params = array ()) {
+        $streamed = $this->parse_streamed('transfers', $transfers, $currency, $since, $limit, $params);
+        if ($streamed !== null) {
+            return $streamed;
+        }
         $transfers = $this->to_array($transfers);
         $result = array();
         for ($i = 0; $i < count($transfers); $i++) {
@@ -3680,13 +3806,27 @@ class Exchange {
     }
 
     public function fetch2($path, $api = 'public', $method = 'GET', $params = array (), $headers = null, $body = null, $config = array (), $context = array ()) {
+        if ($this->coalesceRequests && $this->is_public_request($api, $method, $params)) {
+            return $this->coalesce_request($path, $api, $method, $params, $headers, $body, $config, $context);
+        }
+        return $this->send_request($path, $api, $method, $params, $headers, $body, $config, $context);
+    }
+
+    public function send_request($path, $api = 'public', $method = 'GET', $params = array (), $headers = null, $body = null, $config = array (), $context = array (), $request = null) {
         if ($this->enableRateLimit) {
             $cost = $this->calculate_rate_limiter_cost($api, $method, $path, $params, $config, $context);
-            $this->throttle ($cost);
+            $priority = $this->calculate_rate_limiter_priority($api, $method, $path, $params, $config, $context);
+            $this->throttle_api($api, $cost, $priority);
+        }
+        $stream = $this->safe_value($params, 'stream');
+        if ((is_array($params) && array_key_exists('rateLimitPriority', $params)) || (is_array($params) && array_key_exists('stream', $params))) {
+            $params = $this->omit ($params, array( 'rateLimitPriority', 'stream' ));
         }
         $this->lastRestRequestTimestamp = $this->milliseconds ();
-        $request = $this->sign ($path, $api, $method, $params, $headers, $body);
-        return $this->fetch ($request['url'], $request['method'], $request['headers'], $request['body']);
+        if ($request === null) {
+            $request = $this->sign ($path, $api, $method, $params, $headers, $body);
+        }
+        return $this->fetch_request($api, $request, $stream);
     }
 
     public function request($path, $api = 'public', $method = 'GET', $params = array (), $headers = null, $body = null, $config = array (), $context = array ()) {
@@ -4266,12 +4406,12 @@ class Exchange {
 
     public function cost_to_precision($symbol, $cost) {
         $market = $this->market ($symbol);
-        return $this->decimal_to_precision($cost, TRUNCATE, $market['precision']['price'], $this->precisionMode, $this->paddingMode);
+        return $this->decimal_to_market_precision($cost, TRUNCATE, $market, 'price');
     }
 
     public function price_to_precision($symbol, $price) {
         $market = $this->market ($symbol);
-        $result = $this->decimal_to_precision($price, ROUND, $market['precision']['price'], $this->precisionMode, $this->paddingMode);
+        $result = $this->decimal_to_market_precision($price, ROUND, $market, 'price');
         if ($result === '0') {
             throw new ArgumentsRequired($this->id . ' $price of ' . $market['symbol'] . ' must be greater than minimum $price precision of ' . $this->number_to_string($market['precision']['price']));
         }
@@ -4280,7 +4420,7 @@ class Exchange {
 
     public function amount_to_precision($symbol, $amount) {
         $market = $this->market ($symbol);
-        $result = $this->decimal_to_precision($amount, TRUNCATE, $market['precision']['amount'], $this->precisionMode, $this->paddingMode);
+        $result = $this->decimal_to_market_precision($amount, TRUNCATE, $market, 'amount');
         if ($result === '0') {
             throw new ArgumentsRequired($this->id . ' $amount of ' . $market['symbol'] . ' must be greater than minimum $amount precision of ' . $this->number_to_string($market['precision']['amount']));
         }
@@ -4289,7 +4429,7 @@ class Exchange {
 
     public function fee_to_precision($symbol, $fee) {
         $market = $this->market ($symbol);
-        return $this->decimal_to_precision($fee, ROUND, $market['precision']['price'], $this->precisionMode, $this->paddingMode);
+        return $this->decimal_to_market_precision($fee, ROUND, $market, 'price');
     }
 
     public function currency_to_precision($code, $fee, $networkCode = null) {
@@ -4405,6 +4545,10 @@ class Exchange {
     }
 
     public function parse_tickers($tickers, $symbols = null, $params = array ()) {
+        $streamed = $this->parse_streamed('tickers', $tickers, $symbols, null, null, $params);
+        if ($streamed !== null) {
+            return $streamed;
+        }
         //
         // the value of $tickers is either a dict or a list
         //
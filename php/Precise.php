@@ -175,6 +175,41 @@ class Precise {
         return strval((new Precise($string1))->div($string2_precise, $precision));
     }
 
+    public static function string_mul_add($string1, $string2, $string3) {
+        // string_add(string_mul($string1, $string2), $string3)
+        if (($string1 === null) || ($string2 === null)) {
+            return $string3;
+        }
+        $product = (new Precise($string1))->mul(new Precise($string2));
+        if ($string3 === null) {
+            return strval($product);
+        }
+        return strval($product->add(new Precise($string3)));
+    }
+
+    public static function string_mul_mul($string1, $string2, $string3) {
+        // string_mul(string_mul($string1, $string2), $string3)
+        if (($string1 === null) || ($string2 === null) || ($string3 === null)) {
+            return null;
+        }
+        return strval((new Precise($string1))->mul(new Precise($string2))->mul(new Precise($string3)));
+    }
+
+    public static function string_mul_div($string1, $string2, $string3, $precision = 18) {
+        // string_div(string_mul($string1, $string2), $string3, $precision)
+        if (($string1 === null) || ($string2 === null) || ($string3 === null)) {
+            return null;
+        }
+        $string3_precise = new Precise($string3);
+        if (gmp_cmp($string3_precise->integer, '0') === 0) {
+            return null;
+        }
+        $product = (new Precise($string1))->mul(new Precise($string2));
+        // the division truncates the digits of the product as they would be parsed from its string
+        $product->reduce();
+        return strval($product->div($string3_precise, $precision));
+    }
+
     public static function string_add($string1, $string2) {
         if (($string1 === null) && ($string2 === null)) {
             return null;
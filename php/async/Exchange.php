@@ -279,7 +279,7 @@ class Exchange extends \ccxt\Exchange {
             $fee['cost'] = $this->safe_number($fee, 'cost');
         }
         $timestamp = $this->safe_integer($entry, 'timestamp');
-        return array(
+        return $this->record ('ledger', array(
             'id' => $this->safe_string($entry, 'id'),
             'timestamp' => $timestamp,
             'datetime' => $this->iso8601 ($timestamp),
@@ -295,26 +295,46 @@ class Exchange extends \ccxt\Exchange {
             'status' => $this->safe_string($entry, 'status'),
             'fee' => $fee,
             'info' => $entry,
-        );
+        ));
     }
 
     public function set_markets($markets, $currencies = null) {
         $values = array();
+        // the common fields are merged once, not once for every entry
+        $defaults = $this->deep_extend($this->safe_market(), array(
+            'precision' => $this->precision,
+            'limits' => $this->limits,
+        ), $this->fees['trading']);
+        // on reload the entries that did not change are kept as they are
+        $previousMarkets = ($this->markets_by_id !== null) ? $this->markets : null;
+        $previousValues = $this->previous_market_values($defaults);
         $this->markets_by_id = array();
         // handle marketId conflicts
         // we insert spot $markets first
-        $marketValues = $this->sort_by($this->to_array($markets), 'spot', true);
+        $spotValues = array();
+        $otherValues = array();
+        $allValues = $this->to_array($markets);
+        for ($i = 0; $i < count($allValues); $i++) {
+            $value = $allValues[$i];
+            if ($value['spot']) {
+                $spotValues[] = $value;
+            } else {
+                $otherValues[] = $value;
+            }
+        }
+        $marketValues = $this->array_concat($spotValues, $otherValues);
         for ($i = 0; $i < count($marketValues); $i++) {
             $value = $marketValues[$i];
-            if (is_array($this->markets_by_id) && array_key_exists($value['id'], $this->markets_by_id)) {
-                $this->markets_by_id[$value['id']][] = $value;
+            $id = $value['id'];
+            if (is_array($this->markets_by_id) && array_key_exists($id, $this->markets_by_id)) {
+                $this->markets_by_id[$id][] = $value;
             } else {
-                $this->markets_by_id[$value['id']] = array( $value );
+                $this->markets_by_id[$id] = array( $value );
+            }
+            $market = $this->unchanged_market($previousMarkets, $previousValues, $value);
+            if ($market === null) {
+                $market = $this->deep_extend_shared($defaults, $value);
             }
-            $market = $this->deep_extend($this->safe_market(), array(
-                'precision' => $this->precision,
-                'limits' => $this->limits,
-            ), $this->fees['trading'], $value);
             $values[] = $market;
         }
         $this->markets = $this->index_by($values, 'symbol');
@@ -323,13 +343,16 @@ class Exchange extends \ccxt\Exchange {
         $this->symbols = is_array($marketsSortedBySymbol) ? array_keys($marketsSortedBySymbol) : array();
         $this->ids = is_array($marketsSortedById) ? array_keys($marketsSortedById) : array();
         if ($currencies !== null) {
-            $this->currencies = $this->deep_extend($this->currencies, $currencies);
+            $this->currencies = $this->deep_extend_shared($this->currencies, $currencies);
         } else {
+            $defaultCurrencyPrecision = ($this->precisionMode === DECIMAL_PLACES) ? 8 : $this->parse_number('1e-8');
             $baseCurrencies = array();
             $quoteCurrencies = array();
+            // the most precise entry of every base and of every quote, a quote entry replaces a base entry only if it is more precise
+            $highestPrecisionBaseCurrencies = array();
+            $highestPrecisionQuoteCurrencies = array();
             for ($i = 0; $i < count($values); $i++) {
                 $market = $values[$i];
-                $defaultCurrencyPrecision = ($this->precisionMode === DECIMAL_PLACES) ? 8 : $this->parse_number('1e-8');
                 $marketPrecision = $this->safe_value($market, 'precision', array());
                 if (is_array($market) && array_key_exists('base', $market)) {
                     $currencyPrecision = $this->safe_value_2($marketPrecision, 'base', 'amount', $defaultCurrencyPrecision);
@@ -339,7 +362,13 @@ class Exchange extends \ccxt\Exchange {
                         'code' => $this->safe_string($market, 'base'),
                         'precision' => $currencyPrecision,
                     );
-                    $baseCurrencies[] = $currency;
+                    $code = $currency['code'];
+                    if ($code !== null) {
+                        $baseCurrencies[$code] = $currency;
+                        if (!(is_array($highestPrecisionBaseCurrencies) && array_key_exists($code, $highestPrecisionBaseCurrencies)) || $this->has_higher_currency_precision($currency, $highestPrecisionBaseCurrencies[$code])) {
+                            $highestPrecisionBaseCurrencies[$code] = $currency;
+                        }
+                    }
                 }
                 if (is_array($market) && array_key_exists('quote', $market)) {
                     $currencyPrecision = $this->safe_value_2($marketPrecision, 'quote', 'price', $defaultCurrencyPrecision);
@@ -349,40 +378,43 @@ class Exchange extends \ccxt\Exchange {
                         'code' => $this->safe_string($market, 'quote'),
                         'precision' => $currencyPrecision,
                     );
-                    $quoteCurrencies[] = $currency;
+                    $code = $currency['code'];
+                    if ($code !== null) {
+                        $quoteCurrencies[$code] = $currency;
+                        if (!(is_array($highestPrecisionQuoteCurrencies) && array_key_exists($code, $highestPrecisionQuoteCurrencies)) || $this->has_higher_currency_precision($currency, $highestPrecisionQuoteCurrencies[$code])) {
+                            $highestPrecisionQuoteCurrencies[$code] = $currency;
+                        }
+                    }
                 }
             }
-            $baseCurrencies = $this->sort_by($baseCurrencies, 'code');
-            $quoteCurrencies = $this->sort_by($quoteCurrencies, 'code');
-            $this->baseCurrencies = $this->index_by($baseCurrencies, 'code');
-            $this->quoteCurrencies = $this->index_by($quoteCurrencies, 'code');
-            $allCurrencies = $this->array_concat($baseCurrencies, $quoteCurrencies);
-            $groupedCurrencies = $this->group_by($allCurrencies, 'code');
-            $codes = is_array($groupedCurrencies) ? array_keys($groupedCurrencies) : array();
-            $resultingCurrencies = array();
-            for ($i = 0; $i < count($codes); $i++) {
-                $code = $codes[$i];
-                $groupedCurrenciesCode = $this->safe_value($groupedCurrencies, $code, array());
-                $highestPrecisionCurrency = $this->safe_value($groupedCurrenciesCode, 0);
-                for ($j = 1; $j < count($groupedCurrenciesCode); $j++) {
-                    $currentCurrency = $groupedCurrenciesCode[$j];
-                    if ($this->precisionMode === TICK_SIZE) {
-                        $highestPrecisionCurrency = ($currentCurrency['precision'] < $highestPrecisionCurrency['precision']) ? $currentCurrency : $highestPrecisionCurrency;
-                    } else {
-                        $highestPrecisionCurrency = ($currentCurrency['precision'] > $highestPrecisionCurrency['precision']) ? $currentCurrency : $highestPrecisionCurrency;
-                    }
+            $this->baseCurrencies = $this->keysort ($baseCurrencies);
+            $this->quoteCurrencies = $this->keysort ($quoteCurrencies);
+            $resultingCurrencies = array_merge(array(), $highestPrecisionBaseCurrencies);
+            $quoteCodes = is_array($highestPrecisionQuoteCurrencies) ? array_keys($highestPrecisionQuoteCurrencies) : array();
+            for ($i = 0; $i < count($quoteCodes); $i++) {
+                $code = $quoteCodes[$i];
+                $quoteCurrency = $highestPrecisionQuoteCurrencies[$code];
+                if (!(is_array($resultingCurrencies) && array_key_exists($code, $resultingCurrencies)) || $this->has_higher_currency_precision($quoteCurrency, $resultingCurrencies[$code])) {
+                    $resultingCurrencies[$code] = $quoteCurrency;
                 }
-                $resultingCurrencies[] = $highestPrecisionCurrency;
             }
-            $sortedCurrencies = $this->sort_by($resultingCurrencies, 'code');
-            $this->currencies = $this->deep_extend($this->currencies, $this->index_by($sortedCurrencies, 'code'));
+            $this->currencies = $this->deep_extend_shared($this->currencies, $this->keysort ($resultingCurrencies));
         }
         $this->currencies_by_id = $this->index_by($this->currencies, 'id');
         $currenciesSortedByCode = $this->keysort ($this->currencies);
         $this->codes = is_array($currenciesSortedByCode) ? array_keys($currenciesSortedByCode) : array();
+        $this->compile_precision_formatters($values);
+        $this->set_markets_changes($previousMarkets);
         return $this->markets;
     }
 
+    public function has_higher_currency_precision($currency, $other) {
+        if ($this->precisionMode === TICK_SIZE) {
+            return $currency['precision'] < $other['precision'];
+        }
+        return $currency['precision'] > $other['precision'];
+    }
+
     public function safe_balance($balance) {
         $balances = $this->omit ($balance, array( 'info', 'timestamp', 'datetime', 'free', 'used', 'total' ));
         $codes = is_array($balances) ? array_keys($balances) : array();
@@ -592,11 +624,10 @@ class Exchange extends \ccxt\Exchange {
                 $multiplyPrice = $average;
             }
             // contract trading
-            $filledTimesContractSize = Precise::string_mul($filled, $contractSize);
             if ($inverse) {
-                $cost = Precise::string_div($filledTimesContractSize, $multiplyPrice);
+                $cost = Precise::string_mul_div($filled, $contractSize, $multiplyPrice);
             } else {
-                $cost = Precise::string_mul($filledTimesContractSize, $multiplyPrice);
+                $cost = Precise::string_mul_mul($filled, $contractSize, $multiplyPrice);
             }
         }
         // support for $market orders
@@ -633,7 +664,7 @@ class Exchange extends \ccxt\Exchange {
             // $timeInForce is not null here
             $postOnly = $timeInForce === 'PO';
         }
-        return array_merge($order, array(
+        return $this->record ('order', array_merge($order, array(
             'symbol' => $symbol,
             'side' => $side,
             'lastTradeTimestamp' => $lastTradeTimeTimestamp,
@@ -646,10 +677,14 @@ class Exchange extends \ccxt\Exchange {
             'timeInForce' => $timeInForce,
             'postOnly' => $postOnly,
             'trades' => $trades,
-        ));
+        )));
     }
 
     public function parse_orders($orders, $market = null, $since = null, $limit = null, $params = array ()) {
+        $streamed = $this->parse_streamed('orders', $orders, $market, $since, $limit, $params);
+        if ($streamed !== null) {
+            return $streamed;
+        }
         //
         // the value of $orders is either a dict or a list
         //
@@ -751,15 +786,13 @@ class Exchange extends \ccxt\Exchange {
         if ($cost === null) {
             // contract trading
             $contractSize = $this->safe_string($market, 'contractSize');
-            $multiplyPrice = $price;
             if ($contractSize !== null) {
                 $inverse = $this->safe_value($market, 'inverse', false);
-                if ($inverse) {
-                    $multiplyPrice = Precise::string_div('1', $price);
-                }
-                $multiplyPrice = Precise::string_mul($multiplyPrice, $contractSize);
+                $multiplyPrice = $inverse ? Precise::string_div('1', $price) : $price;
+                $cost = Precise::string_mul_mul($multiplyPrice, $contractSize, $amount);
+            } else {
+                $cost = Precise::string_mul($price, $amount);
             }
-            $cost = Precise::string_mul($multiplyPrice, $amount);
         }
         $parseFee = $this->safe_value($trade, 'fee') === null;
         $parseFees = $this->safe_value($trade, 'fees') === null;
@@ -800,7 +833,7 @@ class Exchange extends \ccxt\Exchange {
         $trade['amount'] = $this->parse_number($amount);
         $trade['price'] = $this->parse_number($price);
         $trade['cost'] = $this->parse_number($cost);
-        return $trade;
+        return $this->record ('trade', $trade);
     }
 
     public function reduce_fees_by_currency($fees) {
@@ -916,14 +949,14 @@ class Exchange extends \ccxt\Exchange {
             $percentage = Precise::string_mul(Precise::string_div($change, $open), '100');
         }
         if (($change === null) && ($percentage !== null) && ($open !== null)) {
-            $change = Precise::string_div(Precise::string_mul($percentage, $open), '100');
+            $change = Precise::string_mul_div($percentage, $open, '100');
         }
         if (($open === null) && ($last !== null) && ($change !== null)) {
             $open = Precise::string_sub($last, $change);
         }
         // timestamp and symbol operations don't belong in safeTicker
         // they should be done in the derived classes
-        return array_merge($ticker, array(
+        return $this->record ('ticker', array_merge($ticker, array(
             'bid' => $this->safe_number($ticker, 'bid'),
             'bidVolume' => $this->safe_number($ticker, 'bidVolume'),
             'ask' => $this->safe_number($ticker, 'ask'),
@@ -940,7 +973,7 @@ class Exchange extends \ccxt\Exchange {
             'baseVolume' => $this->parse_number($baseVolume),
             'quoteVolume' => $this->parse_number($quoteVolume),
             'previousClose' => $this->safe_number($ticker, 'previousClose'),
-        ));
+        )));
     }
 
     public function fetch_ohlcv($symbol, $timeframe = '1m', $since = null, $limit = null, $params = array ()) {
@@ -1288,6 +1321,10 @@ class Exchange extends \ccxt\Exchange {
     }
 
     public function parse_ohlcvs($ohlcvs, $market = null, $timeframe = '1m', $since = null, $limit = null) {
+        $streamed = $this->parse_streamed('ohlcvs', $ohlcvs, $market, $since, $limit);
+        if ($streamed !== null) {
+            return $streamed;
+        }
         $results = array();
         for ($i = 0; $i < count($ohlcvs); $i++) {
             $results[] = $this->parse_ohlcv($ohlcvs[$i], $market);
@@ -1352,6 +1389,10 @@ class Exchange extends \ccxt\Exchange {
     }
 
     public function parse_trades($trades, $market = null, $since = null, $limit = null, $params = array ()) {
+        $streamed = $this->parse_streamed('trades', $trades, $market, $since, $limit, $params);
+        if ($streamed !== null) {
+            return $streamed;
+        }
         $trades = $this->to_array($trades);
         $result = array();
         for ($i = 0; $i < count($trades); $i++) {
@@ -1365,6 +1406,10 @@ class Exchange extends \ccxt\Exchange {
     }
 
     public function parse_transactions($transactions, $currency = null, $since = null, $limit = null, $params = array ()) {
+        $streamed = $this->parse_streamed('transactions', $transactions, $currency, $since, $limit, $params);
+        if ($streamed !== null) {
+            return $streamed;
+        }
         $transactions = $this->to_array($transactions);
         $result = array();
         for ($i = 0; $i < count($transactions); $i++) {
@@ -1378,6 +1423,10 @@ class Exchange extends \ccxt\Exchange {
     }
 
     public function parse_transfers($transfers, $currency = null, $since = null, $limit = null, $params = array ()) {
+        $streamed = $this->parse_streamed('transfers', $transfers, $currency, $since, $limit, $params);
+        if ($streamed !== null) {
+            return $streamed;
+        }
         $transfers = $this->to_array($transfers);
         $result = array();
         for ($i = 0; $i < count($transfers); $i++) {
@@ -1454,13 +1503,29 @@ class Exchange extends \ccxt\Exchange {
 
     public function fetch2($path, $api = 'public', $method = 'GET', $params = array (), $headers = null, $body = null, $config = array (), $context = array ()) {
         return Async\async(function () use ($path, $api, $method, $params, $headers, $body, $config, $context) {
+            if ($this->coalesceRequests && $this->is_public_request($api, $method, $params)) {
+                return Async\await($this->coalesce_request($path, $api, $method, $params, $headers, $body, $config, $context));
+            }
+            return Async\await($this->send_request($path, $api, $method, $params, $headers, $body, $config, $context));
+        }) ();
+    }
+
+    public function send_request($path, $api = 'public', $method = 'GET', $params = array (), $headers = null, $body = null, $config = array (), $context = array (), $request = null) {
+        return Async\async(function () use ($path, $api, $method, $params, $headers, $body, $config, $context, $request) {
             if ($this->enableRateLimit) {
                 $cost = $this->calculate_rate_limiter_cost($api, $method, $path, $params, $config, $context);
-                Async\await($this->throttle ($cost));
+                $priority = $this->calculate_rate_limiter_priority($api, $method, $path, $params, $config, $context);
+                Async\await($this->throttle_api($api, $cost, $priority));
+            }
+            $stream = $this->safe_value($params, 'stream');
+            if ((is_array($params) && array_key_exists('rateLimitPriority', $params)) || (is_array($params) && array_key_exists('stream', $params))) {
+                $params = $this->omit ($params, array( 'rateLimitPriority', 'stream' ));
             }
             $this->lastRestRequestTimestamp = $this->milliseconds ();
-            $request = $this->sign ($path, $api, $method, $params, $headers, $body);
-            return Async\await($this->fetch ($request['url'], $request['method'], $request['headers'], $request['body']));
+            if ($request === null) {
+                $request = $this->sign ($path, $api, $method, $params, $headers, $body);
+            }
+            return Async\await($this->fetch_request($api, $request, $stream));
         }) ();
     }
 
@@ -2095,12 +2160,12 @@ class Exchange extends \ccxt\Exchange {
 
     public function cost_to_precision($symbol, $cost) {
         $market = $this->market ($symbol);
-        return $this->decimal_to_precision($cost, TRUNCATE, $market['precision']['price'], $this->precisionMode, $this->paddingMode);
+        return $this->decimal_to_market_precision($cost, TRUNCATE, $market, 'price');
     }
 
     public function price_to_precision($symbol, $price) {
         $market = $this->market ($symbol);
-        $result = $this->decimal_to_precision($price, ROUND, $market['precision']['price'], $this->precisionMode, $this->paddingMode);
+        $result = $this->decimal_to_market_precision($price, ROUND, $market, 'price');
         if ($result === '0') {
             throw new ArgumentsRequired($this->id . ' $price of ' . $market['symbol'] . ' must be greater than minimum $price precision of ' . $this->number_to_string($market['precision']['price']));
         }
@@ -2109,7 +2174,7 @@ class Exchange extends \ccxt\Exchange {
 
     public function amount_to_precision($symbol, $amount) {
         $market = $this->market ($symbol);
-        $result = $this->decimal_to_precision($amount, TRUNCATE, $market['precision']['amount'], $this->precisionMode, $this->paddingMode);
+        $result = $this->decimal_to_market_precision($amount, TRUNCATE, $market, 'amount');
         if ($result === '0') {
             throw new ArgumentsRequired($this->id . ' $amount of ' . $market['symbol'] . ' must be greater than minimum $amount precision of ' . $this->number_to_string($market['precision']['amount']));
         }
@@ -2118,7 +2183,7 @@ class Exchange extends \ccxt\Exchange {
 
     public function fee_to_precision($symbol, $fee) {
         $market = $this->market ($symbol);
-        return $this->decimal_to_precision($fee, ROUND, $market['precision']['price'], $this->precisionMode, $this->paddingMode);
+        return $this->decimal_to_market_precision($fee, ROUND, $market, 'price');
     }
 
     public function currency_to_precision($code, $fee, $networkCode = null) {
@@ -2248,6 +2313,10 @@ class Exchange extends \ccxt\Exchange {
     }
 
     public function parse_tickers($tickers, $symbols = null, $params = array ()) {
+        $streamed = $this->parse_streamed('tickers', $tickers, $symbols, null, null, $params);
+        if ($streamed !== null) {
+            return $streamed;
+        }
         //
         // the value of $tickers is either a dict or a list
         //
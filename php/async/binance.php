@@ -25,6 +25,39 @@ class binance extends Exchange {
             'name' => 'Binance',
             'countries' => array( 'JP', 'MT' ), // Japan, Malta
             'rateLimit' => 50,
+            'tokenBucket' => array(
+                // the used weight reported by the exchange, see adaptiveRateLimit
+                'headers' => array(
+                    'x-mbx-used-weight-1m' => array( 'limit' => 1200, 'cost' => 1 ),
+                ),
+            ),
+            // the futures and the sapi endpoints are metered separately from the spot api
+            'rateLimitBuckets' => array(
+                'sapi' => array(
+                    // IP(sapi) request rate limit of 12 000 per minute, 1 IP(sapi) => cost = 0.1
+                    'apis' => array( 'sapi', 'sapiV2', 'sapiV3' ),
+                    'refillRate' => 0.02,
+                    'headers' => array(
+                        'x-sapi-used-ip-weight-1m' => array( 'limit' => 12000, 'cost' => 0.1 ),
+                    ),
+                ),
+                'fapi' => array(
+                    // 2400 weight per minute, the fapi costs are the weights
+                    'apis' => array( 'fapiPublic', 'fapiData', 'fapiPrivate', 'fapiPrivateV2' ),
+                    'refillRate' => 0.04,
+                    'headers' => array(
+                        'x-mbx-used-weight-1m' => array( 'limit' => 2400, 'cost' => 1 ),
+                    ),
+                ),
+                'dapi' => array(
+                    // 2400 weight per minute, the dapi costs are the weights
+                    'apis' => array( 'dapiPublic', 'dapiData', 'dapiPrivate', 'dapiPrivateV2' ),
+                    'refillRate' => 0.04,
+                    'headers' => array(
+                        'x-mbx-used-weight-1m' => array( 'limit' => 2400, 'cost' => 1 ),
+                    ),
+                ),
+            ),
             'certified' => true,
             'pro' => true,
             // new metainfo interface
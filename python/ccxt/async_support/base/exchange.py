@@ -7,6 +7,7 @@ __version__ = '2.4.78'
 # -----------------------------------------------------------------------------
 
 import asyncio
+import collections.abc
 import concurrent.futures
 import socket
 import certifi
@@ -18,6 +19,7 @@ import yarl
 # -----------------------------------------------------------------------------
 
 from ccxt.async_support.base.throttler import Throttler
+from ccxt.base.json_stream import JsonArrayParser, AsyncStreamedArray
 
 # -----------------------------------------------------------------------------
 
@@ -46,8 +48,55 @@ __all__ = [
 # -----------------------------------------------------------------------------
 
 
+class ResponseHeaders(collections.abc.Mapping):
+    """the headers of a lean response, copied from the CIMultiDictProxy of aiohttp when they are first read"""
+
+    def __init__(self, raw_headers):
+        self.raw_headers = raw_headers
+        self.headers = None
+
+    @staticmethod
+    def copy(raw_headers):
+        # a header that is sent several times is joined into one
+        headers = {}
+        for header in raw_headers:
+            if header in headers:
+                headers[header] = headers[header] + ', ' + raw_headers[header]
+            else:
+                headers[header] = raw_headers[header]
+        return headers
+
+    def get_headers(self):
+        if self.headers is None:
+            self.headers = self.copy(self.raw_headers)
+            self.raw_headers = None
+        return self.headers
+
+    def __getitem__(self, key):
+        return self.get_headers()[key]
+
+    def __iter__(self):
+        return iter(self.get_headers())
+
+    def __len__(self):
+        return len(self.get_headers())
+
+    def __repr__(self):
+        return repr(self.get_headers())
+
+# -----------------------------------------------------------------------------
+
+
 class Exchange(BaseExchange):
     synchronous = False
+    aiohttp_limit = 100  # the connections of a connector, 0 for no limit
+    aiohttp_limit_per_host = 0  # the connections of a connector to a single host, 0 for no limit
+    aiohttp_ttl_dns_cache = 10  # seconds, None to cache the resolved hosts forever
+    aiohttp_keepalive_timeout = 15  # seconds that an idle connection is kept open
+    aiohttp_shared_session = False  # instances with the same settings share one session and connector in the event loop
+    aiohttp_sessions = {}  # the shared sessions and the number of their open instances by settings, see open()
+    ssl_contexts = {}  # by cafile, loading the certificates takes longer than creating a session
+    session_key = None  # the key of the shared session in aiohttp_sessions
 
     def __init__(self, config={}):
         if 'asyncio_loop' in config:
@@ -63,7 +112,66 @@ class Exchange(BaseExchange):
         self.reloading_markets = False
 
     def init_rest_rate_limiter(self):
-        self.throttle = Throttler(self.tokenBucket, self.asyncio_loop)
+        self.throttle = Throttler(self.get_throttler_config(self.tokenBucket), self.asyncio_loop)
+        self.init_rate_limit_buckets(Throttler, self.asyncio_loop)
+
+    async def throttle_api(self, api, cost=None, priority=0):
+        for throttle in self.get_api_throttles(api):
+            await throttle(cost, priority)
+
+    async def coalesce_request(self, path, api='public', method='GET', params={}, headers=None, body=None, config={}, context={}):
+        """
+        sends a public request once for all the coroutines that make it at the same time, the request is signed before it is throttled
+        so that the requests that join one in flight take no tokens, all of them get the same decoded response that must not be modified
+        the call runs in a task of its own, a caller that is cancelled does not cancel it for the others
+        """
+        request = self.sign(path, api, method, self.omit(params, 'rateLimitPriority'), headers, body)
+        key = (request['method'], request['url'], request['body'])
+        cached = self.get_coalesced_response(key)
+        if cached is not None:
+            return cached[1]
+        task = self.coalesced_requests.get(key)
+        if task is None:
+            self.coalesce_metrics['requests'] += 1
+            task = asyncio.ensure_future(self.send_request(path, api, method, params, headers, body, config, context, request))
+            self.coalesced_requests[key] = task
+
+            def done(task):
+                del self.coalesced_requests[key]
+                if not task.cancelled() and task.exception() is None:
+                    self.set_coalesced_response(key, task.result())
+
+            task.add_done_callback(done)
+        else:
+            self.coalesce_metrics['coalesced'] += 1
+        return await asyncio.shield(task)
+
+    def get_rate_limit_context(self):
+        # the request made by fetch2() in the current task
+        if sys.version_info >= (3, 7):
+            return asyncio.current_task()
+        return asyncio.Task.current_task()
+
+    async def fetch_request(self, api, request, stream=None):
+        """
+        fetch() of a request signed by fetch2(), the headers of the response adapt the rate limiter of the api group when adaptiveRateLimit is enabled
+        :param str|list api: the api group of the request
+        :param dict request: the url, method, headers and body returned by sign()
+        :param bool|list stream: the stream param of fetch2(), True or the path of keys of the array to stream with fetch_stream()
+        :returns: the decoded response
+        """
+        args = [request['url'], request['method'], request['headers'], request['body']]
+        fetch = self.fetch
+        if stream:
+            fetch = self.fetch_stream
+            args.append(None if stream is True else stream)
+        if not self.adaptiveRateLimit:
+            return await fetch(*args)
+        self.rate_limit_responses[self.get_rate_limit_context()] = None
+        try:
+            return await fetch(*args)
+        finally:
+            self.adapt_rate_limit(api)
 
     def __del__(self):
         if self.session is not None:
@@ -84,16 +192,52 @@ class Exchange(BaseExchange):
             else:
                 self.asyncio_loop = asyncio.get_event_loop()
             self.throttle.loop = self.asyncio_loop
+            for throttle in self.throttles.values():
+                throttle.loop = self.asyncio_loop
         if self.own_session and self.session is None:
-            # Create our SSL context object with our CA cert file
-            context = ssl.create_default_context(cafile=self.cafile) if self.verify else self.verify
-            # Pass this SSL context to aiohttp and create a TCPConnector
-            connector = aiohttp.TCPConnector(ssl=context, loop=self.asyncio_loop, enable_cleanup_closed=True)
-            self.session = aiohttp.ClientSession(loop=self.asyncio_loop, connector=connector, trust_env=self.aiohttp_trust_env)
+            if self.aiohttp_shared_session:
+                key = (self.asyncio_loop, self.verify, self.cafile, self.aiohttp_trust_env, self.aiohttp_proxy, self.aiohttp_limit, self.aiohttp_limit_per_host, self.aiohttp_ttl_dns_cache, self.aiohttp_keepalive_timeout)
+                shared = Exchange.aiohttp_sessions.get(key)
+                if shared is None or shared[0].closed:
+                    shared = [self.create_session(), 0]
+                    Exchange.aiohttp_sessions[key] = shared
+                shared[1] += 1
+                self.session = shared[0]
+                self.session_key = key
+            else:
+                self.session = self.create_session()
+
+    def create_session(self):
+        # Create our SSL context object with our CA cert file
+        context = self.verify
+        if self.verify:
+            if self.cafile not in Exchange.ssl_contexts:
+                Exchange.ssl_contexts[self.cafile] = ssl.create_default_context(cafile=self.cafile)
+            context = Exchange.ssl_contexts[self.cafile]
+        # Pass this SSL context to aiohttp and create a TCPConnector
+        connector = aiohttp.TCPConnector(
+            ssl=context,
+            loop=self.asyncio_loop,
+            enable_cleanup_closed=True,
+            limit=self.aiohttp_limit,
+            limit_per_host=self.aiohttp_limit_per_host,
+            ttl_dns_cache=self.aiohttp_ttl_dns_cache,
+            keepalive_timeout=self.aiohttp_keepalive_timeout,
+        )
+        return aiohttp.ClientSession(loop=self.asyncio_loop, connector=connector, trust_env=self.aiohttp_trust_env)
 
     async def close(self):
         if self.session is not None:
-            if self.own_session:
+            if self.session_key is not None:
+                # the shared session is closed by the last instance that uses it
+                shared = Exchange.aiohttp_sessions.get(self.session_key)
+                if shared is not None and shared[0] is self.session:
+                    shared[1] -= 1
+                    if shared[1] == 0:
+                        del Exchange.aiohttp_sessions[self.session_key]
+                        await self.session.close()
+                self.session_key = None
+            elif self.own_session:
                 await self.session.close()
             self.session = None
 
@@ -121,23 +265,23 @@ class Exchange(BaseExchange):
                                       headers=request_headers,
                                       timeout=(self.timeout / 1000),
                                       proxy=self.aiohttp_proxy) as response:
-                http_response = await response.text(errors='replace')
-                # CIMultiDictProxy
-                raw_headers = response.headers
-                headers = {}
-                for header in raw_headers:
-                    if header in headers:
-                        headers[header] = headers[header] + ', ' + raw_headers[header]
-                    else:
-                        headers[header] = raw_headers[header]
+                if self.lean_responses:
+                    # the body is decoded without looking for its charset and the headers are copied when they are used
+                    http_response, content = self.lean_response_body(await response.read())
+                    headers = ResponseHeaders(response.headers)
+                else:
+                    http_response, content = await response.text(errors='replace'), None
+                    headers = ResponseHeaders.copy(response.headers)
                 http_status_code = response.status
                 http_status_text = response.reason
                 http_response = self.on_rest_response(http_status_code, http_status_text, url, method, headers, http_response, request_headers, request_body)
-                json_response = self.parse_json(http_response)
+                json_response = self.parse_json(http_response, content)
                 if self.enableLastHttpResponse:
                     self.last_http_response = http_response
                 if self.enableLastResponseHeaders:
                     self.last_response_headers = headers
+                if self.adaptiveRateLimit:
+                    self.set_rate_limit_response(http_status_code, headers)
                 if self.enableLastJsonResponse:
                     self.last_json_response = json_response
                 if self.verbose:
@@ -168,17 +312,108 @@ class Exchange(BaseExchange):
             return http_response
         return response.content
 
+    async def fetch_stream(self, url, method='GET', headers=None, body=None, path=None):
+        """
+        Perform a HTTP request and return an AsyncStreamedArray of the elements of the json array at the path of keys in the response,
+        decoded while the response is received, pass params={'stream': True} or {'stream': [key, ...]} to a method to use it
+        a response that does not start like the array or that has an error status is read whole and handled like fetch() does
+        the response around the array is not returned, the methods that read the array out of it with safe_value() raise a TypeError
+        """
+        request_headers = self.prepare_request_headers(headers)
+        url = self.proxy + url
+
+        if self.verbose:
+            self.log("\nfetch Request:", self.id, method, url, "RequestHeaders:", request_headers, "RequestBody:", body)
+        self.logger.debug("%s %s, Request: %s %s", method, url, headers, body)
+
+        request_body = body
+        encoded_body = body.encode() if body else None
+        self.open()
+        session_method = getattr(self.session, method.lower())
+        details = ' '.join([self.id, method, url])
+
+        async def read(stream):
+            try:
+                return await stream()
+            except socket.gaierror as e:
+                raise ExchangeNotAvailable(details) from e
+            except (concurrent.futures.TimeoutError, asyncio.TimeoutError) as e:
+                raise RequestTimeout(details) from e
+            except aiohttp.ClientConnectionError as e:
+                raise ExchangeNotAvailable(details) from e
+            except aiohttp.ClientError as e:  # base exception class
+                raise ExchangeError(details) from e
+
+        # the timeout bounds every read of the stream instead of the whole response, that is read as fast as it is consumed
+        timeout = aiohttp.ClientTimeout(sock_connect=self.timeout / 1000, sock_read=self.timeout / 1000)
+        response = await read(lambda: session_method(yarl.URL(url, encoded=True),
+                                                     data=encoded_body,
+                                                     headers=request_headers,
+                                                     timeout=timeout,
+                                                     proxy=self.aiohttp_proxy))
+        streaming = False
+        try:
+            first = b''
+            while not first.strip():
+                chunk = await read(response.content.readany)
+                if not chunk:
+                    break
+                first += chunk
+            headers = ResponseHeaders.copy(response.headers)
+            http_status_code = response.status
+            http_status_text = response.reason
+            if http_status_code < 400 and first.lstrip()[:1] == (b'{' if path else b'['):
+                if self.verbose:
+                    self.log("\nfetch Response:", self.id, method, url, http_status_code, "ResponseHeaders:", headers, "ResponseBody: streamed")
+                self.logger.debug("%s %s, Response: %s %s streamed", method, url, http_status_code, headers)
+                if self.adaptiveRateLimit:
+                    self.set_rate_limit_response(http_status_code, headers)
+
+                async def chunks():
+                    yield first
+                    while True:
+                        chunk = await read(response.content.readany)
+                        if not chunk:
+                            break
+                        yield chunk
+
+                def finish(parser):
+                    self.handle_stream_end(parser, path, http_status_code, http_status_text, url, method, headers, request_headers, request_body)
+
+                # the connection is released by the stream
+                streaming = True
+                return AsyncStreamedArray(chunks(), JsonArrayParser(path, self.quoteJsonNumbers), response.release, finish)
+            content = first + await read(response.content.read)
+        finally:
+            if not streaming:
+                response.release()
+        http_response = self.on_rest_response(http_status_code, http_status_text, url, method, headers, content.decode('utf-8', 'replace'), request_headers, request_body)
+        json_response = self.parse_json(http_response)
+        if self.adaptiveRateLimit:
+            self.set_rate_limit_response(http_status_code, headers)
+        if self.verbose:
+            self.log("\nfetch Response:", self.id, method, url, http_status_code, "ResponseHeaders:", headers, "ResponseBody:", http_response)
+        self.logger.debug("%s %s, Response: %s %s %s", method, url, http_status_code, headers, http_response)
+        self.handle_errors(http_status_code, http_status_text, url, method, headers, http_response, json_response, request_headers, request_body)
+        self.handle_http_status_code(http_status_code, http_status_text, url, method, http_response)
+        return json_response if json_response is not None else http_response
+
     async def load_markets_helper(self, reload=False, params={}):
         if not reload:
             if self.markets:
                 if not self.markets_by_id:
                     return self.set_markets(self.markets)
                 return self.markets
+            if (self.shared_markets or self.markets_cache_path) and self.restore_markets(params):
+                return self.markets
         currencies = None
         if self.has['fetchCurrencies'] is True:
             currencies = await self.fetch_currencies()
         markets = await self.fetch_markets(params)
-        return self.set_markets(markets, currencies)
+        result = self.set_markets(markets, currencies)
+        if self.shared_markets or self.markets_cache_path:
+            self.store_markets(params)
+        return result
 
     async def load_markets(self, reload=False, params={}):
         if (reload and not self.reloading_markets) or not self.markets_loading:
@@ -195,6 +430,10 @@ class Exchange(BaseExchange):
         self.reloading_markets = False
         return result
 
+    async def reload_markets(self, params={}):
+        await self.load_markets(True, params)
+        return self.markets_changes
+
     async def fetch_fees(self):
         trading = {}
         funding = {}
@@ -315,7 +554,7 @@ class Exchange(BaseExchange):
         if fee is not None:
             fee['cost'] = self.safe_number(fee, 'cost')
         timestamp = self.safe_integer(entry, 'timestamp')
-        return {
+        return self.record('ledger', {
             'id': self.safe_string(entry, 'id'),
             'timestamp': timestamp,
             'datetime': self.iso8601(timestamp),
@@ -331,24 +570,41 @@ class Exchange(BaseExchange):
             'status': self.safe_string(entry, 'status'),
             'fee': fee,
             'info': entry,
-        }
+        })
 
     def set_markets(self, markets, currencies=None):
         values = []
+        # the common fields are merged once, not once for every entry
+        defaults = self.deep_extend(self.safe_market(), {
+            'precision': self.precision,
+            'limits': self.limits,
+        }, self.fees['trading'])
+        # on reload the entries that did not change are kept as they are
+        previousMarkets = self.markets if (self.markets_by_id is not None) else None
+        previousValues = self.previous_market_values(defaults)
         self.markets_by_id = {}
         # handle marketId conflicts
         # we insert spot markets first
-        marketValues = self.sort_by(self.to_array(markets), 'spot', True)
+        spotValues = []
+        otherValues = []
+        allValues = self.to_array(markets)
+        for i in range(0, len(allValues)):
+            value = allValues[i]
+            if value['spot']:
+                spotValues.append(value)
+            else:
+                otherValues.append(value)
+        marketValues = self.array_concat(spotValues, otherValues)
         for i in range(0, len(marketValues)):
             value = marketValues[i]
-            if value['id'] in self.markets_by_id:
-                self.markets_by_id[value['id']].append(value)
+            id = value['id']
+            if id in self.markets_by_id:
+                self.markets_by_id[id].append(value)
             else:
-                self.markets_by_id[value['id']] = [value]
-            market = self.deep_extend(self.safe_market(), {
-                'precision': self.precision,
-                'limits': self.limits,
-            }, self.fees['trading'], value)
+                self.markets_by_id[id] = [value]
+            market = self.unchanged_market(previousMarkets, previousValues, value)
+            if market is None:
+                market = self.deep_extend_shared(defaults, value)
             values.append(market)
         self.markets = self.index_by(values, 'symbol')
         marketsSortedBySymbol = self.keysort(self.markets)
@@ -356,13 +612,16 @@ class Exchange(BaseExchange):
         self.symbols = list(marketsSortedBySymbol.keys())
         self.ids = list(marketsSortedById.keys())
         if currencies is not None:
-            self.currencies = self.deep_extend(self.currencies, currencies)
+            self.currencies = self.deep_extend_shared(self.currencies, currencies)
         else:
-            baseCurrencies = []
-            quoteCurrencies = []
+            defaultCurrencyPrecision = 8 if (self.precisionMode == DECIMAL_PLACES) else self.parse_number('1e-8')
+            baseCurrencies = {}
+            quoteCurrencies = {}
+            # the most precise entry of every base and of every quote, a quote entry replaces a base entry only if it is more precise
+            highestPrecisionBaseCurrencies = {}
+            highestPrecisionQuoteCurrencies = {}
             for i in range(0, len(values)):
                 market = values[i]
-                defaultCurrencyPrecision = 8 if (self.precisionMode == DECIMAL_PLACES) else self.parse_number('1e-8')
                 marketPrecision = self.safe_value(market, 'precision', {})
                 if 'base' in market:
                     currencyPrecision = self.safe_value_2(marketPrecision, 'base', 'amount', defaultCurrencyPrecision)
@@ -372,7 +631,11 @@ class Exchange(BaseExchange):
                         'code': self.safe_string(market, 'base'),
                         'precision': currencyPrecision,
                     }
-                    baseCurrencies.append(currency)
+                    code = currency['code']
+                    if code is not None:
+                        baseCurrencies[code] = currency
+                        if not (code in highestPrecisionBaseCurrencies) or self.has_higher_currency_precision(currency, highestPrecisionBaseCurrencies[code]):
+                            highestPrecisionBaseCurrencies[code] = currency
                 if 'quote' in market:
                     currencyPrecision = self.safe_value_2(marketPrecision, 'quote', 'price', defaultCurrencyPrecision)
                     currency = {
@@ -381,33 +644,33 @@ class Exchange(BaseExchange):
                         'code': self.safe_string(market, 'quote'),
                         'precision': currencyPrecision,
                     }
-                    quoteCurrencies.append(currency)
-            baseCurrencies = self.sort_by(baseCurrencies, 'code')
-            quoteCurrencies = self.sort_by(quoteCurrencies, 'code')
-            self.baseCurrencies = self.index_by(baseCurrencies, 'code')
-            self.quoteCurrencies = self.index_by(quoteCurrencies, 'code')
-            allCurrencies = self.array_concat(baseCurrencies, quoteCurrencies)
-            groupedCurrencies = self.group_by(allCurrencies, 'code')
-            codes = list(groupedCurrencies.keys())
-            resultingCurrencies = []
-            for i in range(0, len(codes)):
-                code = codes[i]
-                groupedCurrenciesCode = self.safe_value(groupedCurrencies, code, [])
-                highestPrecisionCurrency = self.safe_value(groupedCurrenciesCode, 0)
-                for j in range(1, len(groupedCurrenciesCode)):
-                    currentCurrency = groupedCurrenciesCode[j]
-                    if self.precisionMode == TICK_SIZE:
-                        highestPrecisionCurrency = currentCurrency if (currentCurrency['precision'] < highestPrecisionCurrency['precision']) else highestPrecisionCurrency
-                    else:
-                        highestPrecisionCurrency = currentCurrency if (currentCurrency['precision'] > highestPrecisionCurrency['precision']) else highestPrecisionCurrency
-                resultingCurrencies.append(highestPrecisionCurrency)
-            sortedCurrencies = self.sort_by(resultingCurrencies, 'code')
-            self.currencies = self.deep_extend(self.currencies, self.index_by(sortedCurrencies, 'code'))
+                    code = currency['code']
+                    if code is not None:
+                        quoteCurrencies[code] = currency
+                        if not (code in highestPrecisionQuoteCurrencies) or self.has_higher_currency_precision(currency, highestPrecisionQuoteCurrencies[code]):
+                            highestPrecisionQuoteCurrencies[code] = currency
+            self.baseCurrencies = self.keysort(baseCurrencies)
+            self.quoteCurrencies = self.keysort(quoteCurrencies)
+            resultingCurrencies = self.extend({}, highestPrecisionBaseCurrencies)
+            quoteCodes = list(highestPrecisionQuoteCurrencies.keys())
+            for i in range(0, len(quoteCodes)):
+                code = quoteCodes[i]
+                quoteCurrency = highestPrecisionQuoteCurrencies[code]
+                if not (code in resultingCurrencies) or self.has_higher_currency_precision(quoteCurrency, resultingCurrencies[code]):
+                    resultingCurrencies[code] = quoteCurrency
+            self.currencies = self.deep_extend_shared(self.currencies, self.keysort(resultingCurrencies))
         self.currencies_by_id = self.index_by(self.currencies, 'id')
         currenciesSortedByCode = self.keysort(self.currencies)
         self.codes = list(currenciesSortedByCode.keys())
+        self.compile_precision_formatters(values)
+        self.set_markets_changes(previousMarkets)
         return self.markets
 
+    def has_higher_currency_precision(self, currency, other):
+        if self.precisionMode == TICK_SIZE:
+            return currency['precision'] < other['precision']
+        return currency['precision'] > other['precision']
+
     def safe_balance(self, balance):
         balances = self.omit(balance, ['info', 'timestamp', 'datetime', 'free', 'used', 'total'])
         codes = list(balances.keys())
@@ -574,11 +837,10 @@ class Exchange(BaseExchange):
             else:
                 multiplyPrice = average
             # contract trading
-            filledTimesContractSize = Precise.string_mul(filled, contractSize)
             if inverse:
-                cost = Precise.string_div(filledTimesContractSize, multiplyPrice)
+                cost = Precise.string_mul_div(filled, contractSize, multiplyPrice)
             else:
-                cost = Precise.string_mul(filledTimesContractSize, multiplyPrice)
+                cost = Precise.string_mul_mul(filled, contractSize, multiplyPrice)
         # support for market orders
         orderType = self.safe_value(order, 'type')
         emptyPrice = (price is None) or Precise.string_equals(price, '0')
@@ -607,7 +869,7 @@ class Exchange(BaseExchange):
         elif postOnly is None:
             # timeInForce is not None here
             postOnly = timeInForce == 'PO'
-        return self.extend(order, {
+        return self.record('order', self.extend(order, {
             'symbol': symbol,
             'side': side,
             'lastTradeTimestamp': lastTradeTimeTimestamp,
@@ -620,9 +882,12 @@ class Exchange(BaseExchange):
             'timeInForce': timeInForce,
             'postOnly': postOnly,
             'trades': trades,
-        })
+        }))
 
     def parse_orders(self, orders, market=None, since=None, limit=None, params={}):
+        streamed = self.parse_streamed('orders', orders, market, since, limit, params)
+        if streamed is not None:
+            return streamed
         #
         # the value of orders is either a dict or a list
         #
@@ -712,13 +977,12 @@ class Exchange(BaseExchange):
         if cost is None:
             # contract trading
             contractSize = self.safe_string(market, 'contractSize')
-            multiplyPrice = price
             if contractSize is not None:
                 inverse = self.safe_value(market, 'inverse', False)
-                if inverse:
-                    multiplyPrice = Precise.string_div('1', price)
-                multiplyPrice = Precise.string_mul(multiplyPrice, contractSize)
-            cost = Precise.string_mul(multiplyPrice, amount)
+                multiplyPrice = Precise.string_div('1', price) if inverse else price
+                cost = Precise.string_mul_mul(multiplyPrice, contractSize, amount)
+            else:
+                cost = Precise.string_mul(price, amount)
         parseFee = self.safe_value(trade, 'fee') is None
         parseFees = self.safe_value(trade, 'fees') is None
         shouldParseFees = parseFee or parseFees
@@ -749,7 +1013,7 @@ class Exchange(BaseExchange):
         trade['amount'] = self.parse_number(amount)
         trade['price'] = self.parse_number(price)
         trade['cost'] = self.parse_number(cost)
-        return trade
+        return self.record('trade', trade)
 
     def reduce_fees_by_currency(self, fees):
         #
@@ -850,12 +1114,12 @@ class Exchange(BaseExchange):
         if (percentage is None) and (change is not None) and (open is not None) and Precise.string_gt(open, '0'):
             percentage = Precise.string_mul(Precise.string_div(change, open), '100')
         if (change is None) and (percentage is not None) and (open is not None):
-            change = Precise.string_div(Precise.string_mul(percentage, open), '100')
+            change = Precise.string_mul_div(percentage, open, '100')
         if (open is None) and (last is not None) and (change is not None):
             open = Precise.string_sub(last, change)
         # timestamp and symbol operations don't belong in safeTicker
         # they should be done in the derived classes
-        return self.extend(ticker, {
+        return self.record('ticker', self.extend(ticker, {
             'bid': self.safe_number(ticker, 'bid'),
             'bidVolume': self.safe_number(ticker, 'bidVolume'),
             'ask': self.safe_number(ticker, 'ask'),
@@ -872,7 +1136,7 @@ class Exchange(BaseExchange):
             'baseVolume': self.parse_number(baseVolume),
             'quoteVolume': self.parse_number(quoteVolume),
             'previousClose': self.safe_number(ticker, 'previousClose'),
-        })
+        }))
 
     async def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=None, params={}):
         if not self.has['fetchTrades']:
@@ -1161,6 +1425,9 @@ class Exchange(BaseExchange):
         }
 
     def parse_ohlcvs(self, ohlcvs, market=None, timeframe='1m', since=None, limit=None):
+        streamed = self.parse_streamed('ohlcvs', ohlcvs, market, since, limit)
+        if streamed is not None:
+            return streamed
         results = []
         for i in range(0, len(ohlcvs)):
             results.append(self.parse_ohlcv(ohlcvs[i], market))
@@ -1210,6 +1477,9 @@ class Exchange(BaseExchange):
         return result
 
     def parse_trades(self, trades, market=None, since=None, limit=None, params={}):
+        streamed = self.parse_streamed('trades', trades, market, since, limit, params)
+        if streamed is not None:
+            return streamed
         trades = self.to_array(trades)
         result = []
         for i in range(0, len(trades)):
@@ -1221,6 +1491,9 @@ class Exchange(BaseExchange):
         return self.filter_by_symbol_since_limit(result, symbol, since, limit, tail)
 
     def parse_transactions(self, transactions, currency=None, since=None, limit=None, params={}):
+        streamed = self.parse_streamed('transactions', transactions, currency, since, limit, params)
+        if streamed is not None:
+            return streamed
         transactions = self.to_array(transactions)
         result = []
         for i in range(0, len(transactions)):
@@ -1232,6 +1505,9 @@ class Exchange(BaseExchange):
         return self.filter_by_currency_since_limit(result, code, since, limit, tail)
 
     def parse_transfers(self, transfers, currency=None, since=None, limit=None, params={}):
+        streamed = self.parse_streamed('transfers', transfers, currency, since, limit, params)
+        if streamed is not None:
+            return streamed
         transfers = self.to_array(transfers)
         result = []
         for i in range(0, len(transfers)):
@@ -1291,12 +1567,22 @@ class Exchange(BaseExchange):
         return self.index_by(results, key) if indexed else results
 
     async def fetch2(self, path, api='public', method='GET', params={}, headers=None, body=None, config={}, context={}):
+        if self.coalesceRequests and self.is_public_request(api, method, params):
+            return await self.coalesce_request(path, api, method, params, headers, body, config, context)
+        return await self.send_request(path, api, method, params, headers, body, config, context)
+
+    async def send_request(self, path, api='public', method='GET', params={}, headers=None, body=None, config={}, context={}, request=None):
         if self.enableRateLimit:
             cost = self.calculate_rate_limiter_cost(api, method, path, params, config, context)
-            await self.throttle(cost)
+            priority = self.calculate_rate_limiter_priority(api, method, path, params, config, context)
+            await self.throttle_api(api, cost, priority)
+        stream = self.safe_value(params, 'stream')
+        if ('rateLimitPriority' in params) or ('stream' in params):
+            params = self.omit(params, ['rateLimitPriority', 'stream'])
         self.lastRestRequestTimestamp = self.milliseconds()
-        request = self.sign(path, api, method, params, headers, body)
-        return await self.fetch(request['url'], request['method'], request['headers'], request['body'])
+        if request is None:
+            request = self.sign(path, api, method, params, headers, body)
+        return await self.fetch_request(api, request, stream)
 
     async def request(self, path, api='public', method='GET', params={}, headers=None, body=None, config={}, context={}):
         return await self.fetch2(path, api, method, params, headers, body, config, context)
@@ -1752,25 +2038,25 @@ class Exchange(BaseExchange):
 
     def cost_to_precision(self, symbol, cost):
         market = self.market(symbol)
-        return self.decimal_to_precision(cost, TRUNCATE, market['precision']['price'], self.precisionMode, self.paddingMode)
+        return self.decimal_to_market_precision(cost, TRUNCATE, market, 'price')
 
     def price_to_precision(self, symbol, price):
         market = self.market(symbol)
-        result = self.decimal_to_precision(price, ROUND, market['precision']['price'], self.precisionMode, self.paddingMode)
+        result = self.decimal_to_market_precision(price, ROUND, market, 'price')
         if result == '0':
             raise ArgumentsRequired(self.id + ' price of ' + market['symbol'] + ' must be greater than minimum price precision of ' + self.number_to_string(market['precision']['price']))
         return result
 
     def amount_to_precision(self, symbol, amount):
         market = self.market(symbol)
-        result = self.decimal_to_precision(amount, TRUNCATE, market['precision']['amount'], self.precisionMode, self.paddingMode)
+        result = self.decimal_to_market_precision(amount, TRUNCATE, market, 'amount')
         if result == '0':
             raise ArgumentsRequired(self.id + ' amount of ' + market['symbol'] + ' must be greater than minimum amount precision of ' + self.number_to_string(market['precision']['amount']))
         return result
 
     def fee_to_precision(self, symbol, fee):
         market = self.market(symbol)
-        return self.decimal_to_precision(fee, ROUND, market['precision']['price'], self.precisionMode, self.paddingMode)
+        return self.decimal_to_market_precision(fee, ROUND, market, 'price')
 
     def currency_to_precision(self, code, fee, networkCode=None):
         currency = self.currencies[code]
@@ -1859,6 +2145,9 @@ class Exchange(BaseExchange):
         return self.filter_by_value_since_limit(array, 'currency', code, since, limit, 'timestamp', tail)
 
     def parse_tickers(self, tickers, symbols=None, params={}):
+        streamed = self.parse_streamed('tickers', tickers, symbols, None, None, params)
+        if streamed is not None:
+            return streamed
         #
         # the value of tickers is either a dict or a list
         #
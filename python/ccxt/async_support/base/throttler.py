@@ -1,6 +1,6 @@
 import asyncio
 import collections
-from time import time
+from time import monotonic
 
 
 class Throttler:
@@ -13,37 +13,105 @@ class Throttler:
             'tokens': 0,
             'maxCapacity': 2000,
             'capacity': 1.0,
+            'aging': 1000,  # milliseconds of waiting that raise a request by one priority, so that the lower lanes are not starved
         }
         self.config.update(config)
-        self.queue = collections.deque()
+        self.lanes = {}  # queued requests by priority
         self.running = False
+        self.last_timestamp = monotonic() * 1000
+
+    def refill(self):
+        now = monotonic() * 1000
+        elapsed = now - self.last_timestamp
+        self.last_timestamp = now
+        # the initial tokens may exceed the capacity, they are only capped while refilling
+        if elapsed > 0 and self.config['tokens'] < self.config['capacity']:
+            self.config['tokens'] = min(self.config['tokens'] + elapsed * self.config['refillRate'], self.config['capacity'])
+
+    def next_lane(self):
+        # the lane of the highest priority, raised by the time its oldest request has been waiting
+        if len(self.lanes) == 1:
+            return next(iter(self.lanes.values()))
+        now = monotonic() * 1000
+        result = None
+        rank = None
+        for priority, lane in self.lanes.items():
+            lane_rank = priority + (now - lane[0][2]) / self.config['aging']
+            if rank is None or lane_rank > rank:
+                result = lane
+                rank = lane_rank
+        return result
+
+    def pop(self, lane):
+        entry = lane.popleft()
+        if not lane:
+            del self.lanes[entry[3]]
 
     async def looper(self):
-        last_timestamp = time() * 1000
-        while self.running:
-            future, cost = self.queue[0]
+        while self.lanes:
+            lane = self.next_lane()
+            future, cost = lane[0][0:2]
+            if future.done():
+                # cancelled by the caller, it does not take any tokens
+                self.pop(lane)
+                continue
             cost = self.config['cost'] if cost is None else cost
+            self.refill()
             if self.config['tokens'] >= 0:
                 self.config['tokens'] -= cost
-                if not future.done():
-                    future.set_result(None)
-                self.queue.popleft()
+                future.set_result(None)
+                self.pop(lane)
                 # context switch
                 await asyncio.sleep(0)
-                if len(self.queue) == 0:
-                    self.running = False
             else:
-                await asyncio.sleep(self.config['delay'])
-                now = time() * 1000
-                elapsed = now - last_timestamp
-                last_timestamp = now
-                self.config['tokens'] = min(self.config['tokens'] + elapsed * self.config['refillRate'], self.config['capacity'])
+                # sleep once until the bucket is refilled, or until the caller cancels the request
+                delay = -self.config['tokens'] / self.config['refillRate'] / 1000
+                await asyncio.wait([future], timeout=max(delay, self.config['delay']))
+        self.running = False
+
+    def update_tokens(self, tokens):
+        # lowers the tokens to what the exchange reports, a negative amount pauses the bucket until it is refilled
+        if self.config.get('backend') is not None:
+            return self.config['backend'].update_tokens(self.config['key'], tokens, self.config)
+        self.refill()
+        self.config['tokens'] = min(self.config['tokens'], tokens)
+
+    def queue_depth(self):
+        # the number of queued requests by priority
+        return {priority: len(lane) for priority, lane in self.lanes.items()}
+
+    def discard(self, future):
+        if future.cancelled():
+            for lane in self.lanes.values():
+                for entry in lane:
+                    if entry[0] is future:
+                        lane.remove(entry)
+                        if not lane:
+                            del self.lanes[entry[3]]
+                        return
+
+    async def reserve(self, cost):
+        # the bucket is shared with other processes, see ccxt.base.rate_limiter
+        cost = self.config['cost'] if cost is None else cost
+        loop = asyncio.get_event_loop()
+        delay = await loop.run_in_executor(None, self.config['backend'].reserve, self.config['key'], cost, self.config)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
 
-    def __call__(self, cost=None):
+    def __call__(self, cost=None, priority=0):
+        """
+        :param float cost: the tokens taken by the request
+        :param int priority: the requests of a higher priority are released first
+        """
+        if self.config.get('backend') is not None:
+            return asyncio.ensure_future(self.reserve(cost), loop=self.loop)
         future = asyncio.Future()
-        if len(self.queue) > self.config['maxCapacity']:
+        if sum(len(lane) for lane in self.lanes.values()) > self.config['maxCapacity']:
             raise RuntimeError('throttle queue is over maxCapacity (' + str(int(self.config['maxCapacity'])) + '), see https://github.com/ccxt/ccxt/issues/11645#issuecomment-1195695526')
-        self.queue.append((future, cost))
+        future.add_done_callback(self.discard)
+        if priority not in self.lanes:
+            self.lanes[priority] = collections.deque()
+        self.lanes[priority].append((future, cost, monotonic() * 1000, priority))
         if not self.running:
             self.running = True
             asyncio.ensure_future(self.looper(), loop=self.loop)
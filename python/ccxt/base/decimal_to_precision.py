@@ -1,4 +1,5 @@
 import decimal
+import functools
 import numbers
 import itertools
 import re
@@ -14,6 +15,8 @@ __all__ = [
     'NO_PADDING',
     'PAD_WITH_ZERO',
     'decimal_to_precision',
+    'precision_formatter',
+    'PrecisionFormatter',
 ]
 
 
@@ -162,6 +165,21 @@ def decimal_to_precision(n, rounding_mode=ROUND, precision=None, counting_mode=D
             return precise
 
 
+def to_decimal(x):
+    # the decimal.Decimal of a number or of a numeric string, None if it is not a number
+    # a float is converted from its shortest repr, like str(0.1) == '0.1'
+    if isinstance(x, decimal.Decimal):
+        return x
+    elif isinstance(x, float):
+        return decimal.Decimal(repr(x))
+    elif isinstance(x, str) or (isinstance(x, numbers.Integral) and not isinstance(x, bool)):
+        try:
+            return decimal.Decimal(x)
+        except (decimal.InvalidOperation, ValueError):
+            return None
+    return None
+
+
 def number_to_string(x):
     # avoids scientific notation for too large and too small numbers
     if x is None:
@@ -169,3 +187,250 @@ def number_to_string(x):
     d = decimal.Decimal(str(x))
     formatted = '{:f}'.format(d)
     return formatted.rstrip('0').rstrip('.') if '.' in formatted else formatted
+
+
+# ----------------------------------------------------------------------------
+# decimal_to_precision() compiled for the precision of a market
+
+FIXED = re.compile(r'-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?\Z')  # the numbers that '{:f}'.format(decimal.Decimal()) leaves as they are
+NUMBER = re.compile(r'(-?)([0-9]*)(?:\.([0-9]*))?(?:[eE]([-+]?[0-9]+))?\Z')
+MAX_EXPONENT = 40  # the numbers with more digits are formatted by decimal_to_precision() itself
+MAX_COEFFICIENT = 10 ** 26  # decimal.Decimal.quantize() raises past the 28 digits of the default context
+
+
+def parse_decimal(string):
+    # the sign, the integer coefficient and the exponent of decimal.Decimal(string), None if the string is not a plain number
+    match = NUMBER.match(string)
+    if match is None:
+        return None
+    sign, integer, fraction, exponent = match.groups()
+    if fraction:
+        integer += fraction
+    if not integer:
+        return None
+    exponent = (int(exponent) if exponent else 0) - (len(fraction) if fraction else 0)
+    if exponent > MAX_EXPONENT or exponent < -MAX_EXPONENT:
+        return None
+    coefficient = int(integer)
+    if coefficient >= MAX_COEFFICIENT:
+        return None
+    return sign, coefficient, exponent
+
+
+def format_fixed(sign, coefficient, exponent):
+    # '{:f}'.format() of the decimal.Decimal of the sign, the coefficient and the exponent
+    digits = str(coefficient)
+    if exponent >= 0:
+        return sign + digits + '0' * exponent if coefficient else sign + '0'
+    point = len(digits) + exponent
+    if point > 0:
+        return sign + digits[:point] + '.' + digits[point:]
+    return sign + '0.' + '0' * -point + digits
+
+
+def round_half_up(coefficient, exponent, places):
+    # the coefficient of the number quantized to the decimal places, rounding 0.5 away from zero
+    shift = exponent + places
+    if shift >= 0:
+        return coefficient * 10 ** shift
+    unit = 10 ** -shift
+    quotient, remainder = divmod(coefficient, unit)
+    return quotient + 1 if remainder * 2 >= unit else quotient
+
+
+class PrecisionFormatter:
+    """
+    decimal_to_precision() with the rounding mode, the precision, the counting mode and the padding mode fixed once
+    the numbers are rounded with integer arithmetic on the digits of str(n) and formatted like decimal_to_precision() does,
+    what it does not cover, like a negative precision or an exponent out of range, is left to decimal_to_precision()
+    """
+
+    def __init__(self, rounding_mode, precision, counting_mode, padding_mode):
+        self.rounding_mode = rounding_mode
+        self.precision = precision
+        self.counting_mode = counting_mode
+        self.padding_mode = padding_mode
+        self.places = precision  # the decimal places of the rounded number
+        self.tick = None  # the coefficient and the exponent of the tick size
+        self.half = None  # the numerator and the denominator of precision / 2, that decimal_to_precision() compares with
+        self.compiled = self.compile()
+
+    def compile(self):
+        # whether the arguments are covered by the integer arithmetic, the others are checked by decimal_to_precision()
+        if self.rounding_mode not in [TRUNCATE, ROUND] or self.padding_mode not in [NO_PADDING, PAD_WITH_ZERO]:
+            return False
+        if self.counting_mode == TICK_SIZE:
+            if isinstance(self.precision, bool) or not isinstance(self.precision, (float, decimal.Decimal, numbers.Integral)):
+                return False
+            tick = decimal.Decimal(str(self.precision))
+            if not tick.is_finite() or tick <= 0:
+                return False
+            sign, digits, exponent = tick.as_tuple()
+            self.tick = (int(''.join(map(str, digits))), exponent)
+            self.half = (self.precision / 2).as_integer_ratio()
+            parts = re.sub(r'0+$', '', '{:f}'.format(tick)).split('.')
+            if len(parts) > 1:
+                self.places = len(parts[1])
+            elif parts[0].endswith('0'):
+                return False  # a tick size of 10 or more rounds to a negative precision
+            else:
+                self.places = 0
+        elif self.counting_mode in [DECIMAL_PLACES, SIGNIFICANT_DIGITS]:
+            if isinstance(self.precision, bool) or not isinstance(self.precision, numbers.Integral):
+                return False
+        else:
+            return False
+        return 0 <= self.places <= 26
+
+    def __call__(self, n):
+        if not self.compiled or decimal.getcontext().prec != 28:
+            return decimal_to_precision(n, self.rounding_mode, self.precision, self.counting_mode, self.padding_mode)
+        string = str(n)
+        if self.counting_mode == DECIMAL_PLACES and FIXED.match(string):
+            precise = self.fixed_decimal_places(string)
+        else:
+            number = parse_decimal(string)
+            if number is None:
+                precise = None
+            elif self.counting_mode == DECIMAL_PLACES:
+                precise = self.decimal_places(*number)
+            elif self.counting_mode == TICK_SIZE:
+                precise = self.tick_size(*number)
+            else:
+                precise = self.significant_digits(*number)
+        if precise is None:
+            return decimal_to_precision(n, self.rounding_mode, self.precision, self.counting_mode, self.padding_mode)
+        return precise
+
+    def round(self, sign, coefficient, exponent, places):
+        coefficient = round_half_up(coefficient, exponent, places)
+        if coefficient >= MAX_COEFFICIENT:
+            return None
+        precise = format_fixed(sign, coefficient, -places)
+        return '0' if precise == '-0' else precise
+
+    def pad(self, precise, places):
+        if self.padding_mode == NO_PADDING:
+            return precise.rstrip('0').rstrip('.') if '.' in precise else precise
+        if '.' in precise:
+            before, after = precise.split('.')
+            return before + '.' + after.ljust(places, '0')
+        if places > 0:
+            return precise + '.' + places * '0'
+        return precise
+
+    def decimal_places(self, sign, coefficient, exponent):
+        places = self.places
+        if self.rounding_mode == ROUND:
+            precise = self.round(sign, coefficient, exponent, places)
+            if precise is None:
+                return None
+        else:
+            string = format_fixed(sign, coefficient, exponent)
+            before, after = string.split('.') if '.' in string else (string, '')
+            precise = before + '.' + after[:places]
+            if precise == '-0.' or precise == '-0':
+                precise = precise[1:]
+            precise = precise.rstrip('.')
+        return self.pad(precise, places)
+
+    def fixed_decimal_places(self, string):
+        # the digits of a number in fixed notation, like str() of a float or an int, are sliced without converting them
+        places = self.places
+        before, _, after = string.partition('.')
+        if self.rounding_mode == ROUND:
+            if len(before) + places > 26:
+                return None
+            if len(after) <= places:
+                precise = before + '.' + after.ljust(places, '0') if places else before
+            elif after[places] >= '5':
+                sign = '-' if before[0] == '-' else ''
+                precise = format_fixed(sign, abs(int(before + after[:places])) + 1, -places)
+            else:
+                precise = before + '.' + after[:places] if places else before
+            if precise == '-0':
+                precise = '0'
+        else:
+            precise = before + '.' + after[:places]
+            if precise == '-0.' or precise == '-0':
+                precise = precise[1:]
+            precise = precise.rstrip('.')
+        return self.pad(precise, places)
+
+    def tick_size(self, sign, coefficient, exponent):
+        # the number and the tick size are aligned to the smallest of their exponents
+        tick, tick_exponent = self.tick
+        common = min(exponent, tick_exponent)
+        coefficient *= 10 ** (exponent - common)
+        tick *= 10 ** (tick_exponent - common)
+        if coefficient >= MAX_COEFFICIENT or tick >= MAX_COEFFICIENT:
+            return None
+        missing = coefficient % tick
+        if missing:
+            if self.rounding_mode == ROUND:
+                numerator, denominator = self.half
+                if common >= 0:
+                    up = missing * 10 ** common * denominator >= numerator
+                else:
+                    up = missing * denominator >= numerator * 10 ** -common
+                coefficient = coefficient - missing + tick if up else coefficient - missing
+            else:
+                coefficient -= missing
+            if not coefficient:
+                sign = ''  # the sum of a number and its opposite is a positive zero
+        precise = self.round(sign, coefficient, common, self.places)
+        return None if precise is None else self.pad(precise, self.places)
+
+    def significant_digits(self, sign, coefficient, exponent):
+        precision = self.precision
+        adjusted = exponent + len(str(coefficient)) - 1
+        if self.rounding_mode == ROUND:
+            places = precision - adjusted - 1
+            if places < 0:
+                return None
+            precise = self.round(sign, coefficient, exponent, places)
+            if precise is None:
+                return None
+        else:
+            if precision == 0:
+                return '0'
+            string = format_fixed(sign, coefficient, exponent)
+            dot = string.index('.') if '.' in string else len(string)
+            start = dot - adjusted
+            end = start + precision
+            if dot >= end:
+                end -= 1
+            if precision >= len(string.replace('.', '')):
+                precise = string
+            else:
+                precise = string[:end].ljust(dot, '0')
+            if precise == '-0.' or precise == '-0':
+                precise = precise[1:]
+            precise = precise.rstrip('.')
+        if self.padding_mode == NO_PADDING:
+            return precise.rstrip('0').rstrip('.') if '.' in precise else precise
+        if '.' in precise:
+            fsfg = len(list(itertools.takewhile(lambda x: x == '.' or x == '0', precise)))
+            if '.' in precise[fsfg:]:
+                precision += 1
+            return precise[:fsfg] + precise[fsfg:].rstrip('0').ljust(precision, '0')
+        if precision > len(precise):
+            return precise + '.' + (precision - len(precise)) * '0'
+        return precise
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_precision_formatter(rounding_mode, precision_type, precision, counting_mode, padding_mode):
+    return PrecisionFormatter(rounding_mode, precision, counting_mode, padding_mode)
+
+
+def precision_formatter(rounding_mode=ROUND, precision=None, counting_mode=DECIMAL_PLACES, padding_mode=NO_PADDING):
+    """
+    a PrecisionFormatter that formats like decimal_to_precision() with these arguments, shared by the markets with the same precision
+    :returns callable: formatter(n) returns decimal_to_precision(n, rounding_mode, precision, counting_mode, padding_mode)
+    """
+    try:
+        # the type is a part of the key, 1, 1.0 and True are equal but they are not the same precision
+        return compile_precision_formatter(rounding_mode, type(precision), precision, counting_mode, padding_mode)
+    except TypeError:  # an unhashable precision
+        return PrecisionFormatter(rounding_mode, precision, counting_mode, padding_mode)
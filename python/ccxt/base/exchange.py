@@ -27,7 +27,12 @@ from ccxt.base.errors import RateLimitExceeded
 from ccxt.base.decimal_to_precision import decimal_to_precision
 from ccxt.base.decimal_to_precision import DECIMAL_PLACES, TICK_SIZE, NO_PADDING, TRUNCATE, ROUND, ROUND_UP, ROUND_DOWN
 from ccxt.base.decimal_to_precision import number_to_string
+from ccxt.base.decimal_to_precision import precision_formatter
 from ccxt.base.precise import Precise
+from ccxt.base.iso8601 import format_iso8601, parse_iso8601
+from ccxt.base.records import Record, Trade, Order, Ticker, LedgerEntry
+from ccxt.base.throttler import Throttler
+from ccxt.base.json_stream import JsonArrayParser, StreamedArray
 
 # -----------------------------------------------------------------------------
 
@@ -49,6 +54,12 @@ try:
 except ImportError:
     eddsa = None
 
+# faster json decoding
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # -----------------------------------------------------------------------------
 
 __all__ = [
@@ -70,17 +81,23 @@ import gzip
 import hashlib
 import hmac
 import io
+import itertools
 import json
 import math
+import os
+import pickle
 import random
 from numbers import Number
 import re
 from requests import Session
+from requests.adapters import HTTPAdapter
 from requests.utils import default_user_agent
 from requests.exceptions import HTTPError, Timeout, TooManyRedirects, RequestException, ConnectionError as requestsConnectionError
-# import socket
+import socket
 from ssl import SSLError
 # import sys
+import tempfile
+import threading
 import time
 import uuid
 import zlib
@@ -88,6 +105,21 @@ from decimal import Decimal
 from time import mktime
 from wsgiref.handlers import format_date_time
 import urllib.parse as _urlencode
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+
+# -----------------------------------------------------------------------------
+
+
+class SocketOptionsAdapter(HTTPAdapter):
+    """an HTTPAdapter that opens its connections with the given socket options"""
+
+    def __init__(self, socket_options, **kwargs):
+        self.socket_options = socket_options
+        super(SocketOptionsAdapter, self).__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = self.socket_options
+        super(SocketOptionsAdapter, self).init_poolmanager(*args, **kwargs)
 
 # -----------------------------------------------------------------------------
 
@@ -108,6 +140,32 @@ class Exchange(object):
     aiohttp_proxy = None
     aiohttp_trust_env = False
     requests_trust_env = False
+    requests_pool_connections = 10  # the number of hosts that keep a pool of connections
+    requests_pool_maxsize = None  # the connections kept per host, thread_pool_size and at least 10 by default
+    requests_pool_block = False  # wait for a free connection instead of opening one that is discarded afterwards
+    requests_max_retries = 0  # retries of the connections that fail before any data is sent
+    requests_tcp_nodelay = True
+    requests_tcp_keepalive = False  # enables SO_KEEPALIVE, so that idle pooled connections are not dropped silently
+    requests_shared_session = False  # instances with the same settings share one session and its connection pools
+    requests_sessions = {}  # shared sessions by settings, see get_requests_session()
+    own_session = False  # whether the session is closed with the instance
+    thread_pool_size = 4  # the number of requests of the synchronous exchanges that submit() runs concurrently
+    thread_pool = None  # created by submit() on first use
+    markets_cache_path = None  # a file or a directory to keep the loaded markets between restarts, disabled by default
+    markets_cache_ttl = 3600000  # milliseconds = seconds * 1000, None for a cache that never expires
+    shared_markets = False  # instances of the same class share one loaded set of markets instead of a copy each, in a process and in the processes forked from it
+    shared_markets_store = {}  # loaded markets by exchange class, api urls and params, see store_markets()
+    market_defaults = None  # the fields shared by all markets, see set_markets()
+    adaptiveRateLimit = False  # lower the tokens of the rate limiter to the usage reported by the exchange, see adapt_rate_limit()
+    rateLimiterBackend = None  # keeps the buckets outside of the process, see ccxt.base.rate_limiter
+    rateLimiterKey = None  # the name of the buckets in the rateLimiterBackend, the id of the exchange by default
+    rateLimitPriorities = {'order': 2, 'account': 1, 'market': 0}  # the named lanes of the throttlers, see calculate_rate_limiter_priority()
+    rateLimitBuckets = {}  # token buckets of the api groups that an exchange meters separately, see init_rate_limit_buckets()
+    coalesceRequests = False  # identical public GET requests in flight at the same time share one call, see coalesce_request()
+    coalesceTTL = 0  # milliseconds that the response of a coalesced request is reused for, 0 to disable
+    markets_changes = None  # the symbols added, removed and changed by the last set_markets()
+    on_markets_changed = None  # called with the exchange and markets_changes when a reload changes the markets
+    loaded_markets_keys = ['markets', 'markets_by_id', 'symbols', 'ids', 'currencies', 'currencies_by_id', 'codes', 'baseCurrencies', 'quoteCurrencies', 'market_defaults']
     session = None  # Session () by default
     verify = True  # SSL verification
     validateServerSsl = True
@@ -337,7 +395,18 @@ class Exchange(object):
     minFundingAddressLength = 1  # used in check_address
     substituteCommonCurrencyCodes = True
     quoteJsonNumbers = True
-    number = float  # or str (a pointer to a class)
+    lean_responses = False  # keep nothing of the responses after a request, see __init__()
+    stream_chunk_size = 16384  # bytes read from the socket at once by fetch_stream()
+    json_decoder = None  # function(body, quote_numbers) that replaces decode_json() for the responses and the websocket messages
+    number = float  # or str or Decimal (a pointer to a class), see parse_number()
+    records = False  # or True, the unified trades, orders, tickers and ledger entries as records, see record()
+    records_info = True  # False releases the raw payloads of the records, their info is None
+    record_types = {
+        'trade': Trade,
+        'order': Order,
+        'ticker': Ticker,
+        'ledger': LedgerEntry,
+    }
     handleContentTypeApplicationZip = False
     # whether fees should be summed by currency code
     reduceFees = True
@@ -368,6 +437,12 @@ class Exchange(object):
         'BCHSV': 'BSV',
     }
     synchronous = True
+    describe_cache = {}  # describe() templates by exchange class, see describe_template()
+    camelcase_aliases = {}  # camelcase names of the non-method attributes by exchange class, see __getattr__()
+    # read-only sections of describe() that are shared by all instances of a class instead of being copied
+    shared_describe_keys = ['api']
+    # sections of describe() of strings or of dicts of strings, copied a level at a time instead of recursively
+    flat_describe_keys = ['exceptions', 'httpExceptions', 'commonCurrencies', 'timeframes']
 
     def __init__(self, config={}):
 
@@ -395,33 +470,61 @@ class Exchange(object):
         self.origin = self.uuid()
         self.userAgent = default_user_agent()
 
-        settings = self.deep_extend(self.describe(), config)
-
-        for key in settings:
-            if hasattr(self, key) and isinstance(getattr(self, key), dict):
-                setattr(self, key, self.deep_extend(getattr(self, key), settings[key]))
+        cls = type(self)
+        first_instance = cls not in Exchange.describe_cache
+        template, methods, volatile = self.describe_template()
+        description = self.describe() if volatile else None
+
+        for key in template:
+            value = self.describe_value(key, description[key]) if key in volatile else template[key]
+            if key in self.shared_describe_keys:
+                setattr(self, key, self.deep_extend(value, config[key]) if key in config else value)
+            elif key in self.flat_describe_keys:
+                value = self.copy_flat_describe_value(value)
+                setattr(self, key, self.deep_extend(value, config[key]) if key in config else value)
             else:
-                setattr(self, key, settings[key])
+                # every instance gets its own copy of the mutable sections
+                value = self.copy_describe_value(value)
+                setattr(self, key, self.deep_extend(value, config[key]) if key in config else value)
+
+        # the flat sections that are not in describe() are the class defaults, copied as well
+        for key in self.flat_describe_keys:
+            if key not in template and isinstance(getattr(self, key, None), dict):
+                setattr(self, key, self.copy_flat_describe_value(getattr(self, key)))
+
+        # bound methods in describe() (like streaming.ping) are bound to this instance, unless overridden by config
+        for path in methods:
+            container = getattr(self, path[0])
+            function = template[path[0]]
+            for key in path[1:-1]:
+                container = container[key]
+                function = function[key]
+            function = function[path[-1]]
+            if container[path[-1]] is function:
+                container[path[-1]] = function.__get__(self, cls)
+
+        for key in config:
+            if key not in template:
+                if hasattr(self, key) and isinstance(getattr(self, key), dict):
+                    setattr(self, key, self.deep_extend(getattr(self, key), config[key]))
+                else:
+                    setattr(self, key, config[key])
 
-        if self.api:
-            self.define_rest_api(self.api, 'request')
+        # the implicit api methods are bound to the class, so they are generated only once per class
+        # the methods of an api overridden in config are bound to this instance, the other instances keep those of the class
+        if first_instance:
+            api = template['api'] if 'api' in template else getattr(cls, 'api', None)
+            if api:
+                self.define_rest_api(api, 'request')
+        if self.api and 'api' in config:
+            self.define_rest_api(self.api, 'request', [], self)
 
         if self.markets:
             self.set_markets(self.markets)
 
         # convert all properties from underscore notation foo_bar to camelcase notation fooBar
-        cls = type(self)
-        for name in dir(self):
-            if name[0] != '_' and name[-1] != '_' and '_' in name:
-                parts = name.split('_')
-                # fetch_ohlcv → fetchOHLCV (not fetchOhlcv!)
-                exceptions = {'ohlcv': 'OHLCV', 'le': 'LE', 'be': 'BE'}
-                camelcase = parts[0] + ''.join(exceptions.get(i, self.capitalize(i)) for i in parts[1:])
-                attr = getattr(self, name)
-                if isinstance(attr, types.MethodType):
-                    setattr(cls, camelcase, getattr(cls, name))
-                else:
-                    setattr(self, camelcase, attr)
+        if cls not in Exchange.camelcase_aliases:
+            self.define_camelcase_aliases()
 
         self.tokenBucket = self.extend({
             'refillRate': 1.0 / self.rateLimit if self.rateLimit > 0 else float('inf'),
@@ -431,16 +534,32 @@ class Exchange(object):
         }, getattr(self, 'tokenBucket', {}))
 
         if not self.session and self.synchronous:
-            self.session = Session()
-            self.session.trust_env = self.requests_trust_env
+            self.session = self.get_requests_session()
+            self.own_session = not self.requests_shared_session
+        if self.lean_responses:
+            # the last response stays in memory until the next one, unless it is asked for in the config
+            for key in ['enableLastHttpResponse', 'enableLastJsonResponse', 'enableLastResponseHeaders']:
+                if key not in config:
+                    setattr(self, key, False)
         self.logger = self.logger if self.logger else logging.getLogger(__name__)
+        self.init_rest_rate_limiter()
+        self.rate_limit_responses = {}
+        self.coalesced_requests = {}  # the calls in flight by request
+        self.coalesced_responses = {}  # the (timestamp, response) of the calls of the last coalesceTTL milliseconds by request
+        self.coalesce_metrics = {'requests': 0, 'coalesced': 0, 'cached': 0}  # calls made, requests that joined one in flight, requests served from the cache
+        self.coalesce_lock = threading.Lock()
+        self.thread_pool_local = threading.local()
+        self.thread_pool_lock = threading.Lock()
+        self.precision_formatters = {}  # the (precision, formatter) by symbol, precision key and rounding mode, see market_precision_formatter()
 
     def __del__(self):
-        if self.session:
+        if self.session and self.own_session:
             try:
                 self.session.close()
             except Exception as e:
                 pass
+        if self.thread_pool:
+            self.thread_pool.shutdown(wait=False)
 
     def __repr__(self):
         return 'ccxt.' + ('async_support.' if self.asyncio_loop else '') + self.id + '()'
@@ -448,9 +567,86 @@ class Exchange(object):
     def __str__(self):
         return self.name
 
+    def __getattr__(self, name):
+        # only called when the regular lookup fails, resolves fooBar to the current value of foo_bar
+        aliases = Exchange.camelcase_aliases.get(type(self))
+        if aliases is not None and name in aliases:
+            return getattr(self, aliases[name])
+        raise AttributeError("'" + type(self).__name__ + "' object has no attribute '" + name + "'")
+
     def describe(self):
         return {}
 
+    def describe_template(self):
+        """
+        the output of describe() merged over the class defaults, computed once per class and shared by all instances, must not be modified
+        :returns [dict, list, list]: the template, the paths to the methods in it and the keys that change from call to call (ids, nonces)
+        """
+        cls = type(self)
+        if cls not in Exchange.describe_cache:
+            description = self.describe()
+            template = {}
+            for key in description:
+                template[key] = self.describe_value(key, description[key])
+            # describe() is called twice to detect the sections that are generated per instance
+            description = self.describe()
+            volatile = [key for key in template if key not in self.shared_describe_keys and self.describe_value(key, description[key]) != template[key]]
+            methods = self.find_bound_methods(template)
+            for path in methods:
+                # keep the plain function in the template, it is bound to each instance in __init__
+                container = template
+                for key in path[:-1]:
+                    container = container[key]
+                container[path[-1]] = container[path[-1]].__func__
+            Exchange.describe_cache[cls] = (template, methods, volatile)
+        return Exchange.describe_cache[cls]
+
+    def describe_value(self, key, value):
+        default = getattr(self, key, None)
+        return self.deep_extend(default, value) if isinstance(default, dict) else value
+
+    @staticmethod
+    def copy_describe_value(value):
+        if isinstance(value, dict):
+            return {key: Exchange.copy_describe_value(value[key]) for key in value}
+        elif isinstance(value, list):
+            return [Exchange.copy_describe_value(item) for item in value]
+        return value
+
+    @staticmethod
+    def copy_flat_describe_value(value):
+        if isinstance(value, dict):
+            return {key: dict(item) if isinstance(item, dict) else item for key, item in value.items()}
+        return value
+
+    def find_bound_methods(self, value, path=[]):
+        if isinstance(value, dict):
+            return [result for key in value for result in self.find_bound_methods(value[key], path + [key])]
+        elif getattr(value, '__self__', None) is self:
+            return [path]
+        return []
+
+    def define_camelcase_aliases(self):
+        """
+        methods get their camelcase aliases on the class, the other attributes are aliased on access in __getattr__()
+        this is done once per class, instances do not copy anything
+        """
+        cls = type(self)
+        aliases = {}
+        # fetch_ohlcv → fetchOHLCV (not fetchOhlcv!)
+        exceptions = {'ohlcv': 'OHLCV', 'le': 'LE', 'be': 'BE'}
+        for name in dir(self):
+            if name[0] != '_' and name[-1] != '_' and '_' in name:
+                parts = name.split('_')
+                camelcase = parts[0] + ''.join(exceptions.get(i, self.capitalize(i)) for i in parts[1:])
+                if isinstance(getattr(self, name), types.MethodType):
+                    # the methods of an api overridden in config are bound to the instance under both of their names
+                    if name not in self.__dict__:
+                        setattr(cls, camelcase, getattr(cls, name))
+                else:
+                    aliases[camelcase] = name
+        Exchange.camelcase_aliases[cls] = aliases
+
     def set_sandbox_mode(self, enabled):
         if enabled:
             if 'test' in self.urls:
@@ -462,7 +658,7 @@ class Exchange(object):
             self.urls['api'] = self.urls['apiBackup']
             del self.urls['apiBackup']
 
-    def define_rest_api_endpoint(self, method_name, uppercase_method, lowercase_method, camelcase_method, path, paths, config={}):
+    def define_rest_api_endpoint(self, method_name, uppercase_method, lowercase_method, camelcase_method, path, paths, config={}, instance=None):
         cls = type(self)
         entry = getattr(cls, method_name)  # returns a function (instead of a bound method)
         delimiters = re.compile('[^a-zA-Z0-9]')
@@ -502,39 +698,292 @@ class Exchange(object):
                 return entry(_self, **inner_kwargs)
             return inner
         to_bind = partialer()
-        setattr(cls, camelcase, to_bind)
-        setattr(cls, underscore, to_bind)
+        if instance is None:
+            setattr(cls, camelcase, to_bind)
+            setattr(cls, underscore, to_bind)
+        else:
+            bound = to_bind.__get__(instance, cls)
+            setattr(instance, camelcase, bound)
+            setattr(instance, underscore, bound)
 
-    def define_rest_api(self, api, method_name, paths=[]):
+    def define_rest_api(self, api, method_name, paths=[], instance=None):
         for key, value in api.items():
             uppercase_method = key.upper()
             lowercase_method = key.lower()
             camelcase_method = lowercase_method.capitalize()
             if isinstance(value, list):
                 for path in value:
-                    self.define_rest_api_endpoint(method_name, uppercase_method, lowercase_method, camelcase_method, path, paths)
+                    self.define_rest_api_endpoint(method_name, uppercase_method, lowercase_method, camelcase_method, path, paths, {}, instance)
             # the options HTTP method conflicts with the 'options' API url path
             # elif re.search(r'^(?:get|post|put|delete|options|head|patch)$', key, re.IGNORECASE) is not None:
             elif re.search(r'^(?:get|post|put|delete|head|patch)$', key, re.IGNORECASE) is not None:
                 for [endpoint, config] in value.items():
                     path = endpoint.strip()
                     if isinstance(config, dict):
-                        self.define_rest_api_endpoint(method_name, uppercase_method, lowercase_method, camelcase_method, path, paths, config)
+                        self.define_rest_api_endpoint(method_name, uppercase_method, lowercase_method, camelcase_method, path, paths, config, instance)
                     elif isinstance(config, Number):
-                        self.define_rest_api_endpoint(method_name, uppercase_method, lowercase_method, camelcase_method, path, paths, {'cost': config})
+                        self.define_rest_api_endpoint(method_name, uppercase_method, lowercase_method, camelcase_method, path, paths, {'cost': config}, instance)
                     else:
                         raise NotSupported(self.id + ' define_rest_api() API format not supported, API leafs must strings, objects or numbers')
             else:
-                self.define_rest_api(value, method_name, paths + [key])
+                self.define_rest_api(value, method_name, paths + [key], instance)
+
+    def get_requests_session(self):
+        """
+        creates the requests session of a synchronous exchange, with a connection pool per host sized for the thread pool
+        with requests_shared_session the instances of the same settings reuse the session, their connections and tls sessions
+        """
+        socket_options = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1 if self.requests_tcp_nodelay else 0)]
+        if self.requests_tcp_keepalive:
+            socket_options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        settings = (
+            self.requests_trust_env,
+            self.requests_pool_connections,
+            self.requests_pool_maxsize or max(10, self.thread_pool_size),
+            self.requests_pool_block,
+            self.requests_max_retries,
+            tuple(socket_options),
+        )
+        if self.requests_shared_session and settings in Exchange.requests_sessions:
+            return Exchange.requests_sessions[settings]
+        session = Session()
+        session.trust_env = self.requests_trust_env
+        adapter = SocketOptionsAdapter(
+            socket_options,
+            pool_connections=settings[1],
+            pool_maxsize=settings[2],
+            pool_block=settings[3],
+            max_retries=settings[4],
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        if self.requests_shared_session:
+            Exchange.requests_sessions[settings] = session
+        return session
+
+    def init_rest_rate_limiter(self):
+        # the requests submitted to the thread pool share the token bucket
+        self.throttle = Throttler(self.get_throttler_config(self.tokenBucket))
+        self.init_rate_limit_buckets(Throttler)
+
+    def get_throttler_config(self, config, bucket=None):
+        if self.rateLimiterBackend is None:
+            return config
+        key = self.rateLimiterKey or self.id
+        return self.extend(config, {
+            'backend': self.rateLimiterBackend,
+            'key': key if bucket is None else key + ':' + bucket,
+        })
+
+    def init_rate_limit_buckets(self, throttler, *args):
+        """
+        creates a throttler for each named bucket of rateLimitBuckets, like
+            'rateLimitBuckets': {
+                'fapi': {'apis': ['fapiPublic', 'fapiPrivate'], 'refillRate': 2400 / 60000},
+            }
+        the other keys override the tokenBucket, the requests to the listed api groups are charged to the buckets they are listed in instead of the default one
+        :param type throttler: the Throttler class of the exchange
+        """
+        self.throttles = {}
+        self.throttles_by_api = {}
+        for name, bucket in self.rateLimitBuckets.items():
+            throttle = throttler(self.get_throttler_config(self.extend(self.tokenBucket, self.omit(bucket, 'apis')), name), *args)
+            self.throttles[name] = throttle
+            for api in bucket['apis']:
+                self.throttles_by_api.setdefault(api, []).append(throttle)
+
+    def get_api_throttles(self, api):
+        # nested api groups are matched by their top-level key
+        return self.throttles_by_api.get(api if isinstance(api, str) else api[0], [self.throttle])
+
+    def throttle_api(self, api, cost=None, priority=0):
+        for throttle in self.get_api_throttles(api):
+            throttle(cost, priority)
+
+    def calculate_rate_limiter_priority(self, api, method, path, params, config={}, context={}):
+        """
+        the lane of a request in the throttler, the queued requests of a higher priority are released first
+        set with a rateLimitPriority param per call or with a priority in the config of an endpoint, a number or a name from rateLimitPriorities
+        by default the public api groups go in the market lane, the private requests that place, edit or cancel orders in the order lane
+        and the other private requests, like the balance, the positions or the transfers, in the account lane
+        """
+        priority = self.safe_value(params, 'rateLimitPriority', self.safe_value(config, 'priority'))
+        if priority is None:
+            if self.is_public_api(api):
+                priority = 'market'
+            elif (method != 'GET') and ('order' in path.lower()):
+                priority = 'order'
+            else:
+                priority = 'account'
+        if isinstance(priority, str):
+            return self.rateLimitPriorities[priority]
+        return priority
+
+    def is_public_api(self, api):
+        # the api groups are named like public or fapiPublic by most exchanges
+        name = '/'.join(api) if isinstance(api, list) else api
+        return 'public' in name.lower()
+
+    def is_public_request(self, api, method, params):
+        # the requests that return the same response to every caller
+        return method == 'GET' and self.is_public_api(api) and 'stream' not in params
+
+    def get_coalesced_response(self, key):
+        cached = self.coalesced_responses.get(key)
+        if cached is not None and self.milliseconds() - cached[0] < self.coalesceTTL:
+            self.coalesce_metrics['cached'] += 1
+            return cached
+        return None
+
+    def set_coalesced_response(self, key, response):
+        if self.coalesceTTL > 0:
+            now = self.milliseconds()
+            for expired in [k for k, cached in self.coalesced_responses.items() if now - cached[0] >= self.coalesceTTL]:
+                del self.coalesced_responses[expired]
+            self.coalesced_responses[key] = (now, response)
+
+    def coalesce_request(self, path, api='public', method='GET', params={}, headers=None, body=None, config={}, context={}):
+        """
+        sends a public request once for all the threads that make it at the same time, the request is signed before it is throttled
+        so that the requests that join one in flight take no tokens, all of them get the same decoded response that must not be modified
+        """
+        request = self.sign(path, api, method, self.omit(params, 'rateLimitPriority'), headers, body)
+        key = (request['method'], request['url'], request['body'])
+        with self.coalesce_lock:
+            cached = self.get_coalesced_response(key)
+            if cached is not None:
+                return cached[1]
+            future = self.coalesced_requests.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self.coalesced_requests[key] = future
+                self.coalesce_metrics['requests'] += 1
+            else:
+                self.coalesce_metrics['coalesced'] += 1
+        if not leader:
+            return future.result()
+        try:
+            response = self.send_request(path, api, method, params, headers, body, config, context, request)
+            future.set_result(response)
+            return response
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self.coalesce_lock:
+                del self.coalesced_requests[key]
+                if not future.exception():
+                    self.set_coalesced_response(key, future.result())
+
+    def get_rate_limit_context(self):
+        # the request made by fetch2() in the current thread
+        return threading.get_ident()
+
+    def set_rate_limit_response(self, http_status_code, headers):
+        context = self.get_rate_limit_context()
+        if context in self.rate_limit_responses:
+            self.rate_limit_responses[context] = (http_status_code, headers)
+
+    def adapt_rate_limit(self, api):
+        """
+        lowers the tokens of the buckets of an api group to the usage that the exchange reported in the headers of the last response, declared with the tokenBucket or the rateLimitBuckets, like
+            'headers': {
+                'x-mbx-used-weight-1m': {'limit': 1200, 'cost': 1},  # the used units out of a limit
+                'x-ratelimit-remaining': {'cost': 1},  # the remaining units
+            }
+        where cost is the cost of a single unit of the header, a Retry-After header pauses the buckets for the indicated time
+        """
+        response = self.rate_limit_responses.pop(self.get_rate_limit_context(), None)
+        if response is None:
+            return
+        http_status_code, response_headers = response
+        headers = {}
+        for key in response_headers:
+            headers[key.lower()] = response_headers[key]
+        retry_after = Exchange.parse_retry_after(headers.get('retry-after'))
+        for throttle in self.get_api_throttles(api):
+            config = throttle.config
+            if retry_after is not None:
+                throttle.update_tokens(-retry_after * config['refillRate'])
+            usage = config.get('headers') or {}
+            for header in usage:
+                value = self.safe_float(headers, header.lower())
+                if value is not None:
+                    limit = usage[header].get('limit')
+                    remaining = value if limit is None else limit - value
+                    # leave room for the next request
+                    throttle.update_tokens(remaining * usage[header].get('cost', 1) - config['cost'])
+
+    def fetch_request(self, api, request, stream=None):
+        """
+        fetch() of a request signed by fetch2(), the headers of the response adapt the rate limiter of the api group when adaptiveRateLimit is enabled
+        :param str|list api: the api group of the request
+        :param dict request: the url, method, headers and body returned by sign()
+        :param bool|list stream: the stream param of fetch2(), True or the path of keys of the array to stream with fetch_stream()
+        :returns: the decoded response
+        """
+        args = [request['url'], request['method'], request['headers'], request['body']]
+        fetch = self.fetch
+        if stream:
+            fetch = self.fetch_stream
+            args.append(None if stream is True else stream)
+        if not self.adaptiveRateLimit:
+            return fetch(*args)
+        self.rate_limit_responses[self.get_rate_limit_context()] = None
+        try:
+            return fetch(*args)
+        finally:
+            self.adapt_rate_limit(api)
 
-    def throttle(self, cost=None):
-        now = float(self.milliseconds())
-        elapsed = now - self.lastRestRequestTimestamp
-        cost = 1 if cost is None else cost
-        sleep_time = self.rateLimit * cost
-        if elapsed < sleep_time:
-            delay = sleep_time - elapsed
-            time.sleep(delay / 1000.0)
+    @staticmethod
+    def parse_retry_after(value):
+        # delay-seconds or an HTTP-date, returns milliseconds
+        if value is None:
+            return None
+        try:
+            return max(float(value), 0) * 1000
+        except ValueError:
+            date = parsedate(value)
+            if date is None:
+                return None
+            return max(calendar.timegm(date) - time.time(), 0) * 1000
+
+    def submit(self, method, *args):
+        """
+        starts a call in the thread pool of the exchange, the synchronous counterpart of a coroutine passed to asyncio.gather()
+        the requests made by the call still go through the rate limiter
+        :param callable method: a method of the exchange, like self.fetch_markets_by_type
+        :returns concurrent.futures.Future: a future to pass to gather()
+        """
+        if getattr(self.thread_pool_local, 'worker', False):
+            # a call that is already running in the pool runs its own calls inline, so that they never wait for a free thread
+            future = Future()
+            try:
+                future.set_result(method(*args))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+        if self.thread_pool is None:
+            # the threads that submit their first calls together create a single pool
+            with self.thread_pool_lock:
+                if self.thread_pool is None:
+                    self.thread_pool = ThreadPoolExecutor(max_workers=self.thread_pool_size, initializer=Exchange.init_thread_pool_worker, initargs=(self.thread_pool_local,))
+        return self.thread_pool.submit(method, *args)
+
+    @staticmethod
+    def init_thread_pool_worker(thread_pool_local):
+        # the workers must not hold a reference to the exchange
+        thread_pool_local.worker = True
+
+    def gather(self, promises):
+        """
+        waits for the calls started with submit(), the synchronous counterpart of asyncio.gather()
+        :param list promises: futures returned by submit(), other values are returned as they are
+        :returns list: the results in the same order, the exception of the first failed call is raised once all calls are done
+        """
+        wait([promise for promise in promises if isinstance(promise, Future)])
+        return [promise.result() if isinstance(promise, Future) else promise for promise in promises]
 
     @staticmethod
     def gzip_deflate(response, text):
@@ -568,10 +1017,25 @@ class Exchange(object):
         return response_body.strip()
 
     def on_json_response(self, response_body):
-        if self.quoteJsonNumbers:
-            return json.loads(response_body, parse_float=str, parse_int=str)
-        else:
-            return json.loads(response_body)
+        return self.decode_json(response_body, self.quoteJsonNumbers)
+
+    def decode_json(self, body, quote_numbers=False):
+        """
+        decodes a json str or bytes with json_decoder, or with orjson when it is installed and the numbers are not quoted
+        :param bool quote_numbers: keep the numbers as the strings they were sent as, see quoteJsonNumbers
+        """
+        if self.json_decoder is not None:
+            return self.json_decoder(body, quote_numbers)
+        if quote_numbers:
+            # str is called from c by the scanner, orjson has no way to keep the text of the numbers
+            return json.loads(body, parse_float=str, parse_int=str)
+        if orjson is not None:
+            try:
+                return orjson.loads(body)
+            except orjson.JSONDecodeError:
+                # integers of more than 64 bits, NaN and Infinity are only decoded by the standard library
+                pass
+        return json.loads(body)
 
     def fetch(self, url, method='GET', headers=None, body=None):
         """Perform a HTTP request and return decoded JSON data"""
@@ -604,11 +1068,16 @@ class Exchange(object):
             )
             # does not try to detect encoding
             response.encoding = 'utf-8'
+            # the headers are the CaseInsensitiveDict that requests builds for every response, they are not copied
             headers = response.headers
             http_status_code = response.status_code
             http_status_text = response.reason
-            http_response = self.on_rest_response(http_status_code, http_status_text, url, method, headers, response.text, request_headers, request_body)
-            json_response = self.parse_json(http_response)
+            if self.lean_responses:
+                http_response, content = self.lean_response_body(response.content)
+            else:
+                http_response, content = response.text, None
+            http_response = self.on_rest_response(http_status_code, http_status_text, url, method, headers, http_response, request_headers, request_body)
+            json_response = self.parse_json(http_response, content)
             # FIXME remove last_x_responses from subclasses
             if self.enableLastHttpResponse:
                 self.last_http_response = http_response
@@ -616,6 +1085,8 @@ class Exchange(object):
                 self.last_json_response = json_response
             if self.enableLastResponseHeaders:
                 self.last_response_headers = headers
+            if self.adaptiveRateLimit:
+                self.set_rate_limit_response(http_status_code, headers)
             if self.verbose:
                 self.log("\nfetch Response:", self.id, method, url, http_status_code, "ResponseHeaders:", headers, "ResponseBody:", http_response)
             self.logger.debug("%s %s, Response: %s %s %s", method, url, http_status_code, headers, http_response)
@@ -669,13 +1140,148 @@ class Exchange(object):
         else:
             return response.content
 
-    def parse_json(self, http_response):
+    def fetch_stream(self, url, method='GET', headers=None, body=None, path=None):
+        """
+        Perform a HTTP request and return a StreamedArray of the elements of the json array at the path of keys in the response,
+        decoded while the response is received, pass params={'stream': True} or {'stream': [key, ...]} to a method to use it
+        a response that does not start like the array or that has an error status is read whole and handled like fetch() does
+        the response around the array is not returned, the methods that read the array out of it with safe_value() raise a TypeError
+        """
+        request_headers = self.prepare_request_headers(headers)
+        url = self.proxy + url
+
+        if self.verbose:
+            self.log("\nfetch Request:", self.id, method, url, "RequestHeaders:", request_headers, "RequestBody:", body)
+        self.logger.debug("%s %s, Request: %s %s", method, url, request_headers, body)
+
+        request_body = body
+        if body:
+            body = body.encode()
+
+        self.session.cookies.clear()
+
+        details = ' '.join([self.id, method, url])
+
+        def read(chunks):
+            try:
+                yield from chunks
+            except Timeout as e:
+                raise RequestTimeout(details) from e
+            except RequestException as e:
+                raise NetworkError(details) from e
+
+        response = None
+        try:
+            response = self.session.request(
+                method,
+                url,
+                data=body,
+                headers=request_headers,
+                timeout=int(self.timeout / 1000),
+                proxies=self.proxies,
+                verify=self.verify and self.validateServerSsl,
+                stream=True
+            )
+            chunks = read(response.iter_content(self.stream_chunk_size))
+            first = b''
+            for chunk in chunks:
+                first += chunk
+                if first.strip():
+                    break
+        except Timeout as e:
+            raise RequestTimeout(details) from e
+        except RequestException as e:
+            raise NetworkError(details) from e
+        except Exception:
+            if response is not None:
+                response.close()
+            raise
+        headers = response.headers
+        http_status_code = response.status_code
+        http_status_text = response.reason
+        if http_status_code < 400 and first.lstrip()[:1] == (b'{' if path else b'['):
+            if self.verbose:
+                self.log("\nfetch Response:", self.id, method, url, http_status_code, "ResponseHeaders:", headers, "ResponseBody: streamed")
+            self.logger.debug("%s %s, Response: %s %s streamed", method, url, http_status_code, headers)
+            if self.adaptiveRateLimit:
+                self.set_rate_limit_response(http_status_code, headers)
+
+            def finish(parser):
+                self.handle_stream_end(parser, path, http_status_code, http_status_text, url, method, headers, request_headers, request_body)
+
+            return StreamedArray(itertools.chain([first], chunks), JsonArrayParser(path, self.quoteJsonNumbers), response.close, finish)
+        try:
+            content = first + b''.join(chunks)
+        finally:
+            response.close()
+        http_response = self.on_rest_response(http_status_code, http_status_text, url, method, headers, content.decode('utf-8', 'replace'), request_headers, request_body)
+        json_response = self.parse_json(http_response)
+        if self.adaptiveRateLimit:
+            self.set_rate_limit_response(http_status_code, headers)
+        if self.verbose:
+            self.log("\nfetch Response:", self.id, method, url, http_status_code, "ResponseHeaders:", headers, "ResponseBody:", http_response)
+        self.logger.debug("%s %s, Response: %s %s %s", method, url, http_status_code, headers, http_response)
+        skip_further_error_handling = self.handle_errors(http_status_code, http_status_text, url, method, headers, http_response, json_response, request_headers, request_body)
+        if http_status_code >= 400:
+            if not skip_further_error_handling:
+                self.handle_http_status_code(http_status_code, http_status_text, url, method, http_response)
+            raise ExchangeError(details)
+        return json_response if json_response is not None else http_response
+
+    def parse_streamed(self, name, array, argument=None, since=None, limit=None, params={}):
+        """
+        parses the elements of a StreamedArray returned by fetch_stream() as they are decoded, for parse_orders(), parse_trades() and the like
+        :param str name: 'orders', 'trades', 'transactions', 'transfers', 'ohlcvs' or 'tickers'
+        :param argument: the market, the currency or the symbols passed to the parse method
+        :returns StreamedArray|None: None if the array is not streamed
+        """
+        if not isinstance(array, StreamedArray):
+            return None
+        if name == 'ohlcvs':
+            return array.parse(lambda ohlcv: self.parse_ohlcv(ohlcv, argument), since, limit, 0)
+        if name == 'tickers':
+            return array.parse(lambda ticker: self.extend(self.parse_ticker(ticker), params), None, None, 'timestamp', self.market_symbols(argument))
+        # parse_order(), parse_trade(), parse_transaction() or parse_transfer()
+        parse = getattr(self, 'parse_' + name[:-1])
+        return array.parse(lambda item: self.extend(parse(item, argument), params), since, limit)
+
+    def handle_stream_end(self, parser, path, code, reason, url, method, headers, request_headers, request_body):
+        # an object without the path of the array, like the error of an exchange that replies with 200 OK
+        if not parser.found:
+            body = json.dumps(parser.envelope)
+            self.handle_errors(code, reason, url, method, headers, body, parser.envelope, request_headers, request_body)
+            raise ExchangeError(' '.join([self.id, method, url, 'has no', '.'.join(path), body]))
+
+    def parse_json(self, http_response, content=None):
+        """
+        :param str http_response: the text of the response
+        :param memoryview|None content: the bytes of a lean response, decoded instead of the text by orjson, see lean_response_body()
+        """
         try:
             if Exchange.is_json_encoded_object(http_response):
+                if content is not None and orjson is not None and self.json_decoder is None and not self.quoteJsonNumbers:
+                    return self.decode_json(content)
                 return self.on_json_response(http_response)
         except ValueError:  # superclass of JsonDecodeError (python2)
             pass
 
+    @staticmethod
+    def lean_response_body(content):
+        """
+        the text of a lean response and a view of its bytes, without the whitespace around the body
+        the text is decoded once from the view, so on_rest_response() has nothing to strip and neither the bytes nor the text are copied
+        :param bytes content: the body of the response
+        :returns [str, memoryview]: the text and the bytes of the body
+        """
+        start = 0
+        end = len(content)
+        while start < end and content[start] in b' \t\r\n':
+            start += 1
+        while end > start and content[end - 1] in b' \t\r\n':
+            end -= 1
+        view = memoryview(content)[start:end]
+        return str(view, 'utf-8', 'replace'), view
+
     def is_text_response(self, headers):
         # https://github.com/ccxt/ccxt/issues/5302
         content_type = headers.get('Content-Type', '')
@@ -939,6 +1545,9 @@ class Exchange(object):
             result = None
             if type(args[0]) is collections.OrderedDict:
                 result = collections.OrderedDict()
+            elif type(args[0]) is not dict and isinstance(args[0], Record):
+                result = args[0].copy()
+                args = args[1:]
             else:
                 result = {}
             for arg in args:
@@ -946,12 +1555,28 @@ class Exchange(object):
             return result
         return {}
 
+    @staticmethod
+    def deep_extend_shared(defaults, value):
+        """deep_extend(defaults, value) without copying, the result shares the nested dicts that it does not change with its arguments"""
+        result = defaults.copy() if isinstance(defaults, dict) else {}
+        for key, item in value.items():
+            if isinstance(item, dict):
+                default = result.get(key)
+                if isinstance(default, dict):
+                    item = Exchange.deep_extend_shared(default, item)
+            result[key] = item
+        return result
+
     @staticmethod
     def deep_extend(*args):
         result = None
         for arg in args:
-            if isinstance(arg, dict):
-                if not isinstance(result, dict):
+            if isinstance(arg, dict) or isinstance(arg, Record):
+                if not isinstance(result, dict) and not isinstance(result, Record):
+                    if isinstance(arg, Record):
+                        # a record is kept as a record, as in extend()
+                        result = arg.copy()
+                        continue
                     result = {}
                 for key in arg:
                     result[key] = Exchange.deep_extend(result[key] if key in result else None, arg[key])
@@ -1141,20 +1766,7 @@ class Exchange(object):
     def microseconds():
         return int(time.time() * 1000000)
 
-    @staticmethod
-    def iso8601(timestamp=None):
-        if timestamp is None:
-            return timestamp
-        if not isinstance(timestamp, int):
-            return None
-        if int(timestamp) < 0:
-            return None
-
-        try:
-            utc = datetime.datetime.utcfromtimestamp(timestamp // 1000)
-            return utc.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-6] + "{:03d}".format(int(timestamp) % 1000) + 'Z'
-        except (TypeError, OverflowError, OSError):
-            return None
+    iso8601 = staticmethod(format_iso8601)
 
     @staticmethod
     def rfc2616(self, timestamp=None):
@@ -1205,38 +1817,7 @@ class Exchange(object):
         else:
             return Exchange.parse8601(timestamp)
 
-    @staticmethod
-    def parse8601(timestamp=None):
-        if timestamp is None:
-            return timestamp
-        yyyy = '([0-9]{4})-?'
-        mm = '([0-9]{2})-?'
-        dd = '([0-9]{2})(?:T|[\\s])?'
-        h = '([0-9]{2}):?'
-        m = '([0-9]{2}):?'
-        s = '([0-9]{2})'
-        ms = '(\\.[0-9]{1,3})?'
-        tz = '(?:(\\+|\\-)([0-9]{2})\\:?([0-9]{2})|Z)?'
-        regex = r'' + yyyy + mm + dd + h + m + s + ms + tz
-        try:
-            match = re.search(regex, timestamp, re.IGNORECASE)
-            if match is None:
-                return None
-            yyyy, mm, dd, h, m, s, ms, sign, hours, minutes = match.groups()
-            ms = ms or '.000'
-            ms = (ms + '00')[0:4]
-            msint = int(ms[1:])
-            sign = sign or ''
-            sign = int(sign + '1') * -1
-            hours = int(hours or 0) * sign
-            minutes = int(minutes or 0) * sign
-            offset = datetime.timedelta(hours=hours, minutes=minutes)
-            string = yyyy + mm + dd + h + m + s + ms + 'Z'
-            dt = datetime.datetime.strptime(string, "%Y%m%d%H%M%S.%fZ")
-            dt = dt + offset
-            return calendar.timegm(dt.utctimetuple()) * 1000 + msint
-        except (TypeError, OverflowError, OSError, ValueError):
-            return None
+    parse8601 = staticmethod(parse_iso8601)
 
     @staticmethod
     def hash(request, algorithm='md5', digest='hex'):
@@ -1443,11 +2024,198 @@ class Exchange(object):
                 if not self.markets_by_id:
                     return self.set_markets(self.markets)
                 return self.markets
+            if (self.shared_markets or self.markets_cache_path) and self.restore_markets(params):
+                return self.markets
         currencies = None
         if self.has['fetchCurrencies'] is True:
             currencies = self.fetch_currencies()
         markets = self.fetch_markets(params)
-        return self.set_markets(markets, currencies)
+        result = self.set_markets(markets, currencies)
+        if self.shared_markets or self.markets_cache_path:
+            self.store_markets(params)
+        return result
+
+    def reload_markets(self, params={}):
+        """
+        fetches the markets again, the markets that did not change are kept as the same objects
+        :param dict params: extra parameters for load_markets()
+        :returns dict: the lists of symbols that were 'added', 'removed' and 'changed'
+        """
+        self.load_markets(True, params)
+        return self.markets_changes
+
+    def previous_market_values(self, defaults):
+        """
+        the raw values of the loaded markets by id and symbol, the markets whose raw values did not change are kept on reload
+        :param dict defaults: the fields that set_markets() merges into every market, they are remembered for the next reload
+        :returns dict|None: None on the first load, or if the defaults changed, a value is None if there were several
+        """
+        previousValues = None
+        if (self.markets_by_id is not None) and (defaults == self.market_defaults):
+            previousValues = {}
+            for previousValuesById in self.markets_by_id.values():
+                for previousValue in previousValuesById:
+                    key = (previousValue['id'], previousValue['symbol'])
+                    previousValues[key] = None if (key in previousValues) else previousValue
+        self.market_defaults = defaults
+        return previousValues
+
+    def unchanged_market(self, previousMarkets, previousValues, value):
+        if previousValues is None:
+            return None
+        previousMarket = previousMarkets.get(value['symbol'])
+        if (previousMarket is not None) and (previousMarket['id'] == value['id']) and (previousValues.get((value['id'], value['symbol'])) == value):
+            return previousMarket
+        return None
+
+    def set_markets_changes(self, previousMarkets):
+        markets = self.markets
+        previous = previousMarkets or {}
+        changes = {
+            'added': sorted(symbol for symbol in markets if symbol not in previous),
+            'removed': sorted(symbol for symbol in previous if symbol not in markets),
+            # set_markets() keeps the objects of the markets that did not change
+            'changed': sorted(symbol for symbol in markets if (symbol in previous) and (markets[symbol] is not previous[symbol]) and (markets[symbol] != previous[symbol])),
+        }
+        self.markets_changes = changes
+        if (previousMarkets is not None) and (self.on_markets_changed is not None) and (changes['added'] or changes['removed'] or changes['changed']):
+            self.on_markets_changed(self, changes)
+
+    def compile_precision_formatters(self, markets):
+        """
+        compiles the formatters of price_to_precision(), amount_to_precision() and cost_to_precision() once for the markets, called by set_markets()
+        :param dict[] markets: unified market structures
+        """
+        self.precision_formatters = {}
+        for market in markets:
+            marketPrecision = market.get('precision')
+            if isinstance(marketPrecision, dict) and (market.get('symbol') is not None):
+                if marketPrecision.get('price') is not None:
+                    self.market_precision_formatter(market, 'price', ROUND)
+                    self.market_precision_formatter(market, 'price', TRUNCATE)
+                if marketPrecision.get('amount') is not None:
+                    self.market_precision_formatter(market, 'amount', TRUNCATE)
+
+    def decimal_to_market_precision(self, x, rounding_mode, market, key):
+        return self.market_precision_formatter(market, key, rounding_mode)(x)
+
+    def market_precision_formatter(self, market, key, rounding_mode):
+        """
+        the decimal_to_precision() of a precision of a market, compiled by set_markets()
+        it is compiled again when the precision of the market, the precisionMode or the paddingMode change
+        :param dict market: a unified market structure
+        :param str key: 'price' or 'amount'
+        :returns callable: formats a number like self.decimal_to_precision(number, rounding_mode, market['precision'][key], self.precisionMode, self.paddingMode)
+        """
+        precision = market['precision'][key]
+        cache_key = (market['symbol'], key, rounding_mode)
+        cached = self.precision_formatters.get(cache_key)
+        if cached is not None:
+            cached_precision, formatter = cached
+            if (cached_precision is precision) and (formatter.counting_mode == self.precisionMode) and (formatter.padding_mode == self.paddingMode):
+                return formatter
+        formatter = precision_formatter(rounding_mode, precision, self.precisionMode, self.paddingMode)
+        self.precision_formatters[cache_key] = (precision, formatter)
+        return formatter
+
+    def record(self, name, structure):
+        """
+        the unified structure as a record with __slots__ when self.records is True, see ccxt.base.records
+        :param str name: 'trade', 'order', 'ticker' or 'ledger'
+        :param dict structure: a unified structure
+        :returns dict|Record: the structure itself when the records are disabled
+        """
+        if not self.records or isinstance(structure, Record):
+            return structure
+        return self.record_types[name](structure, self.records_info)
+
+    def restore_markets(self, params={}):
+        """
+        restores the markets loaded by another instance of the same class, see shared_markets, or saved to markets_cache_path
+        the workers forked after the markets are loaded with shared_markets find them in shared_markets_store, in the pages inherited from the parent
+        the spawned workers have no such pages, each of them reads markets_cache_path once, python objects cannot be mapped between processes
+        without being decoded in each of them, since reading an object writes its reference count
+        :param dict params: the params of load_markets()
+        :returns bool: True if the markets were restored, False if they have to be fetched
+        """
+        if self.shared_markets:
+            markets = Exchange.shared_markets_store.get(self.get_shared_markets_key(params))
+            if markets is not None:
+                for name, value in markets.items():
+                    setattr(self, name, value)
+                return True
+        if self.markets_cache_path and self.load_markets_from_cache(params):
+            if self.shared_markets:
+                Exchange.shared_markets_store[self.get_shared_markets_key(params)] = {name: getattr(self, name, None) for name in self.loaded_markets_keys}
+            return True
+        return False
+
+    def store_markets(self, params={}):
+        """
+        shares the freshly loaded markets with the other instances of the same class and saves them to markets_cache_path
+        the shared markets are never modified in place, a reload builds a new set and the instances holding the previous one keep it
+        :param dict params: the params of load_markets()
+        """
+        if self.shared_markets:
+            Exchange.shared_markets_store[self.get_shared_markets_key(params)] = {name: getattr(self, name, None) for name in self.loaded_markets_keys}
+        if self.markets_cache_path:
+            self.save_markets_to_cache(params)
+
+    def get_shared_markets_key(self, params={}):
+        return (type(self), json.dumps([self.urls['api'], params], sort_keys=True, default=str))
+
+    def get_markets_cache_file(self, params={}):
+        if os.path.isdir(self.markets_cache_path):
+            # the sandbox and the production urls load different markets, and so do the params of load_markets()
+            digest = hashlib.md5(json.dumps([self.urls['api'], params], sort_keys=True, default=str).encode()).hexdigest()
+            return os.path.join(self.markets_cache_path, self.id + '-' + __version__ + '-' + digest[0:8] + '.pickle')
+        return self.markets_cache_path
+
+    def get_markets_cache_key(self, params={}):
+        return [__version__, self.id, self.urls['api'], params]
+
+    def load_markets_from_cache(self, params={}):
+        """
+        restores the markets saved by save_markets_to_cache(), the cache file must not be writable by untrusted users
+        :param dict params: the params of load_markets(), part of the cache key
+        :returns bool: True if the markets were restored, False if the cache is missing, expired or belongs to a different version, exchange or api
+        """
+        try:
+            with open(self.get_markets_cache_file(params), 'rb') as file:
+                cache = pickle.load(file)
+        except Exception:
+            # a missing or unreadable cache is not an error, the markets are fetched from the exchange
+            return False
+        if cache['key'] != self.get_markets_cache_key(params):
+            return False
+        if self.markets_cache_ttl is not None and self.milliseconds() - cache['timestamp'] > self.markets_cache_ttl:
+            return False
+        for name, value in cache['markets'].items():
+            setattr(self, name, value)
+        return True
+
+    def save_markets_to_cache(self, params={}):
+        """
+        stores the normalized markets and currencies to markets_cache_path for the next load_markets() calls
+        :param dict params: the params of load_markets(), part of the cache key
+        """
+        path = self.get_markets_cache_file(params)
+        cache = {
+            'key': self.get_markets_cache_key(params),
+            'timestamp': self.milliseconds(),
+            'markets': {name: getattr(self, name, None) for name in self.loaded_markets_keys},
+        }
+        # written to a temporary file and renamed, so that concurrent readers never see a partial cache
+        temporary = None
+        try:
+            descriptor, temporary = tempfile.mkstemp(prefix='.' + os.path.basename(path), dir=os.path.dirname(os.path.abspath(path)))
+            with os.fdopen(descriptor, 'wb') as file:
+                pickle.dump(cache, file, pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, path)
+        except Exception as e:
+            if temporary and os.path.exists(temporary):
+                os.remove(temporary)
+            self.logger.warning('%s failed to save the markets cache to %s: %s', self.id, path, e)
 
     def load_fees(self, reload=False):
         if not reload:
@@ -1713,13 +2481,17 @@ class Exchange(object):
         return ''.join(string)
 
     def parse_number(self, value, default=None):
-        if value is None:
+        if value is None or value == '':
+            # the exchanges send empty strings for the missing values
+            return default
+        number = self.number
+        if number is Decimal and value.__class__ is float:
+            # the shortest repr, Decimal(0.1) is 0.1000000000000000055511151231257827021181583404541015625
+            value = repr(value)
+        try:
+            return number(value)
+        except Exception:
             return default
-        else:
-            try:
-                return self.number(value)
-            except Exception:
-                return default
 
     def omit_zero(self, string_number):
         if string_number is None or string_number == '':
@@ -1818,7 +2590,7 @@ class Exchange(object):
         if fee is not None:
             fee['cost'] = self.safe_number(fee, 'cost')
         timestamp = self.safe_integer(entry, 'timestamp')
-        return {
+        return self.record('ledger', {
             'id': self.safe_string(entry, 'id'),
             'timestamp': timestamp,
             'datetime': self.iso8601(timestamp),
@@ -1834,24 +2606,41 @@ class Exchange(object):
             'status': self.safe_string(entry, 'status'),
             'fee': fee,
             'info': entry,
-        }
+        })
 
     def set_markets(self, markets, currencies=None):
         values = []
+        # the common fields are merged once, not once for every entry
+        defaults = self.deep_extend(self.safe_market(), {
+            'precision': self.precision,
+            'limits': self.limits,
+        }, self.fees['trading'])
+        # on reload the entries that did not change are kept as they are
+        previousMarkets = self.markets if (self.markets_by_id is not None) else None
+        previousValues = self.previous_market_values(defaults)
         self.markets_by_id = {}
         # handle marketId conflicts
         # we insert spot markets first
-        marketValues = self.sort_by(self.to_array(markets), 'spot', True)
+        spotValues = []
+        otherValues = []
+        allValues = self.to_array(markets)
+        for i in range(0, len(allValues)):
+            value = allValues[i]
+            if value['spot']:
+                spotValues.append(value)
+            else:
+                otherValues.append(value)
+        marketValues = self.array_concat(spotValues, otherValues)
         for i in range(0, len(marketValues)):
             value = marketValues[i]
-            if value['id'] in self.markets_by_id:
-                self.markets_by_id[value['id']].append(value)
+            id = value['id']
+            if id in self.markets_by_id:
+                self.markets_by_id[id].append(value)
             else:
-                self.markets_by_id[value['id']] = [value]
-            market = self.deep_extend(self.safe_market(), {
-                'precision': self.precision,
-                'limits': self.limits,
-            }, self.fees['trading'], value)
+                self.markets_by_id[id] = [value]
+            market = self.unchanged_market(previousMarkets, previousValues, value)
+            if market is None:
+                market = self.deep_extend_shared(defaults, value)
             values.append(market)
         self.markets = self.index_by(values, 'symbol')
         marketsSortedBySymbol = self.keysort(self.markets)
@@ -1859,13 +2648,16 @@ class Exchange(object):
         self.symbols = list(marketsSortedBySymbol.keys())
         self.ids = list(marketsSortedById.keys())
         if currencies is not None:
-            self.currencies = self.deep_extend(self.currencies, currencies)
+            self.currencies = self.deep_extend_shared(self.currencies, currencies)
         else:
-            baseCurrencies = []
-            quoteCurrencies = []
+            defaultCurrencyPrecision = 8 if (self.precisionMode == DECIMAL_PLACES) else self.parse_number('1e-8')
+            baseCurrencies = {}
+            quoteCurrencies = {}
+            # the most precise entry of every base and of every quote, a quote entry replaces a base entry only if it is more precise
+            highestPrecisionBaseCurrencies = {}
+            highestPrecisionQuoteCurrencies = {}
             for i in range(0, len(values)):
                 market = values[i]
-                defaultCurrencyPrecision = 8 if (self.precisionMode == DECIMAL_PLACES) else self.parse_number('1e-8')
                 marketPrecision = self.safe_value(market, 'precision', {})
                 if 'base' in market:
                     currencyPrecision = self.safe_value_2(marketPrecision, 'base', 'amount', defaultCurrencyPrecision)
@@ -1875,7 +2667,11 @@ class Exchange(object):
                         'code': self.safe_string(market, 'base'),
                         'precision': currencyPrecision,
                     }
-                    baseCurrencies.append(currency)
+                    code = currency['code']
+                    if code is not None:
+                        baseCurrencies[code] = currency
+                        if not (code in highestPrecisionBaseCurrencies) or self.has_higher_currency_precision(currency, highestPrecisionBaseCurrencies[code]):
+                            highestPrecisionBaseCurrencies[code] = currency
                 if 'quote' in market:
                     currencyPrecision = self.safe_value_2(marketPrecision, 'quote', 'price', defaultCurrencyPrecision)
                     currency = {
@@ -1884,33 +2680,33 @@ class Exchange(object):
                         'code': self.safe_string(market, 'quote'),
                         'precision': currencyPrecision,
                     }
-                    quoteCurrencies.append(currency)
-            baseCurrencies = self.sort_by(baseCurrencies, 'code')
-            quoteCurrencies = self.sort_by(quoteCurrencies, 'code')
-            self.baseCurrencies = self.index_by(baseCurrencies, 'code')
-            self.quoteCurrencies = self.index_by(quoteCurrencies, 'code')
-            allCurrencies = self.array_concat(baseCurrencies, quoteCurrencies)
-            groupedCurrencies = self.group_by(allCurrencies, 'code')
-            codes = list(groupedCurrencies.keys())
-            resultingCurrencies = []
-            for i in range(0, len(codes)):
-                code = codes[i]
-                groupedCurrenciesCode = self.safe_value(groupedCurrencies, code, [])
-                highestPrecisionCurrency = self.safe_value(groupedCurrenciesCode, 0)
-                for j in range(1, len(groupedCurrenciesCode)):
-                    currentCurrency = groupedCurrenciesCode[j]
-                    if self.precisionMode == TICK_SIZE:
-                        highestPrecisionCurrency = currentCurrency if (currentCurrency['precision'] < highestPrecisionCurrency['precision']) else highestPrecisionCurrency
-                    else:
-                        highestPrecisionCurrency = currentCurrency if (currentCurrency['precision'] > highestPrecisionCurrency['precision']) else highestPrecisionCurrency
-                resultingCurrencies.append(highestPrecisionCurrency)
-            sortedCurrencies = self.sort_by(resultingCurrencies, 'code')
-            self.currencies = self.deep_extend(self.currencies, self.index_by(sortedCurrencies, 'code'))
+                    code = currency['code']
+                    if code is not None:
+                        quoteCurrencies[code] = currency
+                        if not (code in highestPrecisionQuoteCurrencies) or self.has_higher_currency_precision(currency, highestPrecisionQuoteCurrencies[code]):
+                            highestPrecisionQuoteCurrencies[code] = currency
+            self.baseCurrencies = self.keysort(baseCurrencies)
+            self.quoteCurrencies = self.keysort(quoteCurrencies)
+            resultingCurrencies = self.extend({}, highestPrecisionBaseCurrencies)
+            quoteCodes = list(highestPrecisionQuoteCurrencies.keys())
+            for i in range(0, len(quoteCodes)):
+                code = quoteCodes[i]
+                quoteCurrency = highestPrecisionQuoteCurrencies[code]
+                if not (code in resultingCurrencies) or self.has_higher_currency_precision(quoteCurrency, resultingCurrencies[code]):
+                    resultingCurrencies[code] = quoteCurrency
+            self.currencies = self.deep_extend_shared(self.currencies, self.keysort(resultingCurrencies))
         self.currencies_by_id = self.index_by(self.currencies, 'id')
         currenciesSortedByCode = self.keysort(self.currencies)
         self.codes = list(currenciesSortedByCode.keys())
+        self.compile_precision_formatters(values)
+        self.set_markets_changes(previousMarkets)
         return self.markets
 
+    def has_higher_currency_precision(self, currency, other):
+        if self.precisionMode == TICK_SIZE:
+            return currency['precision'] < other['precision']
+        return currency['precision'] > other['precision']
+
     def safe_balance(self, balance):
         balances = self.omit(balance, ['info', 'timestamp', 'datetime', 'free', 'used', 'total'])
         codes = list(balances.keys())
@@ -2077,11 +2873,10 @@ class Exchange(object):
             else:
                 multiplyPrice = average
             # contract trading
-            filledTimesContractSize = Precise.string_mul(filled, contractSize)
             if inverse:
-                cost = Precise.string_div(filledTimesContractSize, multiplyPrice)
+                cost = Precise.string_mul_div(filled, contractSize, multiplyPrice)
             else:
-                cost = Precise.string_mul(filledTimesContractSize, multiplyPrice)
+                cost = Precise.string_mul_mul(filled, contractSize, multiplyPrice)
         # support for market orders
         orderType = self.safe_value(order, 'type')
         emptyPrice = (price is None) or Precise.string_equals(price, '0')
@@ -2110,7 +2905,7 @@ class Exchange(object):
         elif postOnly is None:
             # timeInForce is not None here
             postOnly = timeInForce == 'PO'
-        return self.extend(order, {
+        return self.record('order', self.extend(order, {
             'symbol': symbol,
             'side': side,
             'lastTradeTimestamp': lastTradeTimeTimestamp,
@@ -2123,9 +2918,12 @@ class Exchange(object):
             'timeInForce': timeInForce,
             'postOnly': postOnly,
             'trades': trades,
-        })
+        }))
 
     def parse_orders(self, orders, market=None, since=None, limit=None, params={}):
+        streamed = self.parse_streamed('orders', orders, market, since, limit, params)
+        if streamed is not None:
+            return streamed
         #
         # the value of orders is either a dict or a list
         #
@@ -2215,13 +3013,12 @@ class Exchange(object):
         if cost is None:
             # contract trading
             contractSize = self.safe_string(market, 'contractSize')
-            multiplyPrice = price
             if contractSize is not None:
                 inverse = self.safe_value(market, 'inverse', False)
-                if inverse:
-                    multiplyPrice = Precise.string_div('1', price)
-                multiplyPrice = Precise.string_mul(multiplyPrice, contractSize)
-            cost = Precise.string_mul(multiplyPrice, amount)
+                multiplyPrice = Precise.string_div('1', price) if inverse else price
+                cost = Precise.string_mul_mul(multiplyPrice, contractSize, amount)
+            else:
+                cost = Precise.string_mul(price, amount)
         parseFee = self.safe_value(trade, 'fee') is None
         parseFees = self.safe_value(trade, 'fees') is None
         shouldParseFees = parseFee or parseFees
@@ -2252,7 +3049,7 @@ class Exchange(object):
         trade['amount'] = self.parse_number(amount)
         trade['price'] = self.parse_number(price)
         trade['cost'] = self.parse_number(cost)
-        return trade
+        return self.record('trade', trade)
 
     def reduce_fees_by_currency(self, fees):
         #
@@ -2353,12 +3150,12 @@ class Exchange(object):
         if (percentage is None) and (change is not None) and (open is not None) and Precise.string_gt(open, '0'):
             percentage = Precise.string_mul(Precise.string_div(change, open), '100')
         if (change is None) and (percentage is not None) and (open is not None):
-            change = Precise.string_div(Precise.string_mul(percentage, open), '100')
+            change = Precise.string_mul_div(percentage, open, '100')
         if (open is None) and (last is not None) and (change is not None):
             open = Precise.string_sub(last, change)
         # timestamp and symbol operations don't belong in safeTicker
         # they should be done in the derived classes
-        return self.extend(ticker, {
+        return self.record('ticker', self.extend(ticker, {
             'bid': self.safe_number(ticker, 'bid'),
             'bidVolume': self.safe_number(ticker, 'bidVolume'),
             'ask': self.safe_number(ticker, 'ask'),
@@ -2375,7 +3172,7 @@ class Exchange(object):
             'baseVolume': self.parse_number(baseVolume),
             'quoteVolume': self.parse_number(quoteVolume),
             'previousClose': self.safe_number(ticker, 'previousClose'),
-        })
+        }))
 
     def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=None, params={}):
         if not self.has['fetchTrades']:
@@ -2664,6 +3461,9 @@ class Exchange(object):
         }
 
     def parse_ohlcvs(self, ohlcvs, market=None, timeframe='1m', since=None, limit=None):
+        streamed = self.parse_streamed('ohlcvs', ohlcvs, market, since, limit)
+        if streamed is not None:
+            return streamed
         results = []
         for i in range(0, len(ohlcvs)):
             results.append(self.parse_ohlcv(ohlcvs[i], market))
@@ -2713,6 +3513,9 @@ class Exchange(object):
         return result
 
     def parse_trades(self, trades, market=None, since=None, limit=None, params={}):
+        streamed = self.parse_streamed('trades', trades, market, since, limit, params)
+        if streamed is not None:
+            return streamed
         trades = self.to_array(trades)
         result = []
         for i in range(0, len(trades)):
@@ -2724,6 +3527,9 @@ class Exchange(object):
         return self.filter_by_symbol_since_limit(result, symbol, since, limit, tail)
 
     def parse_transactions(self, transactions, currency=None, since=None, limit=None, params={}):
+        streamed = self.parse_streamed('transactions', transactions, currency, since, limit, params)
+        if streamed is not None:
+            return streamed
         transactions = self.to_array(transactions)
         result = []
         for i in range(0, len(transactions)):
@@ -2735,6 +3541,9 @@ class Exchange(object):
         return self.filter_by_currency_since_limit(result, code, since, limit, tail)
 
     def parse_transfers(self, transfers, currency=None, since=None, limit=None, params={}):
+        streamed = self.parse_streamed('transfers', transfers, currency, since, limit, params)
+        if streamed is not None:
+            return streamed
         transfers = self.to_array(transfers)
         result = []
         for i in range(0, len(transfers)):
@@ -2794,12 +3603,22 @@ class Exchange(object):
         return self.index_by(results, key) if indexed else results
 
     def fetch2(self, path, api='public', method='GET', params={}, headers=None, body=None, config={}, context={}):
+        if self.coalesceRequests and self.is_public_request(api, method, params):
+            return self.coalesce_request(path, api, method, params, headers, body, config, context)
+        return self.send_request(path, api, method, params, headers, body, config, context)
+
+    def send_request(self, path, api='public', method='GET', params={}, headers=None, body=None, config={}, context={}, request=None):
         if self.enableRateLimit:
             cost = self.calculate_rate_limiter_cost(api, method, path, params, config, context)
-            self.throttle(cost)
+            priority = self.calculate_rate_limiter_priority(api, method, path, params, config, context)
+            self.throttle_api(api, cost, priority)
+        stream = self.safe_value(params, 'stream')
+        if ('rateLimitPriority' in params) or ('stream' in params):
+            params = self.omit(params, ['rateLimitPriority', 'stream'])
         self.lastRestRequestTimestamp = self.milliseconds()
-        request = self.sign(path, api, method, params, headers, body)
-        return self.fetch(request['url'], request['method'], request['headers'], request['body'])
+        if request is None:
+            request = self.sign(path, api, method, params, headers, body)
+        return self.fetch_request(api, request, stream)
 
     def request(self, path, api='public', method='GET', params={}, headers=None, body=None, config={}, context={}):
         return self.fetch2(path, api, method, params, headers, body, config, context)
@@ -3255,25 +4074,25 @@ class Exchange(object):
 
     def cost_to_precision(self, symbol, cost):
         market = self.market(symbol)
-        return self.decimal_to_precision(cost, TRUNCATE, market['precision']['price'], self.precisionMode, self.paddingMode)
+        return self.decimal_to_market_precision(cost, TRUNCATE, market, 'price')
 
     def price_to_precision(self, symbol, price):
         market = self.market(symbol)
-        result = self.decimal_to_precision(price, ROUND, market['precision']['price'], self.precisionMode, self.paddingMode)
+        result = self.decimal_to_market_precision(price, ROUND, market, 'price')
         if result == '0':
             raise ArgumentsRequired(self.id + ' price of ' + market['symbol'] + ' must be greater than minimum price precision of ' + self.number_to_string(market['precision']['price']))
         return result
 
     def amount_to_precision(self, symbol, amount):
         market = self.market(symbol)
-        result = self.decimal_to_precision(amount, TRUNCATE, market['precision']['amount'], self.precisionMode, self.paddingMode)
+        result = self.decimal_to_market_precision(amount, TRUNCATE, market, 'amount')
         if result == '0':
             raise ArgumentsRequired(self.id + ' amount of ' + market['symbol'] + ' must be greater than minimum amount precision of ' + self.number_to_string(market['precision']['amount']))
         return result
 
     def fee_to_precision(self, symbol, fee):
         market = self.market(symbol)
-        return self.decimal_to_precision(fee, ROUND, market['precision']['price'], self.precisionMode, self.paddingMode)
+        return self.decimal_to_market_precision(fee, ROUND, market, 'price')
 
     def currency_to_precision(self, code, fee, networkCode=None):
         currency = self.currencies[code]
@@ -3362,6 +4181,9 @@ class Exchange(object):
         return self.filter_by_value_since_limit(array, 'currency', code, since, limit, 'timestamp', tail)
 
     def parse_tickers(self, tickers, symbols=None, params={}):
+        streamed = self.parse_streamed('tickers', tickers, symbols, None, None, params)
+        if streamed is not None:
+            return streamed
         #
         # the value of tickers is either a dict or a list
         #
@@ -0,0 +1,120 @@
+"""The ISO8601 strings of the timestamps in milliseconds, and the timestamps of the ISO8601 strings"""
+
+import datetime
+import re
+import time
+
+__all__ = [
+    'format_iso8601',
+    'matches_iso8601',
+    'parse_iso8601',
+]
+
+EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+MIN_SECONDS = (datetime.date.min.toordinal() - EPOCH_ORDINAL) * 86400  # 0001-01-01T00:00:00
+MAX_SECONDS = (datetime.date.max.toordinal() - EPOCH_ORDINAL + 1) * 86400 - 1  # 9999-12-31T23:59:59
+CACHE_SIZE = 1024  # the seconds kept by each cache, a cache is emptied once it is full
+MILLISECONDS = tuple('.{:03d}Z'.format(i) for i in range(1000))
+ISO8601 = re.compile(
+    r'([0-9]{4})-?([0-9]{2})-?([0-9]{2})(?:T|[\s])?([0-9]{2}):?([0-9]{2}):?([0-9]{2})(\.[0-9]{1,3})?(?:(\+|\-)([0-9]{2})\:?([0-9]{2})|Z)?',
+    re.IGNORECASE)
+
+seconds_cache = {}  # the seconds since the epoch -> 'YYYY-MM-DDTHH:MM:SS'
+parsed_cache = {}  # 'YYYY-MM-DDTHH:MM:SS' -> the seconds since the epoch
+
+
+def format_seconds(seconds):
+    if seconds > MAX_SECONDS:
+        return None
+    try:
+        utc = time.gmtime(seconds)
+    except (OverflowError, OSError, ValueError):
+        return None
+    result = '%04d-%02d-%02dT%02d:%02d:%02d' % utc[:6]
+    if len(seconds_cache) >= CACHE_SIZE:
+        seconds_cache.clear()
+    seconds_cache[seconds] = result
+    return result
+
+
+def format_iso8601(timestamp=None):
+    # 'YYYY-MM-DDTHH:MM:SS.sssZ', the timestamps of the same second share the formatting of the seconds
+    if timestamp is None:
+        return timestamp
+    if not isinstance(timestamp, int) or timestamp < 0:
+        return None
+    seconds, milliseconds = divmod(timestamp, 1000)
+    result = seconds_cache.get(seconds) or format_seconds(seconds)
+    if result is None:
+        return None
+    return result + MILLISECONDS[milliseconds]
+
+
+def matches_iso8601(timestamp, string):
+    # string == format_iso8601(timestamp), compared with the cached seconds of the timestamp without formatting it again
+    if string is None or timestamp is None:
+        return format_iso8601(timestamp) == string
+    if not isinstance(timestamp, int) or timestamp < 0 or not isinstance(string, str) or len(string) != 24:
+        return False
+    seconds, milliseconds = divmod(timestamp, 1000)
+    prefix = seconds_cache.get(seconds)
+    if prefix is None:
+        return format_iso8601(timestamp) == string
+    return string.startswith(prefix) and string.endswith(MILLISECONDS[milliseconds])
+
+
+def parse_seconds(string):
+    # the seconds since the epoch of 'YYYY-MM-DDTHH:MM:SS', None if it is not in this shape
+    if string[4] != '-' or string[7] != '-' or string[10] != 'T' or string[13] != ':' or string[16] != ':':
+        return None
+    if not (string[0:4] + string[5:7] + string[8:10] + string[11:13] + string[14:16] + string[17:19]).isdigit():
+        return None
+    hours, minutes, seconds = int(string[11:13]), int(string[14:16]), int(string[17:19])
+    if hours > 23 or minutes > 59 or seconds > 59:
+        raise ValueError('time out of range')
+    result = days(string[0:4], string[5:7], string[8:10]) * 86400 + hours * 3600 + minutes * 60 + seconds
+    if len(parsed_cache) >= CACHE_SIZE:
+        parsed_cache.clear()
+    parsed_cache[string] = result
+    return result
+
+
+def days(year, month, day):
+    # the days since the epoch, raises a ValueError for a date that does not exist
+    return datetime.date(int(year), int(month), int(day)).toordinal() - EPOCH_ORDINAL
+
+
+def parse_iso8601(timestamp=None):
+    # 'YYYY-MM-DDTHH:MM:SS.sssZ' and 'YYYY-MM-DDTHH:MM:SSZ' are read at their positions, the strings of the same second share the parsing of the seconds
+    # the other shapes are matched with the ISO8601 expression, all of them are converted with the integers of their fields
+    if timestamp is None:
+        return timestamp
+    try:
+        length = len(timestamp)
+        if (length == 24 or length == 20) and timestamp[-1] == 'Z':
+            prefix = timestamp[0:19]
+            seconds = parsed_cache.get(prefix)
+            if seconds is None:
+                seconds = parse_seconds(prefix)
+            if seconds is not None:
+                if length == 20:
+                    return seconds * 1000
+                milliseconds = timestamp[20:23]
+                if timestamp[19] == '.' and milliseconds.isdigit():
+                    return seconds * 1000 + int(milliseconds)
+        match = ISO8601.search(timestamp)
+        if match is None:
+            return None
+        yyyy, mm, dd, h, m, s, ms, sign, offset_hours, offset_minutes = match.groups()
+        hours, minutes, seconds = int(h), int(m), int(s)
+        if hours > 23 or minutes > 59 or seconds > 59:
+            return None
+        result = days(yyyy, mm, dd) * 86400 + hours * 3600 + minutes * 60 + seconds
+        if sign is not None:
+            offset = int(offset_hours) * 3600 + int(offset_minutes) * 60
+            result = result - offset if sign == '+' else result + offset
+            if result < MIN_SECONDS or result > MAX_SECONDS:
+                return None
+        return result * 1000 + (int((ms + '00')[1:4]) if ms else 0)
+    except (TypeError, ValueError):
+        return None
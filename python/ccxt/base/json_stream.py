@@ -0,0 +1,314 @@
+"""The elements of a json array decoded as the chunks of a response are received"""
+
+import codecs
+import json
+import re
+
+__all__ = [
+    'JsonArrayParser',
+    'StreamedArray',
+    'AsyncStreamedArray',
+]
+
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+NUMBER_TAIL = re.compile(r'[0-9.eE+-]*\Z')  # what may follow a number that is cut by the end of a chunk
+STRING_SPECIAL = re.compile(r'["\\]')  # the end of a string or an escape in it
+NESTED = re.compile(r'["\[\]{}]')  # the tokens that change the nesting inside an object or an array
+TOP_LEVEL = re.compile(r'["\[\]{},\s]')  # the same, and the delimiters that end a number, true, false or null
+
+
+class JsonArrayParser:
+    """
+    an incremental decoder of the elements of the json array at a path of keys, [] for an array at the top level
+    the elements are decoded one by one with the scanner of the standard library, the other values on the path are kept in the envelope
+    """
+
+    def __init__(self, path=None, quote_numbers=True):
+        self.path = path or []
+        self.decoder = json.JSONDecoder(parse_float=str, parse_int=str) if quote_numbers else json.JSONDecoder()
+        self.text = codecs.getincrementaldecoder('utf-8')('replace')
+        self.buffer = ''
+        self.position = 0
+        self.depth = 0  # the keys of the path that were found
+        self.state = 'value'
+        self.key = None
+        self.envelope = {}  # the other values of the objects on the path, up to the array
+        self.found = False  # the array was found at the path
+        self.pending = None  # the chunks of a value that is not complete yet, see wait()
+        self.nesting = 0  # the objects and arrays of the pending value that are open
+        self.in_string = False
+        self.escape = False
+
+    def decode(self, final):
+        value, end = self.decoder.raw_decode(self.buffer, self.position)
+        if not final and self.buffer[self.position] in '-0123456789' and NUMBER_TAIL.match(self.buffer, end):
+            # a number at the end of the buffer may be truncated, it is decoded once more data is received
+            raise ValueError('incomplete')
+        self.position = end
+        return value
+
+    def wait(self):
+        """
+        keeps the value at the position, that is not complete yet, out of the buffer until scan() finds its end in the next chunks
+        the chunks are joined once, instead of the value being copied and decoded again with every chunk
+        :returns bool: the end of the value is in the buffer already, then the value is not valid json
+        """
+        self.pending = [self.buffer[self.position:]]
+        self.buffer = ''
+        self.position = 0
+        self.nesting = 0
+        self.in_string = False
+        self.escape = False
+        return self.scan(self.pending[0])
+
+    def scan(self, text):
+        """
+        follows the strings and the nesting of the pending value in the next text, from where the previous text ended
+        :returns bool: the end of the value is in the text
+        """
+        position = 0
+        length = len(text)
+        while position < length:
+            if self.escape:
+                position += 1
+                self.escape = False
+            elif self.in_string:
+                match = STRING_SPECIAL.search(text, position)
+                if match is None:
+                    return False
+                position = match.end()
+                if match.group() == '\\':
+                    self.escape = True
+                else:
+                    self.in_string = False
+                    if self.nesting == 0:
+                        return True
+            else:
+                match = (NESTED if self.nesting else TOP_LEVEL).search(text, position)
+                if match is None:
+                    return False
+                position = match.end()
+                char = match.group()
+                if char == '"':
+                    self.in_string = True
+                elif char in '[{':
+                    self.nesting += 1
+                elif self.nesting == 0:
+                    # the delimiter after a number, true, false or null
+                    return True
+                else:
+                    self.nesting -= 1
+                    if self.nesting == 0:
+                        return True
+        return False
+
+    def feed(self, data, final=False):
+        """
+        :param bytes data: the next chunk of the response
+        :param bool final: the response is complete
+        :returns list: the elements decoded from the chunk
+        """
+        text = self.text.decode(data, final)
+        if self.pending is not None:
+            self.pending.append(text)
+            if not self.scan(text) and not final:
+                return []
+            self.buffer = ''.join(self.pending)
+            self.pending = None
+        else:
+            self.buffer = self.buffer[self.position:] + text
+        self.position = 0
+        items = []
+        while self.state != 'done':
+            self.position = WHITESPACE.match(self.buffer, self.position).end()
+            if self.position == len(self.buffer):
+                break
+            char = self.buffer[self.position]
+            try:
+                if self.state == 'value':
+                    expected = '[' if self.depth == len(self.path) else '{'
+                    if char != expected:
+                        raise ValueError('expected ' + expected + ' at ' + '.'.join(self.path[:self.depth] or ['the top level']))
+                    self.position += 1
+                    self.state = 'first_item' if expected == '[' else 'first_key'
+                    self.found = expected == '['
+                elif self.state in ('first_key', 'key'):
+                    if char == '}' and self.state == 'first_key':
+                        self.position += 1
+                        self.state = 'done'
+                        continue
+                    start = self.position
+                    key = self.decode(final)
+                    colon = WHITESPACE.match(self.buffer, self.position).end()
+                    if colon == len(self.buffer):
+                        self.position = start
+                        break
+                    if self.buffer[colon] != ':':
+                        raise ValueError('expected : after ' + key)
+                    self.position = colon + 1
+                    if key == self.path[self.depth]:
+                        self.depth += 1
+                        self.state = 'value'
+                    else:
+                        self.key = key
+                        self.state = 'skip'
+                elif self.state == 'skip':
+                    self.envelope[self.key] = self.decode(final)
+                    self.state = 'after_key'
+                elif self.state == 'after_key':
+                    if char not in ',}':
+                        raise ValueError('expected , or }')
+                    self.position += 1
+                    self.state = 'key' if char == ',' else 'done'
+                elif self.state == 'first_item':
+                    if char == ']':
+                        self.position += 1
+                        self.state = 'done'
+                    else:
+                        self.state = 'item'
+                elif self.state == 'item':
+                    items.append(self.decode(final))
+                    self.state = 'after_item'
+                elif self.state == 'after_item':
+                    if char not in ',]':
+                        raise ValueError('expected , or ]')
+                    self.position += 1
+                    self.state = 'item' if char == ',' else 'done'
+            except json.JSONDecodeError:
+                # the value is not complete yet, unless its end was received
+                if final or self.wait():
+                    raise
+                break
+            except ValueError as e:
+                if str(e) != 'incomplete':
+                    raise
+                self.wait()
+                break
+        if final and self.state != 'done':
+            raise ValueError('the json of the response is truncated')
+        return items
+
+
+class StreamedArray:
+    """
+    the elements of a json array that are decoded while the response is received, returned by fetch_stream()
+    it can be iterated once, len() and indexing read the rest of the response into a list
+    """
+
+    def __init__(self, chunks, parser, close, finish=None):
+        self.chunks = chunks
+        self.parser = parser
+        self.close = close  # releases the connection
+        self.finish = finish  # called with the parser once the response is complete
+        self.started = False
+        self.items = None
+
+    def __iter__(self):
+        if self.items is not None:
+            return iter(self.items)
+        if self.started:
+            raise RuntimeError('a streamed response can only be iterated once')
+        self.started = True
+        return self.stream()
+
+    def stream(self):
+        try:
+            for chunk in self.chunks:
+                yield from self.parser.feed(chunk)
+            yield from self.parser.feed(b'', True)
+            if self.finish is not None:
+                self.finish(self.parser)
+        finally:
+            self.close()
+
+    def materialize(self):
+        if self.items is None:
+            if self.started:
+                # list() asks for the length of what it iterates, a TypeError tells it that there is none
+                raise TypeError('a streamed response that is being iterated has no length')
+            self.items = list(self.stream())
+            self.started = True
+        return self.items
+
+    def __len__(self):
+        return len(self.materialize())
+
+    def __getitem__(self, index):
+        if not isinstance(index, (int, slice)):
+            raise TypeError(self.envelope_error(index))
+        return self.materialize()[index]
+
+    def __contains__(self, key):
+        # without it, in would read the whole stream and answer False for the keys of the response, that safe_value() looks up
+        raise TypeError(self.envelope_error(key))
+
+    def envelope_error(self, key):
+        return 'the key ' + repr(key) + ' is not in a streamed response, it is the array at the path of the stream param and not the response around it'
+
+    def parse(self, parse, since=None, limit=None, key='timestamp', symbols=None):
+        """
+        the parsed elements in the order they are received, since and limit select the first of them
+        :param callable parse: parses a single element
+        :param [str]|None symbols: the symbols of the parsed elements to keep
+        """
+        iterator = iter(self)
+        count = 0
+        try:
+            for item in iterator:
+                result = parse(item)
+                if (since is None or result[key] >= since) and (symbols is None or result['symbol'] in symbols):
+                    yield result
+                    count += 1
+                    if limit is not None and count >= limit:
+                        break
+        finally:
+            if hasattr(iterator, 'close'):
+                iterator.close()
+
+
+class AsyncStreamedArray(StreamedArray):
+    """the elements of a streamed response of an asynchronous exchange, iterated with async for"""
+
+    def __iter__(self):
+        raise TypeError('a streamed response of an asynchronous exchange is iterated with async for')
+
+    def __len__(self):
+        raise TypeError('a streamed response of an asynchronous exchange is iterated with async for')
+
+    def __getitem__(self, index):
+        raise TypeError('a streamed response of an asynchronous exchange is iterated with async for')
+
+    def __contains__(self, key):
+        raise TypeError('a streamed response of an asynchronous exchange is iterated with async for')
+
+    def __aiter__(self):
+        if self.started:
+            raise RuntimeError('a streamed response can only be iterated once')
+        self.started = True
+        return self.stream()
+
+    async def stream(self):
+        try:
+            async for chunk in self.chunks:
+                for item in self.parser.feed(chunk):
+                    yield item
+            for item in self.parser.feed(b'', True):
+                yield item
+            if self.finish is not None:
+                self.finish(self.parser)
+        finally:
+            self.close()
+
+    async def parse(self, parse, since=None, limit=None, key='timestamp', symbols=None):
+        iterator = self.__aiter__()
+        count = 0
+        try:
+            async for item in iterator:
+                result = parse(item)
+                if (since is None or result[key] >= since) and (symbols is None or result['symbol'] in symbols):
+                    yield result
+                    count += 1
+                    if limit is not None and count >= limit:
+                        break
+        finally:
+            await iterator.aclose()
@@ -11,26 +11,89 @@
 # (╯°□°）╯︵ ┻━┻
 
 
+import functools
+
+
+@functools.lru_cache(maxsize=8192)
+def parse(number):
+    # the integer and the decimals of a decimal string, the repeated strings like tick sizes and fee rates are parsed once
+    number = number.lower()
+    modifier = 0
+    if 'e' in number:
+        number, modifier = number.split('e')
+        modifier = int(modifier)
+    decimal_index = number.find('.')
+    if decimal_index > -1:
+        return int(number.replace('.', '')), len(number) - decimal_index - 1 - modifier
+    return int(number), -modifier
+
+
+def to_string(integer, decimals):
+    # str(Precise(integer, decimals)), without the trailing zeros of the integer
+    if integer == 0:
+        return '0'
+    sign = '-' if integer < 0 else ''
+    digits = str(abs(integer))
+    if integer % 10 == 0:
+        stripped = digits.rstrip('0')
+        decimals -= len(digits) - len(stripped)
+        digits = stripped
+    if decimals <= 0:
+        return sign + digits + '0' * -decimals
+    index = len(digits) - decimals
+    if index <= 0:
+        return sign + '0.' + '0' * -index + digits
+    return sign + digits[:index] + '.' + digits[index:]
+
+
+def align(integer1, decimals1, integer2, decimals2):
+    # the integers of both numbers with the decimals of the most precise one
+    if decimals1 == decimals2:
+        return integer1, integer2, decimals1
+    elif decimals1 > decimals2:
+        return integer1, integer2 * 10 ** (decimals1 - decimals2), decimals1
+    return integer1 * 10 ** (decimals2 - decimals1), integer2, decimals2
+
+
+def divide(integer1, decimals1, integer2, decimals2, precision):
+    # the integer of the quotient with precision decimals, truncated towards zero
+    distance = precision - decimals1 + decimals2
+    if distance == 0:
+        numerator = integer1
+    elif distance < 0:
+        numerator = integer1 // 10 ** -distance
+    else:
+        numerator = integer1 * 10 ** distance
+    result, mod = divmod(numerator, integer2)
+    # python floors negative numbers down instead of truncating
+    # if mod is zero it will be floored to itself so we do not add one
+    return result + 1 if result < 0 and mod else result
+
+
+def canonical(integer, decimals):
+    # the integer and the decimals that parse(to_string(integer, decimals)) returns
+    if integer == 0:
+        return 0, 0
+    if integer % 10 == 0:
+        digits = str(integer)
+        stripped = digits.rstrip('0')
+        decimals -= len(digits) - len(stripped)
+        integer = int(stripped)
+    if decimals < 0:
+        return integer * 10 ** -decimals, 0
+    return integer, decimals
+
+
 class Precise:
+    __slots__ = ('integer', 'decimals')
+    base = 10
+
     def __init__(self, number, decimals=None):
         if decimals is None:
-            modifier = 0
-            number = number.lower()
-            if 'e' in number:
-                number, modifier = number.split('e')
-                modifier = int(modifier)
-            decimal_index = number.find('.')
-            if decimal_index > -1:
-                self.decimals = len(number) - decimal_index - 1
-                self.integer = int(number.replace('.', ''))
-            else:
-                self.decimals = 0
-                self.integer = int(number)
-            self.decimals = self.decimals - modifier
+            self.integer, self.decimals = parse(number)
         else:
             self.integer = number
             self.decimals = decimals
-        self.base = 10
 
     def __add__(self, other):
         return self.add(other)
@@ -82,31 +145,11 @@ class Precise:
         return Precise(integer_result, self.decimals + other.decimals)
 
     def div(self, other, precision=18):
-        distance = precision - self.decimals + other.decimals
-        if distance == 0:
-            numerator = self.integer
-        elif distance < 0:
-            exponent = self.base ** -distance
-            numerator = self.integer // exponent
-        else:
-            exponent = self.base ** distance
-            numerator = self.integer * exponent
-        result, mod = divmod(numerator, other.integer)
-        # python floors negative numbers down instead of truncating
-        # if mod is zero it will be floored to itself so we do not add one
-        result = result + 1 if result < 0 and mod else result
-        return Precise(result, precision)
+        return Precise(divide(self.integer, self.decimals, other.integer, other.decimals, precision), precision)
 
     def add(self, other):
-        if self.decimals == other.decimals:
-            integer_result = self.integer + other.integer
-            return Precise(integer_result, self.decimals)
-        else:
-            smaller, bigger = [other, self] if self.decimals > other.decimals else [self, other]
-            exponent = bigger.decimals - smaller.decimals
-            normalised = smaller.integer * (self.base ** exponent)
-            result = normalised + bigger.integer
-            return Precise(result, bigger.decimals)
+        integer1, integer2, decimals = align(self.integer, self.decimals, other.integer, other.decimals)
+        return Precise(integer1 + integer2, decimals)
 
     def sub(self, other):
         negative = Precise(-other.integer, other.decimals)
@@ -133,12 +176,12 @@ class Precise:
         return self if self.gt(other) else other
 
     def gt(self, other):
-        add = self.sub(other)
-        return add.integer > 0
+        integer1, integer2, decimals = align(self.integer, self.decimals, other.integer, other.decimals)
+        return integer1 > integer2
 
     def ge(self, other):
-        add = self.sub(other)
-        return add.integer >= 0
+        integer1, integer2, decimals = align(self.integer, self.decimals, other.integer, other.decimals)
+        return integer1 >= integer2
 
     def lt(self, other):
         return other.gt(self)
@@ -147,20 +190,14 @@ class Precise:
         return other.ge(self)
 
     def reduce(self):
-        string = str(self.integer)
-        start = len(string) - 1
-        if start == 0:
-            if string == "0":
-                self.decimals = 0
-            return self
-        for i in range(start, -1, -1):
-            if string[i] != '0':
-                break
-        difference = start - i
-        if difference == 0:
-            return self
-        self.decimals -= difference
-        self.integer = int(string[:i + 1])
+        if self.integer == 0:
+            self.decimals = 0
+        elif self.integer % 10 == 0:
+            string = str(self.integer)
+            stripped = string.rstrip('0')
+            self.decimals -= len(string) - len(stripped)
+            self.integer = int(stripped)
+        return self
 
     def equals(self, other):
         self.reduce()
@@ -169,19 +206,7 @@ class Precise:
 
     def __str__(self):
         self.reduce()
-        sign = '-' if self.integer < 0 else ''
-        integer_array = list(str(abs(self.integer)).rjust(self.decimals, '0'))
-        index = len(integer_array) - self.decimals
-        if index == 0:
-            item = '0.'
-        elif self.decimals < 0:
-            item = '0' * (-self.decimals)
-        elif self.decimals == 0:
-            item = ''
-        else:
-            item = '.'
-        integer_array.insert(index, item)
-        return sign + ''.join(integer_array)
+        return to_string(self.integer, self.decimals)
 
     def __repr__(self):
         return "Precise(" + str(self) + ")"
@@ -193,16 +218,19 @@ class Precise:
     def string_mul(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return str(Precise(string1).mul(Precise(string2)))
+        integer1, decimals1 = parse(string1)
+        integer2, decimals2 = parse(string2)
+        return to_string(integer1 * integer2, decimals1 + decimals2)
 
     @staticmethod
     def string_div(string1, string2, precision=18):
         if string1 is None or string2 is None:
             return None
-        string2_precise = Precise(string2)
-        if string2_precise.integer == 0:
+        integer2, decimals2 = parse(string2)
+        if integer2 == 0:
             return None
-        return str(Precise(string1).div(string2_precise, precision))
+        integer1, decimals1 = parse(string1)
+        return to_string(divide(integer1, decimals1, integer2, decimals2, precision), precision)
 
     @staticmethod
     def string_add(string1, string2):
@@ -212,25 +240,29 @@ class Precise:
             return string2
         elif string2 is None:
             return string1
-        return str(Precise(string1).add(Precise(string2)))
+        integer1, integer2, decimals = align(*parse(string1), *parse(string2))
+        return to_string(integer1 + integer2, decimals)
 
     @staticmethod
     def string_sub(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return str(Precise(string1).sub(Precise(string2)))
+        integer1, integer2, decimals = align(*parse(string1), *parse(string2))
+        return to_string(integer1 - integer2, decimals)
 
     @staticmethod
     def string_abs(string):
         if string is None:
             return None
-        return str(Precise(string).abs())
+        integer, decimals = parse(string)
+        return to_string(abs(integer), decimals)
 
     @staticmethod
     def string_neg(string):
         if string is None:
             return None
-        return str(Precise(string).neg())
+        integer, decimals = parse(string)
+        return to_string(-integer, decimals)
 
     @staticmethod
     def string_mod(string1, string2):
@@ -242,46 +274,112 @@ class Precise:
     def string_equals(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).equals(Precise(string2))
+        integer1, integer2, decimals = align(*parse(string1), *parse(string2))
+        return integer1 == integer2
 
     @staticmethod
     def string_eq(string1, string2):
-        if string1 is None or string2 is None:
-            return None
-        return Precise(string1).equals(Precise(string2))
+        return Precise.string_equals(string1, string2)
 
     @staticmethod
     def string_min(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return str(Precise(string1).min(Precise(string2)))
+        number1 = parse(string1)
+        number2 = parse(string2)
+        integer1, integer2, decimals = align(*number1, *number2)
+        return to_string(*(number1 if integer1 < integer2 else number2))
 
     @staticmethod
     def string_max(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return str(Precise(string1).max(Precise(string2)))
+        number1 = parse(string1)
+        number2 = parse(string2)
+        integer1, integer2, decimals = align(*number1, *number2)
+        return to_string(*(number1 if integer1 > integer2 else number2))
 
     @staticmethod
     def string_gt(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).gt(Precise(string2))
+        integer1, integer2, decimals = align(*parse(string1), *parse(string2))
+        return integer1 > integer2
 
     @staticmethod
     def string_ge(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).ge(Precise(string2))
+        integer1, integer2, decimals = align(*parse(string1), *parse(string2))
+        return integer1 >= integer2
 
     @staticmethod
     def string_lt(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).lt(Precise(string2))
+        integer1, integer2, decimals = align(*parse(string1), *parse(string2))
+        return integer1 < integer2
 
     @staticmethod
     def string_le(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).le(Precise(string2))
+        integer1, integer2, decimals = align(*parse(string1), *parse(string2))
+        return integer1 <= integer2
+
+    # fused operations, the intermediate results are not formatted to strings and parsed again
+
+    @staticmethod
+    def string_mul_add(string1, string2, string3):
+        """string_add(string_mul(string1, string2), string3)"""
+        if string1 is None or string2 is None:
+            return string3
+        integer1, decimals1 = parse(string1)
+        integer2, decimals2 = parse(string2)
+        if string3 is None:
+            return to_string(integer1 * integer2, decimals1 + decimals2)
+        product, integer3, decimals = align(integer1 * integer2, decimals1 + decimals2, *parse(string3))
+        return to_string(product + integer3, decimals)
+
+    @staticmethod
+    def string_mul_mul(string1, string2, string3):
+        """string_mul(string_mul(string1, string2), string3)"""
+        if string1 is None or string2 is None or string3 is None:
+            return None
+        integer1, decimals1 = parse(string1)
+        integer2, decimals2 = parse(string2)
+        integer3, decimals3 = parse(string3)
+        return to_string(integer1 * integer2 * integer3, decimals1 + decimals2 + decimals3)
+
+    @staticmethod
+    def string_mul_div(string1, string2, string3, precision=18):
+        """string_div(string_mul(string1, string2), string3, precision)"""
+        if string1 is None or string2 is None or string3 is None:
+            return None
+        integer3, decimals3 = parse(string3)
+        if integer3 == 0:
+            return None
+        integer1, decimals1 = parse(string1)
+        integer2, decimals2 = parse(string2)
+        # the division truncates the digits of the product as they would be parsed from its string
+        product, decimals = canonical(integer1 * integer2, decimals1 + decimals2)
+        return to_string(divide(product, decimals, integer3, decimals3, precision), precision)
+
+    @staticmethod
+    def string_sum(strings):
+        """string_add() of the strings one after the other, the strings that are None are left out"""
+        total = None
+        count = 0
+        for string in strings:
+            if string is not None:
+                count += 1
+                if count == 1:
+                    first = string
+                    total, decimals = parse(string)
+                else:
+                    integer1, integer2, decimals = align(total, decimals, *parse(string))
+                    total = integer1 + integer2
+        if count < 2:
+            # string_add() returns a single string as it is
+            return first if count else None
+        return to_string(total, decimals)
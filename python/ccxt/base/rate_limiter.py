@@ -0,0 +1,231 @@
+"""Token buckets shared by the throttlers of several exchange instances, processes or hosts"""
+
+import contextlib
+import json
+import mmap
+import os
+import socket
+import socketserver
+import struct
+import threading
+from time import monotonic
+
+__all__ = [
+    'RateLimiterBackend',
+    'MemoryBackend',
+    'SharedMemoryBackend',
+    'SocketBackend',
+    'RateLimiterServer',
+]
+
+
+class RateLimiterBackend:
+    """
+    keeps the tokens of the buckets outside of the throttler, pass it as rateLimiterBackend to the exchanges that share a budget
+    a request reserves its tokens up front and waits for the returned delay, so the requests are released in the order they reached the backend
+    the config is the one of the throttler: refillRate, capacity and the initial tokens of a new bucket
+    """
+
+    def reserve(self, key, cost, config):
+        """
+        :param str key: the bucket, like 'binance' or 'binance:fapi'
+        :param float cost: the tokens taken by the request
+        :param dict config: the token bucket config
+        :returns float: the milliseconds to wait before sending the request
+        """
+        raise NotImplementedError
+
+    def update_tokens(self, key, tokens, config):
+        """lowers the tokens of a bucket to what the exchange reports"""
+        raise NotImplementedError
+
+    @staticmethod
+    def refill(tokens, timestamp, now, config):
+        elapsed = now - timestamp
+        # the initial tokens may exceed the capacity, they are only capped while refilling
+        if elapsed > 0 and tokens < config['capacity']:
+            tokens = min(tokens + elapsed * config['refillRate'], config['capacity'])
+        return tokens
+
+    @staticmethod
+    def take(tokens, cost):
+        # same as the throttler: a request is released once the tokens are not negative, then it takes its cost
+        delay = 0 if tokens >= 0 else -tokens
+        return tokens - cost, delay
+
+
+class MemoryBackend(RateLimiterBackend):
+    """the buckets of the current process, shared by exchange instances that use the same key and ip"""
+
+    def __init__(self):
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def load(self, key, config):
+        now = monotonic() * 1000
+        if key in self.buckets:
+            tokens, timestamp = self.buckets[key]
+            return self.refill(tokens, timestamp, now, config), now
+        return config['tokens'], now
+
+    def reserve(self, key, cost, config):
+        with self.lock:
+            tokens, now = self.load(key, config)
+            tokens, delay = self.take(tokens, cost)
+            self.buckets[key] = (tokens, now)
+        return delay / config['refillRate']
+
+    def update_tokens(self, key, tokens, config):
+        with self.lock:
+            current, now = self.load(key, config)
+            self.buckets[key] = (min(current, tokens), now)
+
+
+class SharedMemoryBackend(RateLimiterBackend):
+    """
+    the buckets of the processes on one host, kept in a memory mapped file that is locked with flock() while a bucket is updated
+    the timestamps come from the monotonic clock, that is shared by the processes of a host
+    """
+
+    slot = struct.Struct('48sdd')  # key, tokens, timestamp
+
+    def __init__(self, path, slots=64):
+        import fcntl  # not available on windows
+        self.fcntl = fcntl
+        self.path = path
+        self.size = self.slot.size * slots
+        self.fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        # flock() does not exclude the threads that share the file descriptor
+        self.lock = threading.Lock()
+        with self.locked():
+            if os.fstat(self.fd).st_size < self.size:
+                os.ftruncate(self.fd, self.size)
+        self.memory = mmap.mmap(self.fd, self.size)
+
+    @contextlib.contextmanager
+    def locked(self):
+        with self.lock:
+            self.fcntl.flock(self.fd, self.fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                self.fcntl.flock(self.fd, self.fcntl.LOCK_UN)
+
+    def find(self, key):
+        name = key.encode()[:self.slot.size - 16]
+        for offset in range(0, self.size, self.slot.size):
+            slot_key, tokens, timestamp = self.slot.unpack_from(self.memory, offset)
+            slot_key = slot_key.rstrip(b'\0')
+            if slot_key == name:
+                return offset, name, tokens, timestamp
+            if not slot_key:
+                return offset, name, None, None
+        raise RuntimeError('shared rate limiter ' + self.path + ' has no free slot for ' + key)
+
+    def update(self, key, config, method):
+        with self.locked():
+            offset, name, tokens, timestamp = self.find(key)
+            now = monotonic() * 1000
+            tokens = config['tokens'] if tokens is None else self.refill(tokens, timestamp, now, config)
+            tokens, result = method(tokens)
+            self.slot.pack_into(self.memory, offset, name, tokens, now)
+        return result
+
+    def reserve(self, key, cost, config):
+        delay = self.update(key, config, lambda tokens: self.take(tokens, cost))
+        return delay / config['refillRate']
+
+    def update_tokens(self, key, tokens, config):
+        self.update(key, config, lambda current: (min(current, tokens), None))
+
+    def close(self):
+        self.memory.close()
+        os.close(self.fd)
+
+
+class SocketBackend(RateLimiterBackend):
+    """
+    the buckets kept by a RateLimiterServer, for the processes of one or several hosts
+    :param address: a (host, port) tuple or the path of a unix socket
+    """
+
+    def __init__(self, address):
+        self.address = address
+        self.local = threading.local()
+
+    def request(self, message):
+        connection = getattr(self.local, 'connection', None)
+        if connection is None:
+            family = socket.AF_UNIX if isinstance(self.address, str) else socket.AF_INET
+            connection = socket.socket(family, socket.SOCK_STREAM)
+            connection.connect(self.address)
+            if family == socket.AF_INET:
+                connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.local.connection = connection
+            self.local.reader = connection.makefile('rb')
+        try:
+            connection.sendall(json.dumps(message).encode() + b'\n')
+            return json.loads(self.local.reader.readline())
+        except (OSError, ValueError):
+            self.local.connection = None
+            connection.close()
+            raise
+
+    @staticmethod
+    def bucket(config):
+        return {'refillRate': config['refillRate'], 'capacity': config['capacity'], 'tokens': config['tokens']}
+
+    def reserve(self, key, cost, config):
+        return self.request({'method': 'reserve', 'key': key, 'cost': cost, 'config': self.bucket(config)})['delay']
+
+    def update_tokens(self, key, tokens, config):
+        self.request({'method': 'update_tokens', 'key': key, 'tokens': tokens, 'config': self.bucket(config)})
+
+
+class RateLimiterServer:
+    """
+    serves the buckets of a backend, a MemoryBackend by default, to SocketBackend clients
+    run it with `python -m ccxt.base.rate_limiter host:port` or `python -m ccxt.base.rate_limiter /path/to/socket`
+    """
+
+    def __init__(self, address, backend=None):
+        backend = backend or MemoryBackend()
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for line in self.rfile:
+                    message = json.loads(line)
+                    if message['method'] == 'reserve':
+                        response = {'delay': backend.reserve(message['key'], message['cost'], message['config'])}
+                    else:
+                        backend.update_tokens(message['key'], message['tokens'], message['config'])
+                        response = {}
+                    self.wfile.write(json.dumps(response).encode() + b'\n')
+
+        class Server(socketserver.ThreadingUnixStreamServer if isinstance(address, str) else socketserver.ThreadingTCPServer):
+            daemon_threads = True
+            allow_reuse_address = True
+
+        self.server = Server(address, Handler)
+        self.address = self.server.server_address
+
+    def serve_forever(self):
+        self.server.serve_forever()
+
+    def start(self):
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return self
+
+    def shutdown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+if __name__ == '__main__':
+    import sys
+    address = sys.argv[1] if len(sys.argv) > 1 else '127.0.0.1:7444'
+    if ':' in address:
+        host, port = address.rsplit(':', 1)
+        address = (host, int(port))
+    RateLimiterServer(address).serve_forever()
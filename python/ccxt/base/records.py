@@ -0,0 +1,142 @@
+"""The unified structures as records, in the __slots__ of an object instead of the table of a dict"""
+
+try:
+    from collections.abc import MutableMapping
+except ImportError:
+    from collections import MutableMapping
+
+from ccxt.base.iso8601 import format_iso8601, matches_iso8601
+
+__all__ = [
+    'Record',
+    'Trade',
+    'Order',
+    'Ticker',
+    'LedgerEntry',
+]
+
+MISSING = object()
+
+
+class Record(MutableMapping):
+    """
+    a unified structure that is read and written like a dict, with [], get(), keys(), items(), update() and dict(record)
+    the unified keys are kept in the __slots__ of a subclass and the other keys in a dict that is only created for them
+    datetime is not kept, it is formatted from the timestamp when it is read, unless it was set to another value
+    info is kept unless the record is created with info=False, then the raw payload is released and info is None
+    extend() and deep_extend() of a record return a record of the same type, a copy of it with the other arguments
+    """
+
+    __slots__ = ('_extra',)
+    FIELDS = frozenset()  # the __slots__ of a subclass
+
+    def __init__(self, structure=None, info=True):
+        self._extra = None
+        if structure is None:
+            return
+        count = 0
+        for key in self.__slots__:
+            if key in structure:
+                setattr(self, key, structure[key])
+                count += 1
+        if not info and 'info' in self.FIELDS:
+            self.info = None
+        if len(structure) > count:
+            # datetime and the keys that are not unified
+            for key in structure:
+                if key not in self.FIELDS:
+                    self[key] = structure[key]
+
+    def extra(self):
+        if self._extra is None:
+            self._extra = {}
+        return self._extra
+
+    def __getitem__(self, key):
+        if key in self.FIELDS:
+            value = getattr(self, key, MISSING)
+            if value is MISSING:
+                raise KeyError(key)
+            return value
+        extra = self._extra
+        if extra is not None and key in extra:
+            return extra[key]
+        if key == 'datetime':
+            timestamp = getattr(self, 'timestamp', MISSING)
+            if timestamp is not MISSING:
+                return format_iso8601(timestamp)
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key in self.FIELDS:
+            setattr(self, key, value)
+        elif key == 'datetime':
+            timestamp = getattr(self, 'timestamp', MISSING)
+            if (timestamp is not MISSING) and matches_iso8601(timestamp, value):
+                # the value that is formatted from the timestamp is not kept
+                if self._extra is not None:
+                    self._extra.pop('datetime', None)
+            else:
+                self.extra()['datetime'] = value
+        else:
+            self.extra()[key] = value
+
+    def __delitem__(self, key):
+        if key in self.FIELDS:
+            if getattr(self, key, MISSING) is MISSING:
+                raise KeyError(key)
+            delattr(self, key)
+        elif self._extra is not None and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __iter__(self):
+        extra = self._extra or {}
+        for key in self.__slots__:
+            if getattr(self, key, MISSING) is not MISSING:
+                yield key
+                if key == 'timestamp' and 'datetime' not in extra:
+                    yield 'datetime'
+        for key in extra:
+            yield key
+
+    def __len__(self):
+        return sum(1 for key in self)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+    def copy(self):
+        result = object.__new__(type(self))
+        result._extra = dict(self._extra) if self._extra else None
+        for key in self.__slots__:
+            value = getattr(self, key, MISSING)
+            if value is not MISSING:
+                setattr(result, key, value)
+        return result
+
+
+class Trade(Record):
+    __slots__ = ('id', 'order', 'info', 'timestamp', 'symbol', 'type', 'side', 'takerOrMaker', 'price', 'amount', 'cost', 'fee', 'fees')
+    FIELDS = frozenset(__slots__)
+
+
+class Order(Record):
+    __slots__ = (
+        'id', 'clientOrderId', 'info', 'timestamp', 'lastTradeTimestamp', 'lastUpdateTimestamp', 'symbol', 'type', 'timeInForce', 'postOnly', 'reduceOnly',
+        'side', 'price', 'stopPrice', 'triggerPrice', 'amount', 'cost', 'average', 'filled', 'remaining', 'status', 'fee', 'fees', 'trades')
+    FIELDS = frozenset(__slots__)
+
+
+class Ticker(Record):
+    __slots__ = (
+        'symbol', 'info', 'timestamp', 'high', 'low', 'bid', 'bidVolume', 'ask', 'askVolume', 'vwap', 'open', 'close', 'last', 'previousClose',
+        'change', 'percentage', 'average', 'baseVolume', 'quoteVolume')
+    FIELDS = frozenset(__slots__)
+
+
+class LedgerEntry(Record):
+    __slots__ = (
+        'id', 'info', 'timestamp', 'direction', 'account', 'referenceId', 'referenceAccount', 'type', 'currency', 'amount', 'before', 'after', 'status', 'fee')
+    FIELDS = frozenset(__slots__)
@@ -0,0 +1,104 @@
+import collections
+import threading
+from time import monotonic, sleep
+
+
+class Throttler:
+    """
+    a token bucket shared by the threads that use the same synchronous exchange
+    it takes the same config as the asynchronous Throttler, the threads are served by priority and then in the order they called it
+    """
+
+    def __init__(self, config):
+        self.config = {
+            'refillRate': 1.0,
+            'delay': 0.001,
+            'cost': 1.0,
+            'tokens': 0,
+            'maxCapacity': 2000,
+            'capacity': 1.0,
+            'aging': 1000,  # milliseconds of waiting that raise a request by one priority, so that the lower lanes are not starved
+        }
+        self.config.update(config)
+        self.lanes = {}  # queued threads by priority
+        self.condition = threading.Condition(threading.Lock())
+        self.last_timestamp = monotonic() * 1000
+
+    def refill(self):
+        now = monotonic() * 1000
+        elapsed = now - self.last_timestamp
+        self.last_timestamp = now
+        # the initial tokens may exceed the capacity, they are only capped while refilling
+        if elapsed > 0 and self.config['tokens'] < self.config['capacity']:
+            self.config['tokens'] = min(self.config['tokens'] + elapsed * self.config['refillRate'], self.config['capacity'])
+
+    def next_lane(self):
+        # the lane of the highest priority, raised by the time its oldest thread has been waiting
+        if len(self.lanes) == 1:
+            return next(iter(self.lanes.values()))
+        now = monotonic() * 1000
+        result = None
+        rank = None
+        for priority, lane in self.lanes.items():
+            lane_rank = priority + (now - lane[0][1]) / self.config['aging']
+            if rank is None or lane_rank > rank:
+                result = lane
+                rank = lane_rank
+        return result
+
+    def queue_depth(self):
+        # the number of queued threads by priority
+        with self.condition:
+            return {priority: len(lane) for priority, lane in self.lanes.items()}
+
+    def update_tokens(self, tokens):
+        # lowers the tokens to what the exchange reports, a negative amount pauses the bucket until it is refilled
+        if self.config.get('backend') is not None:
+            return self.config['backend'].update_tokens(self.config['key'], tokens, self.config)
+        with self.condition:
+            self.refill()
+            self.config['tokens'] = min(self.config['tokens'], tokens)
+
+    def __call__(self, cost=None, priority=0):
+        """
+        :param float cost: the tokens taken by the request
+        :param int priority: the threads of a higher priority are released first
+        """
+        cost = self.config['cost'] if cost is None else cost
+        if self.config.get('backend') is not None:
+            # the bucket is shared with other processes, see ccxt.base.rate_limiter
+            delay = self.config['backend'].reserve(self.config['key'], cost, self.config)
+            if delay > 0:
+                sleep(delay / 1000)
+            return
+        with self.condition:
+            if sum(len(lane) for lane in self.lanes.values()) > self.config['maxCapacity']:
+                raise RuntimeError('throttle queue is over maxCapacity (' + str(int(self.config['maxCapacity'])) + '), see https://github.com/ccxt/ccxt/issues/11645#issuecomment-1195695526')
+            entry = (object(), monotonic() * 1000, priority)
+            if priority not in self.lanes:
+                self.lanes[priority] = collections.deque()
+            self.lanes[priority].append(entry)
+            sleeping = False
+            try:
+                while True:
+                    if self.next_lane()[0] is entry:
+                        self.refill()
+                        if self.config['tokens'] >= 0:
+                            self.config['tokens'] -= cost
+                            return
+                        # sleep until the bucket is refilled, the other threads are woken up when it is their turn
+                        delay = -self.config['tokens'] / self.config['refillRate'] / 1000
+                        self.condition.wait(max(delay, self.config['delay']))
+                        sleeping = True
+                    else:
+                        if sleeping:
+                            # a request of a higher priority came in meanwhile, it is its turn now
+                            self.condition.notify_all()
+                            sleeping = False
+                        self.condition.wait()
+            finally:
+                lane = self.lanes[priority]
+                lane.remove(entry)
+                if not lane:
+                    del self.lanes[priority]
+                self.condition.notify_all()
@@ -39,6 +39,39 @@ class binance(Exchange):
             'name': 'Binance',
             'countries': ['JP', 'MT'],  # Japan, Malta
             'rateLimit': 50,
+            'tokenBucket': {
+                # the used weight reported by the exchange, see adaptiveRateLimit
+                'headers': {
+                    'x-mbx-used-weight-1m': {'limit': 1200, 'cost': 1},
+                },
+            },
+            # the futures and the sapi endpoints are metered separately from the spot api
+            'rateLimitBuckets': {
+                'sapi': {
+                    # IP(sapi) request rate limit of 12 000 per minute, 1 IP(sapi) => cost = 0.1
+                    'apis': ['sapi', 'sapiV2', 'sapiV3'],
+                    'refillRate': 0.02,
+                    'headers': {
+                        'x-sapi-used-ip-weight-1m': {'limit': 12000, 'cost': 0.1},
+                    },
+                },
+                'fapi': {
+                    # 2400 weight per minute, the fapi costs are the weights
+                    'apis': ['fapiPublic', 'fapiData', 'fapiPrivate', 'fapiPrivateV2'],
+                    'refillRate': 0.04,
+                    'headers': {
+                        'x-mbx-used-weight-1m': {'limit': 2400, 'cost': 1},
+                    },
+                },
+                'dapi': {
+                    # 2400 weight per minute, the dapi costs are the weights
+                    'apis': ['dapiPublic', 'dapiData', 'dapiPrivate', 'dapiPrivateV2'],
+                    'refillRate': 0.04,
+                    'headers': {
+                        'x-mbx-used-weight-1m': {'limit': 2400, 'cost': 1},
+                    },
+                },
+            },
             'certified': True,
             'pro': True,
             # new metainfo interface
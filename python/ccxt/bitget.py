@@ -856,11 +856,12 @@ class bitget(Exchange):
                 else:
                     subTypes = ['umcbl', 'dmcbl', 'cmcbl']
                 for j in range(0, len(subTypes)):
-                    promises.append(self.fetch_markets_by_type(type, self.extend(params, {
+                    promises.append(self.submit(self.fetch_markets_by_type, type, self.extend(params, {
                         'productType': subTypes[j],
                     })))
             else:
-                promises.append(self.fetch_markets_by_type(types[i], params))
+                promises.append(self.submit(self.fetch_markets_by_type, types[i], params))
+        promises = self.gather(promises)
         result = promises[0]
         for i in range(1, len(promises)):
             result = self.array_concat(result, promises[i])
@@ -282,9 +282,10 @@ class bkex(Exchange):
         :returns [dict]: an array of objects representing market data
         """
         promises = [
-            self.publicSpotGetCommonSymbols(params),
-            self.publicSwapGetMarketSymbols(params),
+            self.submit(self.publicSpotGetCommonSymbols, params),
+            self.submit(self.publicSwapGetMarketSymbols, params),
         ]
+        promises = self.gather(promises)
         spotMarkets = promises[0]
         #
         #     {
@@ -1040,10 +1040,11 @@ class bybit(Exchange):
         if self.options['adjustForTimeDifference']:
             self.load_time_difference()
         promises = [
-            self.fetch_spot_markets(params),
-            self.fetch_derivatives_markets({'category': 'linear'}),
-            self.fetch_derivatives_markets({'category': 'inverse'}),
+            self.submit(self.fetch_spot_markets, params),
+            self.submit(self.fetch_derivatives_markets, {'category': 'linear'}),
+            self.submit(self.fetch_derivatives_markets, {'category': 'inverse'}),
         ]
+        promises = self.gather(promises)
         spotMarkets = promises[0]
         linearMarkets = promises[1]
         inverseMarkets = promises[2]
@@ -313,7 +313,8 @@ class cryptocom(Exchange):
         :param dict params: extra parameters specific to the exchange api endpoint
         :returns [dict]: an array of objects representing market data
         """
-        promises = [self.fetch_spot_markets(params), self.fetch_derivatives_markets(params)]
+        promises = [self.submit(self.fetch_spot_markets, params), self.submit(self.fetch_derivatives_markets, params)]
+        promises = self.gather(promises)
         spotMarkets = promises[0]
         derivativeMarkets = promises[1]
         markets = self.array_concat(spotMarkets, derivativeMarkets)
@@ -538,7 +538,8 @@ class digifinex(Exchange):
         defaultType = self.safe_string(self.options, 'defaultType')
         marginMode, query = self.handle_margin_mode_and_params('fetchMarketsV2', params)
         method = 'publicSpotGetMarginSymbols' if (marginMode is not None) else 'publicSpotGetTradesSymbols'
-        promises = [getattr(self, method)(query), self.publicSwapGetPublicInstruments(params)]
+        promises = [self.submit(getattr(self, method), query), self.submit(self.publicSwapGetPublicInstruments, params)]
+        promises = self.gather(promises)
         spotMarkets = promises[0]
         swapMarkets = promises[1]
         #
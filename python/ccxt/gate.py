@@ -690,9 +690,10 @@ class gate(Exchange):
         :returns [dict]: an array of objects representing market data
         """
         promises = [
-            self.fetch_spot_markets(params),
-            self.fetch_contract_markets(params),
+            self.submit(self.fetch_spot_markets, params),
+            self.submit(self.fetch_contract_markets, params),
         ]
+        promises = self.gather(promises)
         spotMarkets = promises[0]
         contractMarkets = promises[1]
         return self.array_concat(spotMarkets, contractMarkets)
@@ -464,7 +464,7 @@ class gemini(Exchange):
             request = {
                 'symbol': marketId,
             }
-            promises.append(getattr(self, method)(self.extend(request, params)))
+            promises.append(self.submit(getattr(self, method), self.extend(request, params)))
             #
             #     {
             #         "symbol": "BTCUSD",
@@ -477,6 +477,7 @@ class gemini(Exchange):
             #         "wrap_enabled": False
             #     }
             #
+        promises = self.gather(promises)
         for i in range(0, len(promises)):
             response = promises[i]
             marketId = self.safe_string_lower(response, 'symbol')
@@ -1416,14 +1416,15 @@ class huobi(Exchange):
             type = keys[i]
             value = self.safe_value(types, type)
             if value is True:
-                promises.append(self.fetch_markets_by_type_and_sub_type(type, None, params))
+                promises.append(self.submit(self.fetch_markets_by_type_and_sub_type, type, None, params))
             else:
                 subKeys = list(value.keys())
                 for j in range(0, len(subKeys)):
                     subType = subKeys[j]
                     subValue = self.safe_value(value, subType)
                     if subValue:
-                        promises.append(self.fetch_markets_by_type_and_sub_type(type, subType, params))
+                        promises.append(self.submit(self.fetch_markets_by_type_and_sub_type, type, subType, params))
+        promises = self.gather(promises)
         for i in range(0, len(promises)):
             allMarkets = self.array_concat(allMarkets, promises[i])
         return allMarkets
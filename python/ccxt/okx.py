@@ -957,8 +957,9 @@ class okx(Exchange):
         promises = []
         result = []
         for i in range(0, len(types)):
-            promises.append(self.fetch_markets_by_type(types[i], params))
+            promises.append(self.submit(self.fetch_markets_by_type, types[i], params))
         # why not both ¯\_(ツ)_/¯
+        promises = self.gather(promises)
         for i in range(0, len(promises)):
             result = self.array_concat(result, promises[i])
         return result
@@ -22,8 +22,14 @@ class AiohttpClient(Client):
         if self.verbose:
             self.log(iso8601(milliseconds()), 'message', data)
         if isinstance(data, bytes):
-            data = data.decode()
-        decoded = json.loads(data) if is_json_encoded_object(data) else data
+            # the json messages are decoded from the bytes without copying them to a str first
+            is_json = len(data) >= 2 and data[0] in b'{['
+            if not is_json:
+                data = data.decode()
+        else:
+            is_json = is_json_encoded_object(data)
+        decode = self.decode_json or json.loads
+        decoded = decode(data) if is_json else data
         self.on_message_callback(self, decoded)
 
     def handle_message(self, message):
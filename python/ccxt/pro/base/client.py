@@ -30,6 +30,7 @@ class Client(object):
     lastPong = None
     ping = None  # ping-function if defined
     verbose = False  # verbose output
+    decode_json = None  # decodes the json messages, the decode_json() of the exchange
     gunzip = False
     inflate = False
     throttle = None
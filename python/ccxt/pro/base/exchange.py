@@ -11,8 +11,10 @@ from ccxt.pro.base.fast_client import FastClient
 from ccxt.async_support.base.exchange import Exchange as BaseExchange
 from ccxt import NotSupported
 from ccxt.pro.base.order_book import OrderBook, IndexedOrderBook, CountedOrderBook
+from ccxt.base.decimal_to_precision import to_decimal
 from ccxt.async_support.base.throttler import Throttler
 import asyncio
+from decimal import Decimal
 
 # -----------------------------------------------------------------------------
 
@@ -49,14 +51,18 @@ class Exchange(BaseExchange):
     def gunzip(data):
         return gunzip(data)
 
+    def order_book_number(self):
+        # the order books convert their prices and sizes to exact numbers when the exchange parses them to Decimal
+        return to_decimal if self.number is Decimal else None
+
     def order_book(self, snapshot={}, depth=None):
-        return OrderBook(snapshot, depth)
+        return OrderBook(snapshot, depth, self.order_book_number())
 
     def indexed_order_book(self, snapshot={}, depth=None):
-        return IndexedOrderBook(snapshot, depth)
+        return IndexedOrderBook(snapshot, depth, self.order_book_number())
 
     def counted_order_book(self, snapshot={}, depth=None):
-        return CountedOrderBook(snapshot, depth)
+        return CountedOrderBook(snapshot, depth, self.order_book_number())
 
     def client(self, url):
         self.clients = self.clients or {}
@@ -71,6 +77,7 @@ class Exchange(BaseExchange):
                 'log': getattr(self, 'log'),
                 'ping': getattr(self, 'ping', None),
                 'verbose': self.verbose,
+                'decode_json': self.decode_json,
                 'throttle': Throttler(self.tokenBucket, self.asyncio_loop),
                 'asyncio_loop': self.asyncio_loop,
             }, ws_options)
@@ -5,7 +5,7 @@ from base64 import b64decode
 from gzip import GzipFile
 from io import BytesIO
 import time
-import datetime
+from ccxt.base.iso8601 import format_iso8601 as iso8601  # noqa: F401
 
 
 def inflate(data):
@@ -26,20 +26,6 @@ def milliseconds():
     return int(time.time() * 1000)
 
 
-def iso8601(timestamp=None):
-    if timestamp is None:
-        return timestamp
-    if not isinstance(timestamp, int):
-        return None
-    if int(timestamp) < 0:
-        return None
-    try:
-        utc = datetime.datetime.utcfromtimestamp(timestamp // 1000)
-        return utc.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-6] + "{:03d}".format(int(timestamp) % 1000) + 'Z'
-    except (TypeError, OverflowError, OSError):
-        return None
-
-
 def is_json_encoded_object(input):
     return (isinstance(input, str) and
             (len(input) >= 2) and
@@ -6,7 +6,7 @@ import sys
 
 
 class OrderBook(dict):
-    def __init__(self, snapshot={}, depth=None):
+    def __init__(self, snapshot={}, depth=None, number=None):
         self.cache = []
         depth = depth or sys.maxsize
         defaults = {
@@ -20,9 +20,9 @@ class OrderBook(dict):
         # do not mutate snapshot
         defaults.update(snapshot)
         if not isinstance(defaults['asks'], order_book_side.OrderBookSide):
-            defaults['asks'] = order_book_side.Asks(defaults['asks'], depth)
+            defaults['asks'] = order_book_side.Asks(defaults['asks'], depth, number)
         if not isinstance(defaults['bids'], order_book_side.OrderBookSide):
-            defaults['bids'] = order_book_side.Bids(defaults['bids'], depth)
+            defaults['bids'] = order_book_side.Bids(defaults['bids'], depth, number)
         defaults['datetime'] = Exchange.iso8601(defaults.get('timestamp'))
         # merge to self
         super(OrderBook, self).__init__(defaults)
@@ -58,21 +58,21 @@ class OrderBook(dict):
 
 
 class CountedOrderBook(OrderBook):
-    def __init__(self, snapshot={}, depth=None):
+    def __init__(self, snapshot={}, depth=None, number=None):
         copy = Exchange.extend(snapshot, {
-            'asks': order_book_side.CountedAsks(snapshot.get('asks', []), depth),
-            'bids': order_book_side.CountedBids(snapshot.get('bids', []), depth),
+            'asks': order_book_side.CountedAsks(snapshot.get('asks', []), depth, number),
+            'bids': order_book_side.CountedBids(snapshot.get('bids', []), depth, number),
         })
-        super(CountedOrderBook, self).__init__(copy, depth)
+        super(CountedOrderBook, self).__init__(copy, depth, number)
 
 # -----------------------------------------------------------------------------
 # indexed by order ids (3rd value in a bidask delta)
 
 
 class IndexedOrderBook(OrderBook):
-    def __init__(self, snapshot={}, depth=None):
+    def __init__(self, snapshot={}, depth=None, number=None):
         copy = Exchange.extend(snapshot, {
-            'asks': order_book_side.IndexedAsks(snapshot.get('asks', []), depth),
-            'bids': order_book_side.IndexedBids(snapshot.get('bids', []), depth),
+            'asks': order_book_side.IndexedAsks(snapshot.get('asks', []), depth, number),
+            'bids': order_book_side.IndexedBids(snapshot.get('bids', []), depth, number),
         })
-        super(IndexedOrderBook, self).__init__(copy, depth)
+        super(IndexedOrderBook, self).__init__(copy, depth, number)
@@ -12,16 +12,28 @@ import bisect
 class OrderBookSide(list):
     side = None  # set to True for bids and False for asks
 
-    def __init__(self, deltas=[], depth=None):
+    def __init__(self, deltas=[], depth=None, number=None):
         super(OrderBookSide, self).__init__()
         self._depth = depth or sys.maxsize
         self._n = sys.maxsize
+        # converts the prices and the sizes to the numbers of the exchange, like decimal.Decimal, None to keep them as they are
+        self._number = number
         # parallel to self
         self._index = []
         for delta in deltas:
             self.storeArray(list(delta))
 
+    def convert(self, delta):
+        # the deltas of the websocket messages are floats, the levels of a snapshot are parsed with the number of the exchange
+        # a price level is found by equality, so the prices of both are converted to the same type
+        if delta[0] is not None:
+            delta[0] = self._number(delta[0])
+        if delta[1] is not None:
+            delta[1] = self._number(delta[1])
+
     def storeArray(self, delta):
+        if self._number is not None:
+            self.convert(delta)
         price = delta[0]
         size = delta[1]
         index_price = -price if self.side else price
@@ -74,10 +86,12 @@ class OrderBookSide(list):
 
 
 class CountedOrderBookSide(OrderBookSide):
-    def __init__(self, deltas=[], depth=None):
-        super(CountedOrderBookSide, self).__init__(deltas, depth)
+    def __init__(self, deltas=[], depth=None, number=None):
+        super(CountedOrderBookSide, self).__init__(deltas, depth, number)
 
     def storeArray(self, delta):
+        if self._number is not None:
+            self.convert(delta)
         price = delta[0]
         size = delta[1]
         count = delta[2]
@@ -102,11 +116,13 @@ class CountedOrderBookSide(OrderBookSide):
 
 
 class IndexedOrderBookSide(OrderBookSide):
-    def __init__(self, deltas=[], depth=None):
+    def __init__(self, deltas=[], depth=None, number=None):
         self._hashmap = {}
-        super(IndexedOrderBookSide, self).__init__(deltas, depth)
+        super(IndexedOrderBookSide, self).__init__(deltas, depth, number)
 
     def storeArray(self, delta):
+        if self._number is not None:
+            self.convert(delta)
         price = delta[0]
         if price is not None:
             index_price = -price if self.side else price
@@ -0,0 +1,149 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import asyncio  # noqa: E402
+import threading  # noqa: E402
+import time  # noqa: E402
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer  # noqa: E402
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+
+hits = []
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        hits.append(self.path)
+        time.sleep(0.05)  # the other requests arrive while this one is in flight
+        body = ('{"path":"' + self.path + '","hit":' + str(len(hits)) + '}').encode()
+        self.send_response(200 if not self.path.startswith('/public/error') else 500)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+server.daemon_threads = True
+threading.Thread(target=server.serve_forever, daemon=True).start()
+
+
+def describe(self):
+    return {
+        'id': 'coalesce',
+        'rateLimit': 10,
+        'urls': {
+            'api': 'http://127.0.0.1:' + str(server.server_address[1]),
+        },
+        'api': {
+            'public': {
+                'get': ['ticker', 'error'],
+            },
+            'private': {
+                'get': ['balance'],
+            },
+        },
+        'httpExceptions': {
+            '500': ccxt.ExchangeNotAvailable,
+        },
+    }
+
+
+def sign(self, path, api='public', method='GET', params={}, headers=None, body=None):
+    url = self.urls['api'] + '/' + api + '/' + path
+    if params:
+        url += '?' + self.urlencode(params)
+    return {'url': url, 'method': method, 'body': body, 'headers': headers}
+
+
+class exchange(ccxt.Exchange):
+    describe = describe
+    sign = sign
+
+
+class async_exchange(ccxt.async_support.Exchange):
+    describe = describe
+    sign = sign
+
+
+try:
+    # identical public requests share one call and one response, the others are sent each
+    async def test_async():
+        instance = async_exchange({'coalesceRequests': True})
+        try:
+            responses = await asyncio.gather(*[instance.publicGetTicker({'symbol': 'BTCUSDT'}) for i in range(20)])
+            assert len(hits) == 1
+            assert all(response is responses[0] for response in responses)
+            assert instance.coalesce_metrics == {'requests': 1, 'coalesced': 19, 'cached': 0}
+            await asyncio.gather(instance.publicGetTicker({'symbol': 'BTCUSDT'}), instance.publicGetTicker({'symbol': 'ETHUSDT'}))
+            assert len(hits) == 3
+            await asyncio.gather(instance.privateGetBalance(), instance.privateGetBalance())
+            assert len(hits) == 5
+            # an error is raised to every caller
+            results = await asyncio.gather(*[instance.publicGetError() for i in range(3)], return_exceptions=True)
+            assert len(hits) == 6
+            assert all(isinstance(result, ccxt.ExchangeNotAvailable) for result in results)
+            # a cancelled caller does not cancel the call of the others
+            first = asyncio.ensure_future(instance.publicGetTicker({'symbol': 'LTCUSDT'}))
+            second = asyncio.ensure_future(instance.publicGetTicker({'symbol': 'LTCUSDT'}))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            assert (await second)['path'] == '/public/ticker?symbol=LTCUSDT'
+            assert len(hits) == 7
+            assert instance.coalesced_requests == {}
+            # the responses are reused for coalesceTTL milliseconds
+            instance.coalesceTTL = 1000
+            first = await instance.publicGetTicker({'symbol': 'XRPUSDT'})
+            second = await instance.publicGetTicker({'symbol': 'XRPUSDT'})
+            assert first is second
+            assert len(hits) == 8
+            assert instance.coalesce_metrics['cached'] == 1
+        finally:
+            await instance.close()
+
+    asyncio.run(test_async())
+
+    # the threads of a synchronous exchange
+    del hits[:]
+    instance = exchange({'coalesceRequests': True})
+    responses = [None] * 8
+
+    def worker(i):
+        responses[i] = instance.publicGetTicker({'symbol': 'BTCUSDT'})
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(hits) == 1
+    assert all(response is responses[0] for response in responses)
+    assert instance.coalesce_metrics == {'requests': 1, 'coalesced': 7, 'cached': 0}
+    try:
+        instance.publicGetError()
+        assert False
+    except ccxt.ExchangeNotAvailable:
+        pass
+    assert instance.coalesced_requests == {}
+
+    # disabled by default
+    del hits[:]
+    instance = exchange()
+    threads = [threading.Thread(target=instance.publicGetTicker) for i in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(hits) == 3
+finally:
+    server.shutdown()
@@ -0,0 +1,75 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+from decimal import Decimal  # noqa: E402
+import ccxt  # noqa: E402
+from ccxt.pro.base.order_book import OrderBook, CountedOrderBook, IndexedOrderBook  # noqa: E402
+from ccxt.base.decimal_to_precision import to_decimal  # noqa: E402
+
+# parse_number() in each mode
+
+exchange = ccxt.Exchange({'id': 'numbers'})
+assert exchange.parse_number('1.5') == 1.5
+assert exchange.parse_number('') is None
+assert exchange.parse_number('abc', 0) == 0
+exchange.number = str
+assert exchange.parse_number('') is None
+assert exchange.parse_number(1.5) == '1.5'
+exchange.number = Decimal
+assert exchange.parse_number('0.1') == Decimal('0.1')
+assert exchange.parse_number(0.1) == Decimal('0.1')
+assert exchange.parse_number(5) == Decimal(5)
+assert exchange.parse_number('1e-8') == Decimal('1e-8')
+assert exchange.parse_number('') is None
+assert exchange.parse_number('abc', 0) == 0
+
+# the unified structures are exact
+
+market = {'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT', 'spot': True, 'contractSize': None, 'inverse': False}
+trade = exchange.safe_trade({'id': '1', 'symbol': 'BTC/USDT', 'price': '0.1', 'amount': '3', 'timestamp': 1670000000000, 'fee': {'currency': 'USDT', 'cost': '0.0003'}}, market)
+assert trade['price'] == Decimal('0.1') and trade['amount'] == Decimal('3') and trade['cost'] == Decimal('0.3')
+assert trade['fee']['cost'] == Decimal('0.0003')
+
+exchange.parse_trade = lambda trade, market=None: exchange.safe_trade(trade, market)
+order = exchange.safe_order({
+    'id': '1', 'symbol': 'BTC/USDT', 'type': 'limit', 'side': 'buy', 'status': 'closed', 'price': '0.1', 'amount': None, 'remaining': '0',
+    'trades': [
+        {'id': '1', 'order': '1', 'symbol': 'BTC/USDT', 'price': '0.1', 'amount': '0.1', 'timestamp': 1670000000000},
+        {'id': '2', 'order': '1', 'symbol': 'BTC/USDT', 'price': '0.1', 'amount': '0.2', 'timestamp': 1670000000001},
+    ],
+}, market)
+assert order['filled'] == Decimal('0.3') and order['amount'] == Decimal('0.3') and order['cost'] == Decimal('0.03')
+assert order['trades'][1]['cost'] == Decimal('0.02')
+
+ticker = exchange.safe_ticker({'symbol': 'BTC/USDT', 'open': '0.1', 'last': '0.3', 'baseVolume': '10', 'quoteVolume': '2'})
+assert ticker['change'] == Decimal('0.2') and ticker['average'] == Decimal('0.2') and ticker['vwap'] == Decimal('0.2')
+
+orderbook = exchange.parse_order_book({'bids': [['0.1', '1'], ['0.3', '2']], 'asks': [['0.4', '1']]}, 'BTC/USDT')
+assert orderbook['bids'] == [[Decimal('0.3'), Decimal('2')], [Decimal('0.1'), Decimal('1')]]
+
+# the order books of the websocket exchanges find the levels of a snapshot with the float deltas
+
+book = OrderBook(orderbook, None, to_decimal)
+book['bids'].store(0.3, 5.0)
+book['bids'].store(0.1, 0.0)
+book['asks'].store(0.5, 1.5)
+assert book['bids'] == [[Decimal('0.3'), Decimal('5')]]
+assert book['asks'] == [[Decimal('0.4'), Decimal('1')], [Decimal('0.5'), Decimal('1.5')]]
+
+counted = CountedOrderBook({}, None, to_decimal)
+counted['asks'].store(0.1, 1.0, 2)
+counted['asks'].store(0.1, 2.0, 3)
+assert counted['asks'] == [[Decimal('0.1'), Decimal('2'), 3]]
+
+indexed = IndexedOrderBook({}, None, to_decimal)
+indexed['bids'].store(0.1, 1.0, 'a')
+indexed['bids'].store(None, 2.0, 'a')
+assert indexed['bids'] == [[Decimal('0.1'), Decimal('2'), 'a']]
+
+# the order books keep the floats by default
+assert OrderBook({'bids': [[0.1, 1.0]]})['bids'] == [[0.1, 1.0]]
@@ -0,0 +1,59 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+
+
+class exchange(ccxt.Exchange):
+
+    def describe(self):
+        return self.deep_extend(super(exchange, self).describe(), {
+            'id': 'describe_cache',
+            'api': {
+                'public': {
+                    'get': {
+                        'time': 1,
+                    },
+                },
+            },
+            'exceptions': {
+                'exact': {
+                    '-1000': ccxt.ExchangeError,
+                },
+            },
+            'timeframes': {
+                '1m': '1m',
+            },
+        })
+
+
+def config(instance, name):
+    # the config of the implicit method, kept in the closure of the generated function
+    method = getattr(instance, name)
+    return [cell.cell_contents['config'] for cell in method.__func__.__closure__ if isinstance(cell.cell_contents, dict)][0]
+
+
+# an api overridden in config is bound to its instance only, the other instances keep the methods of the class
+
+overridden = exchange({'api': {'public': {'get': {'time': 50, 'ping': 2}}}})
+assert config(overridden, 'publicGetTime') == {'cost': 50} and config(overridden, 'public_get_time') == {'cost': 50}
+assert config(overridden, 'publicGetPing') == {'cost': 2}
+fresh = exchange()
+assert config(fresh, 'publicGetTime') == {'cost': 1}
+assert not hasattr(fresh, 'publicGetPing') and not hasattr(exchange, 'publicGetPing')
+assert fresh.api == {'public': {'get': {'time': 1}}}
+
+# the flat sections of describe() are copied per instance
+
+fresh.exceptions['exact']['-2000'] = ccxt.BadRequest
+fresh.timeframes['1h'] = '1h'
+fresh.commonCurrencies['ABC'] = 'XYZ'
+other = exchange()
+assert other.exceptions['exact'] == {'-1000': ccxt.ExchangeError}
+assert other.timeframes == {'1m': '1m'}
+assert 'ABC' not in other.commonCurrencies
@@ -0,0 +1,90 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import calendar  # noqa: E402
+import datetime  # noqa: E402
+import random  # noqa: E402
+import re  # noqa: E402
+import ccxt  # noqa: E402
+from ccxt.pro.base.functions import iso8601  # noqa: E402
+
+
+def former_iso8601(timestamp=None):
+    # the former formatting, that raised the ValueError of the years after 9999
+    if timestamp is None:
+        return timestamp
+    if not isinstance(timestamp, int):
+        return None
+    if int(timestamp) < 0:
+        return None
+    try:
+        utc = datetime.datetime.utcfromtimestamp(timestamp // 1000)
+        return utc.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-6] + "{:03d}".format(int(timestamp) % 1000) + 'Z'
+    except (TypeError, OverflowError, OSError, ValueError):
+        return None
+
+
+def former_parse8601(timestamp=None):
+    if timestamp is None:
+        return timestamp
+    regex = r'([0-9]{4})-?([0-9]{2})-?([0-9]{2})(?:T|[\s])?([0-9]{2}):?([0-9]{2}):?([0-9]{2})(\.[0-9]{1,3})?(?:(\+|\-)([0-9]{2})\:?([0-9]{2})|Z)?'
+    try:
+        match = re.search(regex, timestamp, re.IGNORECASE)
+        if match is None:
+            return None
+        yyyy, mm, dd, h, m, s, ms, sign, hours, minutes = match.groups()
+        ms = ms or '.000'
+        ms = (ms + '00')[0:4]
+        msint = int(ms[1:])
+        sign = sign or ''
+        sign = int(sign + '1') * -1
+        hours = int(hours or 0) * sign
+        minutes = int(minutes or 0) * sign
+        offset = datetime.timedelta(hours=hours, minutes=minutes)
+        string = yyyy + mm + dd + h + m + s + ms + 'Z'
+        dt = datetime.datetime.strptime(string, "%Y%m%d%H%M%S.%fZ")
+        dt = dt + offset
+        return calendar.timegm(dt.utctimetuple()) * 1000 + msint
+    except (TypeError, OverflowError, OSError, ValueError):
+        return None
+
+
+exchange = ccxt.Exchange({'id': 'iso8601'})
+assert exchange.iso8601 is iso8601
+
+# the edges of the formatting
+
+for timestamp in [None, 0, 1, 999, 1000, True, -1, 1.5, '1', 951782400000, 253402300799999, 253402300800000, 10 ** 20]:
+    assert exchange.iso8601(timestamp) == former_iso8601(timestamp), timestamp
+assert exchange.iso8601(253402300800000) is None
+
+# the edges of the parsing, the shapes that are read at their positions and the ones that are matched
+
+strings = [
+    None, '', 'Z', {}, 33, b'2022-12-02T16:53:20.123Z', '2022-12-02',
+    '2022-12-02T16:53:20.123Z', '2022-12-02T16:53:20Z', '2022-12-02T16:53:20.1Z', '2022-12-02T16:53:20.123456Z',
+    '2022-12-02 16:53:20', '2022-12-02t16:53:20.123z', '20221202T165320.1Z', 'x2022-12-02T16:53:20Zabc',
+    '2022-12-02T16:53:20.5+01:30', '2022-12-02T16:53:20-0545', '1969-12-31T23:59:59.999Z', '1970-01-01T00:00:00.000Z',
+    '0000-01-01T00:00:00Z', '0001-01-01T00:00:00Z', '0001-01-01T00:00:00+01:00', '9999-12-31T23:59:59-01:00', '9999-12-31T23:59:59.999Z',
+    '2024-02-29T00:00:00.000Z', '2023-02-29T00:00:00.000Z', '2022-12-02T24:00:00.000Z', '2022-12-02T23:60:00Z', '2022-12-02T23:00:60.000Z',
+    '2022-12-02T16:53:2a.123Z', '2022-12-02T16:53:20.12aZ', '2022-1a-02T16:53:20.123Z', '+022-12-02T16:53:20.123Z', '2022-12-02T16:53:20.123+',
+]
+for string in strings:
+    assert exchange.parse8601(string) == former_parse8601(string), string
+
+# random timestamps, twice to go through the caches
+
+random.seed(1)
+timestamps = [random.randint(0, 253402300799999) for i in range(5000)] + [1670000000000 + random.randint(0, 5000) for i in range(5000)]
+for timestamp in timestamps + timestamps:
+    string = exchange.iso8601(timestamp)
+    assert string == former_iso8601(timestamp)
+    assert exchange.parse8601(string) == timestamp
+    assert exchange.parse8601(string[:19] + 'Z') == timestamp // 1000 * 1000
+    offset = string[:23] + random.choice(['+', '-']) + '{:02d}:{:02d}'.format(random.randint(0, 23), random.randint(0, 59))
+    assert exchange.parse8601(offset) == former_parse8601(offset), offset
@@ -0,0 +1,220 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import asyncio  # noqa: E402
+import json  # noqa: E402
+import threading  # noqa: E402
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer  # noqa: E402
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+from ccxt.base.json_stream import JsonArrayParser  # noqa: E402
+
+# the parser decodes the same elements as json.loads, wherever the chunks are cut
+
+elements = [{'price': '1.50', 'amount': 2.0, 'id': 12345678901234567890, 'side': 'bü"y'}, 1.25, -3, 1e5, True, None, 'x', [], {}]
+documents = [
+    ([], elements),
+    (['data'], {'code': 0, 'msg': 'ok', 'data': elements, 'next': 5}),
+    (['result', 'list'], {'other': [1, {'list': 2}], 'result': {'list': elements}}),
+]
+for path, document in documents:
+    for indent in [None, 2]:
+        text = json.dumps(document, ensure_ascii=False, indent=indent).encode()
+        expected = json.loads(text, parse_float=str, parse_int=str)
+        for key in path:
+            expected = expected[key]
+        for size in [1, 2, 5, 64, len(text)]:
+            parser = JsonArrayParser(path)
+            items = []
+            for i in range(0, len(text), size):
+                items += parser.feed(text[i:i + size])
+            items += parser.feed(b'', True)
+            assert items == expected
+            assert parser.found
+
+# the numbers are not quoted without quoteJsonNumbers
+assert JsonArrayParser([], False).feed(b'[1, 2.5]', True) == [1, 2.5]
+
+# an object without the path
+parser = JsonArrayParser(['data'])
+assert parser.feed(b'{"code": -1, "msg": "error"}', True) == []
+assert not parser.found
+assert parser.envelope == {'code': '-1', 'msg': 'error'}
+
+# an element that spans many chunks is kept aside and decoded once its end is received
+element = {'list': ['a "quoted\\" ]}[{, string'] * 1000, 'nested': [[{'x': 1}]] * 100}
+text = json.dumps([element, 2]).encode()
+parser = JsonArrayParser()
+items = []
+for i in range(0, len(text), 7):
+    items += parser.feed(text[i:i + 7])
+items += parser.feed(b'', True)
+assert items == json.loads(text, parse_float=str, parse_int=str)
+
+# an element that is not valid json is reported once its end is received, before the response is complete
+try:
+    parser = JsonArrayParser()
+    parser.feed(b'[{"a" ')
+    parser.feed(b'1}, 2')
+    assert False
+except ValueError:
+    pass
+
+# a truncated response
+try:
+    JsonArrayParser().feed(b'[1, 2', True)
+    assert False
+except ValueError:
+    pass
+
+# ----------------------------------------------------------------------------
+
+trades = [{'id': str(i), 'time': 1670000000000 + i * 1000, 'price': '100.5', 'qty': '0.1'} for i in range(1000)]
+responses = {
+    '/trades': (200, json.dumps(trades)),
+    '/wrapped': (200, json.dumps({'code': 0, 'data': trades})),
+    '/error': (200, json.dumps({'code': -1121, 'msg': 'Invalid symbol.'})),
+    '/failed': (500, 'Internal Server Error'),
+}
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        status, body = responses[self.path.split('?')[0]]
+        body = body.encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # the connections of the streams that are not read to the end are closed by the client
+        pass
+
+
+server = Server(('127.0.0.1', 0), Handler)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+
+
+def describe(self):
+    return {
+        'id': 'json_stream',
+        'urls': {
+            'api': 'http://127.0.0.1:' + str(server.server_address[1]),
+        },
+        'api': {
+            'public': {
+                'get': ['trades', 'wrapped', 'error', 'failed'],
+            },
+        },
+        'httpExceptions': {
+            '500': ccxt.ExchangeNotAvailable,
+        },
+    }
+
+
+def sign(self, path, api='public', method='GET', params={}, headers=None, body=None):
+    url = self.urls['api'] + '/' + path
+    if params:
+        url += '?' + self.urlencode(params)
+    return {'url': url, 'method': method, 'body': body, 'headers': headers}
+
+
+def parse_trade(self, trade, market=None):
+    return {'id': trade['id'], 'timestamp': self.safe_integer(trade, 'time'), 'symbol': None, 'price': self.safe_number(trade, 'price')}
+
+
+class exchange(ccxt.Exchange):
+    describe = describe
+    sign = sign
+    parse_trade = parse_trade
+
+    def fetch_trades(self, symbol=None, since=None, limit=None, params={}):
+        return self.parse_trades(self.publicGetTrades(params), None, since, limit)
+
+    def fetch_my_trades(self, symbol=None, since=None, limit=None, params={}):
+        response = self.publicGetWrapped(params)
+        return self.parse_trades(self.safe_value(response, 'data', []), None, since, limit)
+
+
+class async_exchange(ccxt.async_support.Exchange):
+    describe = describe
+    sign = sign
+    parse_trade = parse_trade
+
+    async def fetch_trades(self, symbol=None, since=None, limit=None, params={}):
+        return self.parse_trades(await self.publicGetTrades(params), None, since, limit)
+
+
+try:
+    sync = exchange({'enableRateLimit': False})
+    expected = sync.fetch_trades()
+    assert len(expected) == 1000
+
+    # the streamed trades are parsed while they are received, since and limit select the first of them
+    streamed = sync.fetch_trades(params={'stream': True})
+    assert not isinstance(streamed, list)
+    assert list(streamed) == expected
+    assert list(sync.fetch_trades(since=1670000010000, limit=3, params={'stream': True})) == expected[10:13]
+
+    # the raw elements of an implicit api method, which can also be read into a list
+    raw = sync.publicGetTrades({'stream': True})
+    assert len(raw) == 1000
+    assert raw[0] == {'id': '0', 'time': '1670000000000', 'price': '100.5', 'qty': '0.1'}
+
+    # the array at a path is what an implicit api method returns, a method that reads it from the response fails instead of finding nothing
+    assert list(sync.publicGetWrapped({'stream': ['data']})) == list(sync.publicGetTrades())
+    try:
+        sync.fetch_my_trades(params={'stream': ['data']})
+        assert False
+    except TypeError as e:
+        assert "'data'" in str(e)
+    assert sync.fetch_my_trades() == expected
+
+    # a response that is not the array is handled like fetch() does
+    assert sync.publicGetError({'stream': True}) == {'code': '-1121', 'msg': 'Invalid symbol.'}
+    try:
+        list(sync.publicGetError({'stream': ['data']}))
+        assert False
+    except ccxt.ExchangeError as e:
+        assert 'Invalid symbol.' in str(e)
+    try:
+        sync.publicGetFailed({'stream': True})
+        assert False
+    except ccxt.ExchangeNotAvailable:
+        pass
+
+    async def test_async():
+        exchange = async_exchange({'enableRateLimit': False})
+        try:
+            streamed = await exchange.fetch_trades(params={'stream': True})
+            assert [trade async for trade in streamed] == expected
+            streamed = await exchange.fetch_trades(since=1670000010000, limit=3, params={'stream': True})
+            assert [trade async for trade in streamed] == expected[10:13]
+            assert await exchange.publicGetError({'stream': True}) == {'code': '-1121', 'msg': 'Invalid symbol.'}
+            try:
+                await exchange.publicGetFailed({'stream': True})
+                assert False
+            except ccxt.ExchangeNotAvailable:
+                pass
+        finally:
+            await exchange.close()
+
+    asyncio.run(test_async())
+finally:
+    server.shutdown()
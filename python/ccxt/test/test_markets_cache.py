@@ -0,0 +1,131 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import shutil  # noqa: E402
+import tempfile  # noqa: E402
+import ccxt  # noqa: E402
+
+
+class exchange(ccxt.Exchange):
+
+    fetched = 0
+
+    def describe(self):
+        return self.deep_extend(super(exchange, self).describe(), {
+            'id': 'markets_cache',
+            'urls': {
+                'api': 'https://api.example.com',
+            },
+            'has': {
+                'fetchCurrencies': False,
+            },
+        })
+
+    def fetch_markets(self, params={}):
+        self.fetched += 1
+        return [
+            {'id': 'BTCUSDT', 'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT', 'baseId': 'BTC', 'quoteId': 'USDT', 'spot': True, 'precision': {'amount': 8, 'price': 2}},
+            {'id': 'ETHUSDT', 'symbol': 'ETH/USDT', 'base': 'ETH', 'quote': 'USDT', 'baseId': 'ETH', 'quoteId': 'USDT', 'spot': True, 'precision': {'amount': 8, 'price': 2}},
+        ]
+
+
+directory = tempfile.mkdtemp()
+
+try:
+    # the first instance fetches the markets and saves them
+    first = exchange({'markets_cache_path': directory})
+    first.load_markets()
+    assert first.fetched == 1
+    assert len(os.listdir(directory)) == 1
+
+    # the second instance reads them from the cache
+    second = exchange({'markets_cache_path': directory})
+    second.load_markets()
+    assert second.fetched == 0
+    assert second.markets == first.markets
+    assert second.markets_by_id == first.markets_by_id
+    assert second.currencies == first.currencies
+    assert second.currencies_by_id == first.currencies_by_id
+    assert second.symbols == ['BTC/USDT', 'ETH/USDT']
+    assert second.market('ETH/USDT')['id'] == 'ETHUSDT'
+
+    # reload always fetches
+    second.load_markets(True)
+    assert second.fetched == 1
+
+    # expired
+    expired = exchange({'markets_cache_path': directory, 'markets_cache_ttl': -1})
+    expired.load_markets()
+    assert expired.fetched == 1
+
+    # other params, other api
+    other = exchange({'markets_cache_path': directory})
+    other.load_markets(False, {'type': 'swap'})
+    assert other.fetched == 1
+    sandbox = exchange({'markets_cache_path': directory, 'urls': {'api': 'https://testnet.example.com'}})
+    sandbox.load_markets()
+    assert sandbox.fetched == 1
+    assert len(os.listdir(directory)) == 3
+
+    # the params have their own file, the markets of the default params are kept
+    default = exchange({'markets_cache_path': directory})
+    default.load_markets()
+    assert default.fetched == 0
+    swap = exchange({'markets_cache_path': directory})
+    swap.load_markets(False, {'type': 'swap'})
+    assert swap.fetched == 0
+
+    # a single file can be used instead of a directory
+    path = os.path.join(directory, 'markets.pickle')
+    exchange({'markets_cache_path': path}).load_markets()
+    cached = exchange({'markets_cache_path': path})
+    cached.load_markets()
+    assert cached.fetched == 0
+
+    # a corrupted cache is ignored
+    with open(path, 'wb') as file:
+        file.write(b'garbage')
+    corrupted = exchange({'markets_cache_path': path})
+    corrupted.load_markets()
+    assert corrupted.fetched == 1
+    assert len(corrupted.markets) == 2
+
+    # a cache that never expires
+    unexpired = exchange({'markets_cache_path': path, 'markets_cache_ttl': None})
+    unexpired.load_markets()
+    assert unexpired.fetched == 0
+
+    # instances of the same class share one set of markets
+    shared = exchange({'shared_markets': True})
+    shared.load_markets()
+    assert shared.fetched == 1
+    other = exchange({'shared_markets': True})
+    other.load_markets()
+    assert other.fetched == 0
+    assert other.markets is shared.markets
+    assert other.markets_by_id is shared.markets_by_id
+    assert other.currencies is shared.currencies
+    assert exchange().load_markets() is not shared.markets
+
+    # a reload does not modify the markets held by the other instances
+    markets = shared.markets
+    other.load_markets(True)
+    assert other.markets is not markets
+    assert shared.markets is markets
+    assert exchange({'shared_markets': True}).load_markets() is other.markets
+
+    # the workers forked after the markets are loaded use them without fetching or parsing them
+    if hasattr(os, 'fork'):
+        pid = os.fork()
+        if pid == 0:
+            worker = exchange({'shared_markets': True})
+            worker.load_markets()
+            os._exit(0 if worker.fetched == 0 and worker.markets is other.markets else 1)
+        assert os.waitpid(pid, 0)[1] == 0
+finally:
+    shutil.rmtree(directory)
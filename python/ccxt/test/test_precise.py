@@ -0,0 +1,43 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+from ccxt.base.precise import Precise  # noqa: E402
+
+# the instances have no __dict__
+
+precise = Precise('1.500')
+assert not hasattr(precise, '__dict__')
+assert (precise.integer, precise.decimals, precise.base) == (1500, 3, 10)
+assert str(precise) == '1.5'
+assert (precise.integer, precise.decimals) == (15, 1)
+assert str(Precise('1e8')) == '100000000'
+assert str(Precise('-1.123e-6')) == '-0.000001123'
+assert str(Precise(0, 8)) == '0'
+assert str(Precise(5, -2)) == '500'
+assert Precise('0.1') + Precise('0.2') == '0.3'
+
+# the fused operations return what the operations that they replace return
+
+operands = ['0', '-0', '1', '-2.5', '0.00000001', '69696900000', '1e8', '-1.123e-6', '3.3333', '100', None]
+for a in operands:
+    for b in operands:
+        for c in operands:
+            assert Precise.string_mul_add(a, b, c) == Precise.string_add(Precise.string_mul(a, b), c)
+            assert Precise.string_mul_mul(a, b, c) == Precise.string_mul(Precise.string_mul(a, b), c)
+            for precision in [18, 2, 0, -1]:
+                assert Precise.string_mul_div(a, b, c, precision) == Precise.string_div(Precise.string_mul(a, b), c, precision)
+            total = None
+            for string in [a, b, c]:
+                total = Precise.string_add(total, string)
+            assert Precise.string_sum([a, b, c]) == total
+
+assert Precise.string_sum([]) is None
+assert Precise.string_sum(['1.50']) == '1.50'
+assert Precise.string_sum(['1.50', '2.5', None, '-4']) == '0'
+assert Precise.string_mul_div('-1', '3', '7', 2) == '-0.42'
+assert Precise.string_mul_div('1', '1', '0') is None
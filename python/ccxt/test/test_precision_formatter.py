@@ -0,0 +1,103 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import decimal  # noqa: E402
+import random  # noqa: E402
+import runpy  # noqa: E402
+import types  # noqa: E402
+import ccxt  # noqa: E402
+from ccxt.base.decimal_to_precision import decimal_to_precision  # noqa: E402
+from ccxt.base.decimal_to_precision import precision_formatter  # noqa: E402
+from ccxt.base.decimal_to_precision import TRUNCATE, ROUND  # noqa: E402
+from ccxt.base.decimal_to_precision import DECIMAL_PLACES, SIGNIFICANT_DIGITS, TICK_SIZE  # noqa: E402
+from ccxt.base.decimal_to_precision import NO_PADDING, PAD_WITH_ZERO  # noqa: E402
+
+
+def outcome(function, *args):
+    try:
+        return function(*args)
+    except Exception as e:
+        return type(e)
+
+
+def checked_decimal_to_precision(n, rounding_mode=ROUND, precision=None, counting_mode=DECIMAL_PLACES, padding_mode=NO_PADDING):
+    # the formatter returns what decimal_to_precision() returns, or raises what it raises
+    expected = outcome(decimal_to_precision, n, rounding_mode, precision, counting_mode, padding_mode)
+    assert outcome(precision_formatter(rounding_mode, precision, counting_mode, padding_mode), n) == expected, (n, rounding_mode, precision, counting_mode, padding_mode)
+    if isinstance(expected, type):
+        raise expected()
+    return expected
+
+
+# the cases of test_decimal_to_precision.py, with each call checked against a formatter
+
+name = 'ccxt.base.decimal_to_precision'
+module = sys.modules[name]
+checked = types.ModuleType(name)
+checked.__dict__.update(module.__dict__)
+checked.decimal_to_precision = checked_decimal_to_precision
+sys.modules[name] = checked
+try:
+    runpy.run_path(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_decimal_to_precision.py'))
+finally:
+    sys.modules[name] = module
+
+# random numbers in the shapes that str() gives them
+
+random.seed(21)
+
+
+def random_number():
+    shape = random.randrange(5)
+    if shape == 0:
+        return random.uniform(-100000, 100000)
+    elif shape == 1:
+        return round(random.uniform(-100, 100), random.randrange(10))
+    elif shape == 2:
+        return random.uniform(-1, 1) * 10 ** random.randint(-12, 12)
+    elif shape == 3:
+        digits = str(random.randrange(10 ** random.randint(1, 30)))
+        point = random.randint(0, len(digits))
+        return random.choice(['', '-']) + digits[:point] + '.' + digits[point:] + random.choice(['', 'e' + str(random.randint(-30, 30))])
+    return random.choice([0, -0.0, '-0', '0.000', '-0.000', 1, -1, 0.5, -0.5, 1e-7, 1e21, 10 ** 30, '1E+2', '.5', '5.', 'nan', 'abc'])
+
+
+ticks = [0.1, 0.01, 0.05, 0.25, 0.5, 1, 2, 10, 1e-8, 0.00025, 3e-05, decimal.Decimal('0.01'), 0, -0.1, None]
+for i in range(20000):
+    counting_mode = random.choice([DECIMAL_PLACES, SIGNIFICANT_DIGITS, TICK_SIZE])
+    precision = random.choice(ticks) if counting_mode == TICK_SIZE else random.choice([0, 1, 2, 4, 8, 18, 26, 30, -2, None])
+    args = (random.choice([TRUNCATE, ROUND]), precision, counting_mode, random.choice([NO_PADDING, PAD_WITH_ZERO]))
+    n = random_number()
+    assert outcome(precision_formatter(*args), n) == outcome(decimal_to_precision, n, *args), (n,) + args
+
+# the precision methods of an exchange use the formatters of its markets
+
+exchange = ccxt.Exchange({'id': 'precision', 'precisionMode': TICK_SIZE})
+exchange.set_markets([
+    {'id': 'BTCUSDT', 'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT', 'spot': True, 'precision': {'price': 0.01, 'amount': 0.00001}},
+    {'id': 'DOGEUSDT', 'symbol': 'DOGE/USDT', 'base': 'DOGE', 'quote': 'USDT', 'spot': True, 'precision': {'price': 0.00001, 'amount': 1}},
+])
+assert ('BTC/USDT', 'price', ROUND) in exchange.precision_formatters
+assert exchange.price_to_precision('BTC/USDT', 20000.126) == '20000.13'
+assert exchange.amount_to_precision('BTC/USDT', 0.123456789) == '0.12345'
+assert exchange.cost_to_precision('BTC/USDT', 1234.56789) == '1234.56'
+assert exchange.amount_to_precision('DOGE/USDT', 123.9) == '123'
+try:
+    exchange.amount_to_precision('BTC/USDT', 0.000001)
+    assert False
+except ccxt.ArgumentsRequired:
+    pass
+
+# a change of the padding mode or of the precision of a market compiles the formatter again
+exchange.paddingMode = PAD_WITH_ZERO
+assert exchange.price_to_precision('BTC/USDT', 20000) == '20000.00'
+exchange.markets['BTC/USDT']['precision']['price'] = 0.1
+assert exchange.price_to_precision('BTC/USDT', 20000.125) == '20000.1'
+exchange.precisionMode = DECIMAL_PLACES
+exchange.markets['BTC/USDT']['precision']['price'] = 3
+assert exchange.price_to_precision('BTC/USDT', 20000.125) == '20000.125'
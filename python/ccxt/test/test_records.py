@@ -0,0 +1,124 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import copy  # noqa: E402
+import ccxt  # noqa: E402
+from ccxt.base.records import Record, Trade, Order, Ticker, LedgerEntry  # noqa: E402
+from ccxt.pro.base.cache import ArrayCache, ArrayCacheBySymbolById  # noqa: E402
+
+# the records read and write like dicts
+
+structure = {
+    'info': {'a': '1'}, 'id': '1', 'order': None, 'timestamp': 1670000000123, 'datetime': '2022-12-02T16:53:20.123Z', 'symbol': 'BTC/USDT',
+    'type': None, 'side': 'buy', 'takerOrMaker': None, 'price': 1.5, 'amount': 2.0, 'cost': 3.0, 'fee': None, 'fees': [], 'extra': 5,
+}
+trade = Trade(structure)
+assert not hasattr(trade, '__dict__')
+assert trade == structure and dict(trade) == structure and len(trade) == len(structure)
+assert list(trade.keys())[:5] == ['id', 'order', 'info', 'timestamp', 'datetime']
+assert trade['datetime'] == '2022-12-02T16:53:20.123Z' and trade._extra == {'extra': 5}
+assert trade.get('missing') is None and 'missing' not in trade and 'extra' in trade
+assert trade['info'] is structure['info']
+assert repr(trade) == repr(dict(trade))
+
+trade['timestamp'] = 1670000001000
+assert trade['datetime'] == '2022-12-02T16:53:21.000Z'
+trade['datetime'] = 'other'
+assert trade['datetime'] == 'other'
+trade['datetime'] = '2022-12-02T16:53:21.000Z'
+assert trade._extra == {'extra': 5}
+del trade['extra']
+del trade['timestamp']
+assert 'datetime' not in trade and 'timestamp' not in trade and trade._extra == {}
+try:
+    trade['timestamp']
+    assert False
+except KeyError:
+    pass
+
+trade.update({'price': 2.5, 'new': 1})
+assert trade['price'] == 2.5 and trade['new'] == 1
+duplicate = trade.copy()
+assert type(duplicate) is Trade and duplicate == trade and duplicate is not trade
+assert copy.deepcopy(trade) == trade
+
+# a datetime that is not the one of the timestamp is kept
+
+assert Trade({'timestamp': None, 'datetime': '2022-12-02T16:53:20.123Z'})['datetime'] == '2022-12-02T16:53:20.123Z'
+assert Trade({'timestamp': 1, 'datetime': None})['datetime'] is None
+assert 'datetime' not in Trade({'id': '1'})
+assert Trade({'timestamp': 1670000000123, 'datetime': '2022-12-02T16:53:20Z'})._extra == {'datetime': '2022-12-02T16:53:20Z'}
+assert Trade({'timestamp': 1670000000123, 'datetime': '2022-12-02T16:53:21.123Z'})._extra == {'datetime': '2022-12-02T16:53:21.123Z'}
+assert Trade({'timestamp': 1670000000123, 'datetime': '2022-12-02T16:53:20.123Z'})._extra is None
+
+# deep_extend() keeps a record as a record, as extend() does
+
+extended = ccxt.Exchange.deep_extend(Trade({'id': '1', 'fee': {'cost': '1'}}), {'fee': {'currency': 'BTC'}, 'new': 1})
+assert type(extended) is Trade and extended == {'id': '1', 'fee': {'cost': '1', 'currency': 'BTC'}, 'new': 1}
+assert type(ccxt.Exchange.extend(Trade({'id': '1'}), {'new': 1})) is Trade
+assert type(ccxt.Exchange.deep_extend({'id': '1'}, Trade({'new': 1}))) is dict
+
+# info is released on demand
+
+assert Trade(structure, info=False)['info'] is None
+
+# the exchange returns records with records = True, with the same contents as the dicts
+
+
+class Local(ccxt.Exchange):
+    def parse_trade(self, trade, market=None):
+        return self.safe_trade(dict(trade), market)
+
+    def parse_order(self, order, market=None):
+        return self.safe_order(dict(order), market)
+
+
+market = {'id': 'BTCUSDT', 'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT', 'spot': True, 'contractSize': None, 'inverse': False}
+raw_trades = [
+    {'id': str(i), 'order': '1', 'symbol': 'BTC/USDT', 'price': '0.1', 'amount': str(i + 1), 'timestamp': 1670000000000 - i, 'datetime': ccxt.Exchange.iso8601(1670000000000 - i), 'info': {'i': i}}
+    for i in range(5)
+]
+raw_order = {
+    'id': '1', 'symbol': 'BTC/USDT', 'type': 'limit', 'side': 'buy', 'status': 'closed', 'price': '0.1', 'amount': None, 'remaining': '0',
+    'timestamp': 1670000000000, 'datetime': ccxt.Exchange.iso8601(1670000000000), 'trades': raw_trades, 'info': {},
+}
+raw_ticker = {'symbol': 'BTC/USDT', 'timestamp': 1670000000000, 'datetime': ccxt.Exchange.iso8601(1670000000000), 'open': '0.1', 'last': '0.3', 'info': {}}
+raw_entry = {'id': '1', 'currency': 'BTC', 'timestamp': 1670000000000, 'amount': '1', 'before': '2', 'fee': {'cost': '0.1', 'currency': 'BTC'}, 'info': {}}
+
+results = {}
+for records in [False, True]:
+    exchange = Local({'id': 'records', 'records': records})
+    results[records] = [
+        exchange.parse_trades(raw_trades, market, None, 3, {'extra': 1}),
+        exchange.safe_order(dict(raw_order), market),
+        exchange.safe_ticker(dict(raw_ticker), market),
+        exchange.safe_ledger_entry(dict(raw_entry)),
+    ]
+dicts, records = results[False], results[True]
+assert [type(trade) for trade in records[0]] == [Trade] * 3
+assert type(records[1]) is Order and type(records[2]) is Ticker and type(records[3]) is LedgerEntry
+assert [type(trade) for trade in records[1]['trades']] == [Trade] * 5
+assert records == dicts
+assert [trade['id'] for trade in records[0]] == ['2', '1', '0'] and records[0][0]['extra'] == 1
+assert records[1]['cost'] == 1.5 and records[1]['datetime'] == '2022-12-02T16:53:20.000Z'
+assert all(isinstance(value, Record) for value in records[1:])
+
+exchange = Local({'id': 'records', 'records': True, 'records_info': False})
+assert all(trade['info'] is None for trade in exchange.parse_trades(raw_trades, market))
+
+# the caches of the websocket exchanges keep the records
+
+cache = ArrayCache(2)
+for trade in records[0]:
+    cache.append(trade)
+assert cache == records[0][1:]
+
+orders = ArrayCacheBySymbolById()
+orders.append(Order({'id': '1', 'symbol': 'BTC/USDT', 'status': 'open', 'timestamp': 1}))
+orders.append(Order({'id': '1', 'symbol': 'BTC/USDT', 'status': 'closed', 'timestamp': 1}))
+assert len(orders) == 1 and type(orders[0]) is Order and orders[0]['status'] == 'closed'
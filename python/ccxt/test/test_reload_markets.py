@@ -0,0 +1,96 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import asyncio  # noqa: E402
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+
+
+def market(base, quote, price_precision=2):
+    return {
+        'id': base + quote,
+        'symbol': base + '/' + quote,
+        'base': base,
+        'quote': quote,
+        'baseId': base,
+        'quoteId': quote,
+        'spot': True,
+        'precision': {'amount': 8, 'price': price_precision},
+    }
+
+
+listings = [
+    [market('BTC', 'USDT'), market('ETH', 'USDT'), market('LTC', 'USDT')],
+    # ETH/USDT changed, LTC/USDT delisted, SOL/USDT listed
+    [market('BTC', 'USDT'), market('ETH', 'USDT', 4), market('SOL', 'USDT')],
+]
+
+
+class exchange(ccxt.Exchange):
+
+    def describe(self):
+        return self.deep_extend(ccxt.Exchange.describe(self), {
+            'id': 'reload_markets',
+            'has': {
+                'fetchCurrencies': False,
+            },
+        })
+
+    def fetch_markets(self, params={}):
+        return listings[min(self.fetched, len(listings) - 1)]
+
+
+class async_exchange(ccxt.async_support.Exchange):
+
+    def describe(self):
+        return exchange.describe(self)
+
+    async def fetch_markets(self, params={}):
+        return exchange.fetch_markets(self, params)
+
+
+notifications = []
+
+
+def on_markets_changed(exchange, changes):
+    notifications.append(changes)
+
+
+sync = exchange({'on_markets_changed': on_markets_changed})
+sync.fetched = 0
+sync.load_markets()
+assert sync.markets_changes == {'added': ['BTC/USDT', 'ETH/USDT', 'LTC/USDT'], 'removed': [], 'changed': []}
+assert notifications == []  # the initial load is not a change
+btc = sync.markets['BTC/USDT']
+
+sync.fetched = 1
+changes = sync.reload_markets()
+assert changes == {'added': ['SOL/USDT'], 'removed': ['LTC/USDT'], 'changed': ['ETH/USDT']}
+assert notifications == [changes]
+assert sync.markets['BTC/USDT'] is btc  # unchanged markets are kept
+assert sync.markets['ETH/USDT']['precision']['price'] == 4
+assert sync.symbols == ['BTC/USDT', 'ETH/USDT', 'SOL/USDT']
+assert 'LTC/USDT' not in sync.markets
+assert 'LTCUSDT' not in sync.markets_by_id
+
+# a reload without changes does not notify
+assert sync.reload_markets() == {'added': [], 'removed': [], 'changed': []}
+assert len(notifications) == 1
+
+
+async def test_async():
+    instance = async_exchange()
+    instance.fetched = 0
+    await instance.load_markets()
+    instance.fetched = 1
+    changes = await instance.reload_markets()
+    assert changes == {'added': ['SOL/USDT'], 'removed': ['LTC/USDT'], 'changed': ['ETH/USDT']}
+    await instance.close()
+
+
+asyncio.run(test_async())
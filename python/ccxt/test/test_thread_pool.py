@@ -0,0 +1,51 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import threading  # noqa: E402
+import time  # noqa: E402
+import ccxt  # noqa: E402
+from ccxt.base import exchange as base  # noqa: E402
+
+created = []
+
+
+class CountedThreadPoolExecutor(base.ThreadPoolExecutor):
+    def __init__(self, *args, **kwargs):
+        # a slow creation lets the other threads find no pool yet
+        time.sleep(0.05)
+        created.append(self)
+        super(CountedThreadPoolExecutor, self).__init__(*args, **kwargs)
+
+
+base.ThreadPoolExecutor = CountedThreadPoolExecutor
+
+# the threads that submit their first calls together to a new instance share a single pool
+
+exchange = ccxt.Exchange({'id': 'thread_pool'})
+barrier = threading.Barrier(16)
+futures = []
+
+
+def submit(i):
+    barrier.wait()
+    futures.append(exchange.submit(lambda: i * 2))
+
+
+threads = [threading.Thread(target=submit, args=(i,)) for i in range(16)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+assert len(created) == 1 and exchange.thread_pool is created[0]
+assert sorted(future.result() for future in futures) == [i * 2 for i in range(16)]
+
+# the calls made from a worker of the pool run inline
+
+nested = exchange.submit(lambda: exchange.gather([exchange.submit(lambda: 1), exchange.submit(lambda: 2)]))
+assert nested.result() == [1, 2] and len(created) == 1
+exchange.thread_pool.shutdown()
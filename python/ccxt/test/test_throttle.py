@@ -7,8 +7,10 @@ sys.path.append(root)
 # ----------------------------------------------------------------------------
 
 import asyncio  # noqa: E402
+import threading  # noqa: E402
 import time  # noqa: E402
 from ccxt.async_support.base.throttler import Throttler as Throttle  # noqa: E402
+from ccxt.base.throttler import Throttler as SyncThrottle  # noqa: E402
 # from ccxt.async_support.base.throttle import throttle as Throttle
 
 
@@ -75,6 +77,12 @@ test_cases = [
         'cost': 1,
         'runs': 500,
     },
+    {
+        'tokens': 0,
+        'refillRate': 1 / 50,
+        'cost': 0.5,
+        'runs': 41,
+    },
 ]
 
 # add any more tests you want above
@@ -106,11 +114,136 @@ async def schedule(case):
 
 
 async def main():
-    await asyncio.wait([schedule(case) for case in test_cases], return_when=asyncio.ALL_COMPLETED)
+    await asyncio.wait([asyncio.ensure_future(schedule(case)) for case in test_cases], return_when=asyncio.ALL_COMPLETED)
 
 
 asyncio.run(main())
 
+# cancelled requests leave the queue without taking any tokens
+
+
+async def cancel():
+    throttle = Throttle({
+        'tokens': 0,
+        'refillRate': 1 / 50,
+    })
+    futures = [throttle(1) for i in range(10)]
+    for future in futures[:-1]:
+        future.cancel()
+    start = time.perf_counter_ns()
+    await futures[-1]
+    elapsed_ms = (time.perf_counter_ns() - start) / 1000000
+    print(f'cancel {elapsed_ms}ms expected 0ms')
+    assert elapsed_ms < delta
+    futures = [throttle(1) for i in range(10)]
+    for future in futures:
+        future.cancel()
+    await asyncio.sleep(0.001)
+    assert throttle.queue_depth() == {} and not throttle.running
+
+
+asyncio.run(cancel())
+
+# the requests of a higher priority are released first, the ones that waited long enough go before them
+
+
+async def prioritize():
+    throttle = Throttle({
+        'tokens': 0,
+        'refillRate': 1 / 10,
+    })
+    order = []
+
+    async def request(name, priority):
+        await throttle(1, priority)
+        order.append(name)
+
+    tasks = [asyncio.ensure_future(request('market' + str(i), 0)) for i in range(5)]
+    tasks.append(asyncio.ensure_future(request('order', 2)))
+    await asyncio.sleep(0)
+    assert throttle.queue_depth() == {0: 5, 2: 1}
+    await asyncio.gather(*tasks)
+    assert order == ['order', 'market0', 'market1', 'market2', 'market3', 'market4']
+    throttle = Throttle({
+        'tokens': -5,
+        'refillRate': 1 / 20,
+        'aging': 20,
+    })
+    order = []
+    tasks = [asyncio.ensure_future(request('market', 0))]
+    await asyncio.sleep(0.08)
+    tasks.append(asyncio.ensure_future(request('order', 1)))
+    await asyncio.gather(*tasks)
+    assert order == ['market', 'order']
+
+
+asyncio.run(prioritize())
+
+# the synchronous throttler must give the same timings
+
+
+def schedule_sync(case, results):
+    throttle = SyncThrottle({
+        'tokens': case['tokens'],
+        'refillRate': case['refillRate'],
+    })
+    start = time.perf_counter_ns()
+    for i in range(case['runs']):
+        throttle(case['cost'])
+    end = time.perf_counter_ns()
+    elapsed_ms = (end - start) / 1000000
+    result = abs(case['expected'] - elapsed_ms) < delta
+    print(f'sync case {case["number"]} {"succeeded" if result else "failed"} in {elapsed_ms}ms expected {case["expected"]}ms')
+    results.append(result)
+
+
+sync_results = []
+threads = [threading.Thread(target=schedule_sync, args=(case, sync_results)) for case in test_cases]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+assert len(sync_results) == len(test_cases) and all(sync_results)
+
+# threads sharing one synchronous throttler split the same allowance between them
+
+
+def share_sync(throttle, runs):
+    for i in range(runs):
+        throttle(1)
+
+
+throttle = SyncThrottle({'tokens': 0, 'refillRate': 1 / 20})
+start = time.perf_counter_ns()
+threads = [threading.Thread(target=share_sync, args=(throttle, 25)) for i in range(4)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+elapsed_ms = (time.perf_counter_ns() - start) / 1000000
+expected = (4 * 25 - 1) * 20
+print(f'sync shared {elapsed_ms}ms expected {expected}ms')
+assert abs(expected - elapsed_ms) < delta
+
+# and serve them in the order they called it
+
+
+def arrive_sync(throttle, number, order):
+    time.sleep(number * 0.005)
+    throttle(1)
+    order.append(number)
+
+
+throttle = SyncThrottle({'tokens': 0, 'refillRate': 1 / 50})
+order = []
+threads = [threading.Thread(target=arrive_sync, args=(throttle, number, order)) for number in range(8)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+print(f'sync order {order}')
+assert order == list(range(8))
+
 # output
 
 '''
@@ -124,3 +257,126 @@ case 2 succeeded in 4001.503833ms expected 4000.0ms
 case 9 succeeded in 5001.487ms expected 5000.0ms
 case 1 succeeded in 5001.635042ms expected 5000.0ms
 '''
+
+# and by priority
+
+
+def prioritize_sync(throttle, name, priority, order):
+    throttle(1, priority)
+    order.append(name)
+
+
+throttle = SyncThrottle({'tokens': -5, 'refillRate': 1 / 20})
+order = []
+threads = [threading.Thread(target=prioritize_sync, args=(throttle, 'market' + str(i), 0, order)) for i in range(5)]
+threads.append(threading.Thread(target=prioritize_sync, args=(throttle, 'order', 2, order)))
+for thread in threads:
+    thread.start()
+    time.sleep(0.005)
+assert throttle.queue_depth() == {0: 5, 2: 1}
+for thread in threads:
+    thread.join()
+print(f'sync priority {order}')
+assert order == ['order', 'market0', 'market1', 'market2', 'market3', 'market4']
+
+# the api groups of an exchange that are listed in rateLimitBuckets do not wait for each other
+
+import ccxt  # noqa: E402
+
+exchange = ccxt.Exchange({
+    'id': 'test',
+    'rateLimit': 20,
+    'rateLimitBuckets': {
+        'futures': {
+            'apis': ['futuresPublic', 'futuresPrivate'],
+            'refillRate': 1 / 10,
+        },
+    },
+})
+assert exchange.get_api_throttles('public') == [exchange.throttle]
+assert exchange.calculate_rate_limiter_priority('public', 'GET', 'ticker', {}) == 0
+assert exchange.calculate_rate_limiter_priority('private', 'POST', 'order', {}) == 2
+assert exchange.calculate_rate_limiter_priority('private', 'DELETE', 'openOrders', {}) == 2
+assert exchange.calculate_rate_limiter_priority('private', 'GET', 'account', {}) == 1
+assert exchange.calculate_rate_limiter_priority(['sapi', 'v1'], 'POST', 'asset/transfer', {}) == 1
+assert exchange.calculate_rate_limiter_priority('fapiPublic', 'GET', 'depth', {}) == 0
+assert exchange.calculate_rate_limiter_priority('private', 'GET', 'balance', {}, {'priority': 'account'}) == 1
+assert exchange.calculate_rate_limiter_priority('public', 'GET', 'ticker', {'rateLimitPriority': 3}, {'priority': 'account'}) == 3
+assert exchange.get_api_throttles(['futuresPrivate', 'v2']) == [exchange.throttles['futures']]
+start = time.perf_counter_ns()
+for i in range(25):
+    exchange.throttle_api('public', 1)
+    exchange.throttle_api('futuresPublic', 1)
+    exchange.throttle_api('futuresPrivate', 1)
+elapsed_ms = (time.perf_counter_ns() - start) / 1000000
+# 25 runs of the default bucket, 50 of the futures one, whichever is slower
+expected = max((25 - 1) * 20, (50 - 1) * 10)
+print(f'buckets {elapsed_ms}ms expected {expected}ms')
+assert abs(expected - elapsed_ms) < delta
+
+# with adaptiveRateLimit the usage reported in the response headers lowers the tokens of the bucket
+
+exchange = ccxt.Exchange({
+    'id': 'test',
+    'rateLimit': 20,
+    'adaptiveRateLimit': True,
+    'tokenBucket': {
+        'headers': {
+            'x-used-weight': {'limit': 100, 'cost': 0.5},
+        },
+    },
+})
+exchange.rate_limit_responses[exchange.get_rate_limit_context()] = (200, {'X-Used-Weight': '102'})
+exchange.adapt_rate_limit('public')
+# 2 units over the limit and room for the next request
+assert abs(exchange.throttle.config['tokens'] - (-2 * 0.5 - 1)) < 0.01
+assert exchange.rate_limit_responses == {}
+exchange.rate_limit_responses[exchange.get_rate_limit_context()] = (429, {'Retry-After': '2'})
+exchange.adapt_rate_limit('public')
+# paused for 2 seconds
+assert abs(exchange.throttle.config['tokens'] - (-2000 / 20)) < 0.01
+
+# the processes that share a rateLimiterBackend consume a single budget
+
+import subprocess  # noqa: E402
+import tempfile  # noqa: E402
+from ccxt.base.rate_limiter import SharedMemoryBackend, SocketBackend, RateLimiterServer  # noqa: E402
+
+shared_snippet = '''
+import sys
+import time
+sys.path.insert(0, {root!r})
+from ccxt.base.rate_limiter import {backend}
+from ccxt.base.throttler import Throttler
+throttle = Throttler({{'tokens': 0, 'refillRate': 1 / 20, 'backend': {backend}({address!r}), 'key': 'test'}})
+for i in range(10):
+    throttle(1)
+    print(time.monotonic() * 1000)
+'''
+
+
+def run_shared(backend, address):
+    code = shared_snippet.format(root=root, backend=backend, address=address)
+    processes = [subprocess.Popen([sys.executable, '-c', code], stdout=subprocess.PIPE) for i in range(4)]
+    released = sorted(float(line) for process in processes for line in process.communicate()[0].split())
+    # the processes start at different times, so the releases can only be spread further apart
+    elapsed_ms = released[-1] - released[0]
+    expected = (len(released) - 1) * 20
+    print(f'{backend} {elapsed_ms}ms expected at least {expected}ms')
+    assert len(released) == 40 and elapsed_ms > expected - delta
+
+
+with tempfile.TemporaryDirectory() as directory:
+    run_shared('SharedMemoryBackend', os.path.join(directory, 'rate-limiter'))
+    server = RateLimiterServer(os.path.join(directory, 'rate-limiter.sock')).start()
+    run_shared('SocketBackend', server.address)
+    # a pause reported by the headers of one process delays the next request of all of them
+    config = {'tokens': 0, 'refillRate': 1 / 20, 'capacity': 1}
+    backend = SocketBackend(server.address)
+    backend.update_tokens('paused', -10, config)
+    assert abs(backend.reserve('paused', 1, config) - 200) < delta
+    server.shutdown()
+    backend = SharedMemoryBackend(os.path.join(directory, 'rate-limiter'))
+    backend.update_tokens('paused', -10, config)
+    assert abs(backend.reserve('paused', 1, config) - 200) < delta
+    backend.close()
@@ -276,7 +276,7 @@ class whitebit(Exchange):
         :param dict params: extra parameters specific to the exchange api endpoint
         :returns [dict]: an array of objects representing market data
         """
-        promises = [self.v4PublicGetCollateralMarkets(params), self.v2PublicGetMarkets(params)]
+        promises = [self.submit(self.v4PublicGetCollateralMarkets, params), self.submit(self.v2PublicGetMarkets, params)]
         #
         # Spot
         #
@@ -311,6 +311,7 @@ class whitebit(Exchange):
         #         ...
         #     ]
         #
+        promises = self.gather(promises)
         marginMarketsResponse = promises[0]
         response = promises[1]
         markets = self.safe_value(response, 'result', [])
@@ -577,7 +577,8 @@ class zb(Exchange):
         #         },
         #     }
         #
-        promises = [self.spotV1PublicGetMarkets(params), self.contractV2PublicGetConfigMarketList(params)]
+        promises = [self.submit(self.spotV1PublicGetMarkets, params), self.submit(self.contractV2PublicGetConfigMarketList, params)]
+        promises = self.gather(promises)
         markets = promises[0]
         contracts = promises[1]
         #